@@ -0,0 +1,235 @@
+'''
+************************* Benchmark of the Intra-Task WCRT ***********************
+* Author:       Muhammad Junaid Aslam
+* Contact:      junaidaslam1@gmail.com
+* ---------------------------------------------------------------------
+* This software is governed by the No license. You can use, modify    |
+* and redistribute the software under the condition of citing  	      |
+* or crediting the authors of this software in your work.             |
+* ---------------------------------------------------------------------
+*
+* This is part of a research project funded by the EWI EEMCS Group of
+* Technical University of Delft, Netherlands.
+**********************************************************************************
+'''
+'''
+This script compares GetMaxRPi of the response time analysis scripts, which keeps the tuples in an indexed
+frontier and checks Par_v and Desc with bitmasks, with the former list based implementation on wide DAG tasks.
+Both have to give the same Ikk_WCRT.
+
+python3 BenchmarkGetMaxRPi.py -r NNFJ -sh layered -wd 8,12,16 -dp 4
+'''
+#!/usr/bin/env python3
+import argparse
+import importlib.util
+import os
+import random
+import time
+from dag_reachability import UpdateReachability_of_EachVertex
+
+RTA_SCRIPTS = {"FP":"ResponseTimeAnalysisofTypedDAGTasksfor_G-FP_Scheduling.py", \
+				"NNFJ":"ResponseTimeAnalysisofTypedDAGTasksfor_G-FP_Scheduling_NNFJ.py"}
+
+def parse_args():
+	parser = argparse.ArgumentParser(description="Benchmark the intra-task WCRT (GetMaxRPi) on wide DAG tasks")
+
+	parser.add_argument('-r', '--rta', dest='rta', default='NNFJ',
+						action='store', type=str, choices=list(RTA_SCRIPTS.keys()),
+						help='The response time analysis script to benchmark')
+
+	parser.add_argument('-sh', '--shape', dest='shape', default='layered',
+						action='store', type=str, choices=["layered", "forkjoin"],
+						help='layered: Depth layers of Width vertices with random edges between consecutive layers, \
+						forkjoin: Width parallel branches of Depth vertices')
+
+	parser.add_argument('-wd', '--widths', dest='widths', default='8,12,16',
+						action='store', type=str,
+						help='Comma separated widths of the DAG tasks')
+
+	parser.add_argument('-dp', '--depth', dest='depth', default=4,
+						action='store', type=int,
+						help='The number of layers or the number of vertices on each parallel branch')
+
+	parser.add_argument('-ep', '--edge_probability', dest='edge_probability', default=0.3,
+						action='store', type=float,
+						help='The probability of an edge between two vertices of consecutive layers')
+
+	parser.add_argument('-rt', '--resource_types', dest='resource_types', default=2,
+						action='store', type=int,
+						help='The number of resource types')
+
+	parser.add_argument('-s', '--seed', dest='seed', default=1,
+						action='store', type=int,
+						help='The seed of the generated DAG tasks')
+
+	return parser.parse_args()
+
+def loadRTA(Name):
+	Path = os.path.join(os.path.dirname(os.path.abspath(__file__)), RTA_SCRIPTS[Name])
+	Spec = importlib.util.spec_from_file_location("rta_"+Name, Path)
+	RTA = importlib.util.module_from_spec(Spec)
+	Spec.loader.exec_module(RTA)
+	return RTA
+
+def AddEdge(Task, From, To):
+	Task.Nodes[From].Succ.append(To)
+	Task.Nodes[To].Pred.append(From)
+
+'''
+This creates a wide DAG task of Width*Depth vertices between a source and a sink vertex, either as Width parallel branches
+of Depth vertices or as Depth layers of Width vertices. In the layered shape every vertex gets its predecessors out of the
+previous layer with the given probability, which lets the number of non-dominated tuples per vertex grow.
+'''
+def CreateWideTask(RTA, Shape, Width, Depth, ResourceTypes, EdgeProbability):
+	Task = RTA.TaskData()
+	Task.Nodes = []
+
+	for JID in range(0, (Width*Depth)+2):
+		Node = RTA.NodeData()
+		Node.JID = JID
+		Node.WCET = random.randint(1, 100)
+		Node.BCET = Node.WCET
+		Node.ResourceType = random.randint(1, ResourceTypes)
+		Node.Pred = []
+		Node.Succ = []
+		Task.Nodes.append(Node)
+
+	Sink = len(Task.Nodes)-1
+
+	if Shape == "forkjoin":
+		for Branch in range(0, Width):
+			Previous = 0
+			for Level in range(0, Depth):
+				JID = 1 + (Branch*Depth) + Level
+				AddEdge(Task, Previous, JID)
+				Previous = JID
+			AddEdge(Task, Previous, Sink)
+	else:
+		Layers = [[0]] + [[1 + (Level*Width) + n for n in range(0, Width)] for Level in range(0, Depth)] + [[Sink]]
+		for Level in range(1, len(Layers)):
+			for JID in Layers[Level]:
+				Pred = [v for v in Layers[Level-1] if random.random() < EdgeProbability]
+				if len(Pred) == 0:
+					Pred = [random.choice(Layers[Level-1])]
+				for v in Pred:
+					AddEdge(Task, v, JID)
+			for v in Layers[Level-1]:
+				if len(Task.Nodes[v].Succ) == 0:
+					AddEdge(Task, v, random.choice(Layers[Level]))
+
+	UpdateReachability_of_EachVertex(Task.Nodes)
+
+	return Task
+
+# The former implementations of GetWCETSumPar_v, DeltaIntersection and If_Tuple_Already_Dominated on the Par_v and Desc lists
+def ListGetWCETSumPar_v(RTA, InputVertex, PredDelta, Cores_Per_RSC_Type):
+	WCET_SUM = 0.0
+
+	SelectedPar_v = []
+	ClosestNode = RTA.NodeData()
+
+	for n in reversed(range(len(PredDelta))):
+		if InputVertex.ResourceType == PredDelta[n].ResourceType:
+			PredDelta[n].Copy(ClosestNode)
+			break
+
+	for n in range(0, len(InputVertex.Par_v)):
+		Conflict = False
+		for m in range(0, len(ClosestNode.Par_v)):
+			if ClosestNode.Par_v[m].JID == InputVertex.Par_v[n].JID:
+				Conflict = True
+				break
+		if Conflict == False:
+			SelectedPar_v.append(InputVertex.Par_v[n])
+
+	for n in range(0, len(SelectedPar_v)):
+		WCET_SUM += float(SelectedPar_v[n].WCET/Cores_Per_RSC_Type[SelectedPar_v[n].ResourceType-1])
+
+	return WCET_SUM
+
+def ListDeltaIntersection(ExistingDelta, NewDelta):
+	for ed in range(0, len(ExistingDelta)):
+		for par_v in range(0, len(ExistingDelta[ed].Par_v)):
+			for nd in range(0, len(NewDelta)):
+				for desc in range(0, len(NewDelta[nd].Desc)):
+					if NewDelta[nd].Desc[desc].ResourceType == ExistingDelta[ed].ResourceType:
+						if NewDelta[nd].Desc[desc].JID == ExistingDelta[ed].Par_v[par_v].JID:
+							return True
+	return False
+
+def ListIf_Tuple_Already_Dominated(iTuple_t, TupleSet):
+	for Tuple in range(0, len(TupleSet)):
+		if TupleSet[Tuple].vertex.JID == iTuple_t.vertex.JID:
+			if TupleSet[Tuple].ResponseTime >= iTuple_t.ResponseTime:
+				if len(TupleSet[Tuple].Delta) == 0:
+					return True
+				elif (len(TupleSet[Tuple].Delta) != 0) and (len(iTuple_t.Delta) != 0) and (ListDeltaIntersection(TupleSet[Tuple].Delta, iTuple_t.Delta) == False):
+					return True
+	return False
+
+# The former implementation of GetMaxRPi, which scans the whole list of tuples for every new tuple
+def ListGetMaxRPi(RTA, RSC_Type, Cores_Per_RSC_Type, TaskInfo):
+	MaxRPi = 0
+	TupleSet = []
+
+	iTuple = RTA.VertexTuple()
+	iTuple.vertex 		= TaskInfo.Nodes[0]
+	iTuple.Delta.append(TaskInfo.Nodes[0])
+	iTuple.ResponseTime = TaskInfo.Nodes[0].WCET
+	TupleSet.append(iTuple)
+
+	SinkJID = TaskInfo.Nodes[len(TaskInfo.Nodes)-1].JID
+
+	while (len(TupleSet) > 0) and (len(list(filter(lambda Tuple:(Tuple.vertex.JID != SinkJID), TupleSet))) > 0):
+
+		ParentIDs = []
+
+		for Tuple in range(0, len(TupleSet)):
+			if len(TupleSet[Tuple].vertex.Succ) > 0:
+				ParentIDs.append(TupleSet[Tuple].vertex.JID)
+			for successor in range(0, len(TupleSet[Tuple].vertex.Succ)):
+				iTuple_t = RTA.VertexTuple()
+				iTuple_t.vertex = TaskInfo.Nodes[TupleSet[Tuple].vertex.Succ[successor]]
+				iTuple_t.Delta = RTA.GetPathDelta(iTuple_t.vertex, TupleSet[Tuple].Delta, RSC_Type)
+				iTuple_t.ResponseTime = TupleSet[Tuple].ResponseTime + iTuple_t.vertex.WCET + ListGetWCETSumPar_v(RTA, iTuple_t.vertex, TupleSet[Tuple].Delta, Cores_Per_RSC_Type)
+				if ListIf_Tuple_Already_Dominated(iTuple_t, TupleSet) == False:
+					TupleSet.append(iTuple_t)
+
+		for m in range(0, len(ParentIDs)):
+			for n in range(0, len(TupleSet)):
+				if ParentIDs[m] == TupleSet[n].vertex.JID:
+					TupleSet.remove(TupleSet[n])
+					break
+
+	for Tuple in range(0, len(TupleSet)):
+		if TupleSet[Tuple].ResponseTime > MaxRPi:
+			MaxRPi = TupleSet[Tuple].ResponseTime
+
+	return MaxRPi
+
+def main():
+	opts = parse_args()
+	random.seed(opts.seed)
+
+	RTA = loadRTA(opts.rta)
+	Cores_Per_RSC_Type = [random.randint(1, 4) for RSC in range(0, opts.resource_types)]
+
+	print("%8s %8s %12s %12s %9s %14s"%("Width", "Vertices", "List(s)", "Frontier(s)", "Speedup", "Ikk_WCRT"))
+
+	for Width in [int(w) for w in opts.widths.split(',')]:
+		Task = CreateWideTask(RTA, opts.shape, Width, opts.depth, opts.resource_types, opts.edge_probability)
+
+		Start = time.perf_counter()
+		ListWCRT = ListGetMaxRPi(RTA, opts.resource_types, Cores_Per_RSC_Type, Task)
+		ListTime = time.perf_counter() - Start
+
+		Start = time.perf_counter()
+		FrontierWCRT = RTA.GetMaxRPi(opts.resource_types, Cores_Per_RSC_Type, Task)
+		FrontierTime = time.perf_counter() - Start
+
+		assert ListWCRT == FrontierWCRT # both implementations have to give the same Ikk_WCRT
+
+		print("%8d %8d %12.3f %12.3f %8.1fx %14s"%(Width, len(Task.Nodes), ListTime, FrontierTime, ListTime/max(FrontierTime, 1e-9), str(FrontierWCRT)))
+
+if __name__ == '__main__':
+	main()
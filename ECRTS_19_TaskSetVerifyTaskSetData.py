@@ -18,11 +18,12 @@ import subprocess
 import argparse
 import time
 from math import ceil, floor, log10
-import csv
 import os
 import copy
 from fractions import gcd
 from functools import reduce
+from dag_reachability import UpdateReachability_of_EachVertex
+from dag_task_set import ReadTaskSetFile, getTaskSetInfo
 
 RSC0_COLOR = "blue"
 RSC1_COLOR = "black"
@@ -157,7 +158,6 @@ class TaskData:
 		self.Deadline 	= 	0
 		self.CRP_WCET 	=	0
 		self.Nodes 		= 	[]
-		self.AllPaths 	= 	[]
 		self.CRP 		= 	[]
 
 	def DisplayData(self):
@@ -170,7 +170,6 @@ class TaskData:
 		self.Deadline 	= 	0
 		self.CRP_WCET 	=	0
 		self.Nodes.clear()
-		self.AllPaths.clear() 
 		self.CRP.clear()
 
 	def Copy(self, inTask):
@@ -180,7 +179,6 @@ class TaskData:
 		inTask.Deadline 	= self.Deadline
 		inTask.CRP_WCET 	= self.CRP_WCET
 		inTask.Nodes 		= self.Nodes.copy()
-		inTask.AllPaths		= self.AllPaths.copy()
 		inTask.CRP 			= self.CRP.copy()
 
 def PrintTaskSetData(RSC_Type, Cores_Per_RSC_Type, TaskSetInfo, PrintFull=False):
@@ -213,78 +211,6 @@ def PrintTaskSetData(RSC_Type, Cores_Per_RSC_Type, TaskSetInfo, PrintFull=False)
 def get_hyper_period(numbers):
 	return reduce(lambda x, y: (x*y)/gcd(x,y), numbers, 1) 
 
-def UpdateSuccessors(TaskSetInfo):
-	for n in range(0, len(TaskSetInfo)):
-		for m in range(0, len(TaskSetInfo[n].Nodes)):			
-			for p in range(0, len(TaskSetInfo[n].Nodes[m].Pred)):
-				TaskSetInfo[n].Nodes[TaskSetInfo[n].Nodes[m].Pred[p]].Succ.clear()
-
-	for n in range(0, len(TaskSetInfo)):
-		for m in range(0, len(TaskSetInfo[n].Nodes)):			
-			for p in range(0, len(TaskSetInfo[n].Nodes[m].Pred)):
-				TaskSetInfo[n].Nodes[TaskSetInfo[n].Nodes[m].Pred[p]].Succ.append(TaskSetInfo[n].Nodes[m].JID)
-
-def getAllPaths(Nodes, InputNode, outAllPaths, AllPaths): 
-	AllPaths.append(InputNode)
-	if len(InputNode.Succ) > 0:
-		for m in range(0, len(InputNode.Succ)):
-			getAllPaths(Nodes, Nodes[InputNode.Succ[m]], outAllPaths, AllPaths)
-			for n in range(0, len(AllPaths)):                
-				if AllPaths[n].JID == Nodes[InputNode.Succ[m]].JID:
-					del AllPaths[n:]                        
-					break
-	else:
-		Skip = True
-		for n in range(0, len(AllPaths) - 1):            
-			Skip = True
-			for m in range(0, len(AllPaths[n].Succ)):
-				if (AllPaths[n].Succ[m] == AllPaths[n+1].JID):
-					Skip = False
-					break
-		if Skip == False:
-			newPath = AllPaths.copy()
-			outAllPaths.append(newPath)
-		
-
-def getCriticalPaths_wrt_WCET(inAllPaths):
-	WCET = 0
-	CriticalPaths = []
-
-	WCET_SUM = 0
-	
-	if (len(inAllPaths) > 0):
-		for n in range(0, len(inAllPaths[0])):
-			WCET_SUM += inAllPaths[0][n].WCET
-		WCET = WCET_SUM
-		CriticalPaths.append(inAllPaths[0])    
-		WCET_SUM = 0
-
-		for n in range(1, len(inAllPaths)):
-			for m in range(0, len(inAllPaths[n])):
-				WCET_SUM += inAllPaths[n][m].WCET
-			if (WCET < WCET_SUM):
-				WCET = WCET_SUM
-				CriticalPaths.clear()
-				CriticalPaths.append(inAllPaths[n])
-				WCET_SUM = 0
-			elif (WCET == WCET_SUM):
-				CriticalPaths.append(inAllPaths[n])            
-				WCET_SUM = 0
-			else:
-				WCET_SUM = 0
-
-	return CriticalPaths, WCET
-
-def getTaskCriticalPathInfo(TaskNodes, Print=False):
-	outAllPaths = []
-	AllPaths = []
-	getAllPaths(TaskNodes, TaskNodes[0], outAllPaths, AllPaths)
-	if Print == True:
-		for p in range(0, len(outAllPaths)):
-			PrintList(outAllPaths[p], True)
-	CRP, CRP_WCET = getCriticalPaths_wrt_WCET(outAllPaths)
-	return (CRP, CRP_WCET, outAllPaths)
-
 def addLegendtoGraph(fp, CriticalPaths_WCET):
 
 	if CriticalPaths_WCET > 0:
@@ -405,25 +331,10 @@ def VertexID_in_List(JID, List):
 	return False
 
 def UpdateAncestors_of_EachVertex(TaskInfo, Print=False):
-	for vertex in range(0, len(TaskInfo.Nodes)):
-		TaskInfo.Nodes[vertex].Ancs.clear()
-		CommonPaths = []
-		for path in range(0, len(TaskInfo.AllPaths)):
-			# print("VTX:%d UAEV:%d = %s"%(TaskInfo.Nodes[vertex].JID, path+1, PrintList(TaskInfo.AllPaths[path])))
-			if (Vertex_in_List(TaskInfo.Nodes[vertex], TaskInfo.AllPaths[path]) == True):
-				CommonPaths.append(TaskInfo.AllPaths[path])			
-				# print("VTX:%d CP = %s"%(TaskInfo.Nodes[vertex].JID, PrintList(CommonPaths[len(CommonPaths)-1])))
-
-		for path in range(0, len(CommonPaths)):		
-			for uVertex in range(0, len(CommonPaths[path])):
-				if CommonPaths[path][uVertex].JID < TaskInfo.Nodes[vertex].JID:
-					if (Vertex_in_List(CommonPaths[path][uVertex], TaskInfo.Nodes[vertex].Ancs) == False):
-						TaskInfo.Nodes[vertex].Ancs.append(CommonPaths[path][uVertex])
-		CommonPaths.clear()
-
-		TaskInfo.Nodes[vertex].Ancs.sort(key=lambda v:v.JID)
-
-		if Print == True:
+	UpdateReachability_of_EachVertex(TaskInfo.Nodes, Par_v=False, Desc=False)
+
+	if Print == True:
+		for vertex in range(0, len(TaskInfo.Nodes)):
 			PrintVertex_Ancs(TaskInfo.Nodes[vertex], True)
 
 def ExtractTaskSetData(FileName, scale=ms2us):
@@ -434,95 +345,16 @@ def ExtractTaskSetData(FileName, scale=ms2us):
 	'''
 	global RSC_Type
 	global Cores_Per_RSC_Type
-	TaskSetInfo = []
-	FP = open(FileName, 'r')
-	data = csv.reader(FP, skipinitialspace=True)
-	FirstEntryFound = False
-	TotalJobsPerHyperPeriod = 0
 
-	Task = TaskData()
-
-	for row in data:
-		if row[0] == 'R':
-			RSC_Type = int(row[1])
-		elif row[0] == 'M':
-			cores = int(row[1])
-			Cores_Per_RSC_Type.append(cores) 
-		elif row[0] == '#':
-			continue
-		elif row[0] == 'T':
-			if FirstEntryFound == True:				
-				lvTask = TaskData()
-				Task.Copy(lvTask)
-				TaskSetInfo.append(lvTask)
-				Task.ClearData()
-			else:
-				FirstEntryFound = True
-			# parse new task declaration
-			# A ’T’ row consists of the following columns:
-			# 	1) ’T’
-			# 	2) a unique numeric ID
-			# 	3) the period (in milliseconds, fractional is ok)
-			# 	4) the relative deadline        
-			Task.TID = int(row[1])
-			Task.Period  = scale(float(row[2]))
-			Task.Deadline = scale(float(row[3]))
-			Task.Priority  = Task.Deadline
-			
-			if Task.Priority == int(row[3]):
-				Task.Priority = scale(Task.Priority)
-			
-
-			assert Task.TID >= 0
-			assert Task.Period > 0
-			assert Task.Deadline > 0
-
-		elif row[0] == 'V':
-			Node = NodeData()
-			# parse vertex information
-			# A ‘V’ row consists for the following columns (unbounded number):
-			# 	1) ‘V’
-			# 	2) task ID to which it belongs
-			# 	3) a numeric vertex ID (unique w.r.t. its task)
-			# 	4) earliest release time r^min (relative to start of period, may be zero)
-			# 	5) latest release time r^max (relative to start of period)
-			# 	6) BCET
-			# 	7) WCET
-			#   8) ResourceType
-			# 	9) first predecessor (vertex ID), if any
-			# 	10) second predecessor (vertex ID), if any
-			# 	11) third predecessor (vertex ID), if any
-			# 	… and so on …  
-			Node.TID = int(row[1]) - 1
-			Node.JID = int(row[2]) - 1
-			Node.r_min = scale(float(row[3]))
-			Node.r_max = scale(float(row[4]))
-			Node.BCET  = scale(float(row[5]))
-			Node.WCET  = scale(float(row[6]))
-			Node.ResourceType  = 1
-			Node.Pred = [int(Node.Pred) for Node.Pred in row[7:] if Node.Pred != '']
-			
-			for n in range(0, len(Node.Pred)):
-				Node.Pred[n] = Node.Pred[n] - 1
-
-			assert 0 <= Node.r_min <= Node.r_max
-			assert 0 <= Node.BCET <= Node.WCET
-			assert Node.JID >= 0
-			assert Node.TID >= 0
-
-			Task.Nodes.append(Node)
-		else:
-			print(row)
-			assert False # badly formatted input???
-	
-	TaskSetInfo.append(Task)
+	# The vertices of the ECRTS_19 task sets have no resource type column
+	lvTaskSet = ReadTaskSetFile(FileName, scale, ResourceTypeColumn=False)
+	RSC_Type = lvTaskSet.RSC_Type
+	Cores_Per_RSC_Type.extend(lvTaskSet.Cores)
 
-	UpdateSuccessors(TaskSetInfo)
+	TaskSetInfo = getTaskSetInfo(lvTaskSet, TaskData, NodeData)
 
-	Periods = []
 	for n in range(0, len(TaskSetInfo)):
-		TaskSetInfo[n].CRP, TaskSetInfo[n].CRP_WCET, TaskSetInfo[n].AllPaths = getTaskCriticalPathInfo(TaskSetInfo[n].Nodes)
-		Periods.append(TaskSetInfo[n].Period)
+		TaskSetInfo[n].Priority = TaskSetInfo[n].Deadline
 		UpdateAncestors_of_EachVertex(TaskSetInfo[n])
 		if WANT_GRAPH == True:
 			createTaskGraphFile(TaskSetInfo[n].Nodes, n+1, TaskSetInfo[n].CRP, TaskSetInfo[n].CRP_WCET, FileName)
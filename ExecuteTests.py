@@ -19,6 +19,7 @@ import sys
 import os
 import threading
 import argparse
+from dag_tasks_to_jobs import job_set_binary_to_csv, JOB_SET_BINARY_EXT
 
 EMAIL_ID = ""
 NR_OF_REQUESTED_NODES = "NA"
@@ -426,6 +427,14 @@ def DispatchTests(directory, nptest):
 
 		for Files in range(0, len(fileList)):
 
+			# nptest reads CSV, so a binary job set file is converted first unless its CSV files are present as well
+			if fileList[Files].endswith(JOB_SET_BINARY_EXT):
+				lvCSVFileName = fileList[Files][:-len(JOB_SET_BINARY_EXT)]+".csv"
+				if lvCSVFileName in fileList:
+					continue
+				job_set_binary_to_csv(directory+"/"+fileList[Files], directory+"/"+lvCSVFileName, directory+"/"+getPredecessorName(lvCSVFileName))
+				fileList[Files] = lvCSVFileName
+
 			if ("Jobs" in fileList[Files]) and ("NOT_FEASIBLE" not in fileList[Files]) and ("JobResult_" not in fileList[Files]) and ("Report" not in fileList[Files]) and ("TasksetSettings" not in fileList[Files]) and ("Results" not in fileList[Files]) and (".png" not in fileList[Files]):
 				
 				counter += 1
@@ -22,11 +22,17 @@ import subprocess
 import argparse
 import time
 from math import ceil, floor, log10
-import csv
 import os
 import copy
+import multiprocessing
+import contextlib
+import io
+import heapq
+import numpy as np
 from fractions import gcd
 from functools import reduce
+from dag_reachability import UpdateReachability_of_EachVertex, AncestorIndex
+from dag_task_set import ReadTaskSetFile, getTaskSetInfo, getCriticalPathInfo
 
 MS_TO_US = 1000
 TASK_SET_FILE = "Null"
@@ -41,6 +47,7 @@ Cores_Per_RSC_Type = []
 
 REMOVE = None
 SINGLE_DAG_ANALYSIS = None
+JOBS = 0
 
 def NUM_TO_STR(num):
 	if num == SE:
@@ -71,6 +78,11 @@ def parse_args():
 						const=True, required=False,
 						help='This option enables analysis of single DAG in the directory of workloads')
 
+	parser.add_argument('-j', '--jobs', dest='jobs', default=0, 
+						action='store', type=int, metavar="JOBS",
+						required=False,
+						help='Analyze the task set files with a pool of JOBS processes, by default they are analyzed one after the other')
+
 	return parser.parse_args()
 
 def run_command(incommand):
@@ -104,6 +116,8 @@ class NodeData:
 		self.Par_v 			= []
 		self.Desc 			= []
 		self.Ancs 			= []
+		self.Par_vMask 		= 0
+		self.DescMask 		= 0
 
 	def Copy(self, CopyTo):
 		CopyTo.TID 			= 	self.TID
@@ -118,6 +132,8 @@ class NodeData:
 		CopyTo.Par_v 		=	self.Par_v.copy()
 		CopyTo.Desc 		=	self.Desc.copy()
 		CopyTo.Ancs 		=	self.Ancs.copy()
+		CopyTo.Par_vMask 	=	self.Par_vMask
+		CopyTo.DescMask 	=	self.DescMask
 
 	def DisplayData(self):
 		print("T%dJ%d BCET:%d WCET:%d RSC:%d Deadline:%d Pred:"%(self.TID, self.JID, self.BCET, self.WCET, self.ResourceType, self.Deadline, self.Pred))
@@ -130,13 +146,16 @@ class TaskData:
 		self.Deadline 	= 	0
 		self.CRP_WCET 	=	0
 		self.VOL_G 		=	0
-		self.TreeRoot	= 	0
+		self.Tree		= 	0
 		self.Ikk_WCRT	=	0
 		self.WCRT		=	0
 		self.Nodes 		= 	[]
-		self.AllPaths 	= 	[]
 		self.CRP 		= 	[]
 		self.ID_Blocks	=	[]
+		self.ID_Block_Widths	=	np.zeros(0)
+		self.ID_Block_Heights	=	np.zeros(0)
+		self.ID_Block_Offsets	=	np.zeros(0)
+		self.Min_Job_Exec_Time	=	0
 
 	def DisplayData(self):
 		print("T%d Period:%d Deadline:%d Number_of_Nodes:%d"%(self.TID, self.Period, self.Deadline, len(self.Nodes)))
@@ -151,9 +170,12 @@ class TaskData:
 		self.Ikk_WCRT	=	0
 		self.WCRT		=	0
 		self.Nodes.clear()
-		self.AllPaths.clear() 
 		self.CRP.clear()
 		self.ID_Blocks.clear()
+		self.ID_Block_Widths	=	np.zeros(0)
+		self.ID_Block_Heights	=	np.zeros(0)
+		self.ID_Block_Offsets	=	np.zeros(0)
+		self.Min_Job_Exec_Time	=	0
 
 	def Copy(self, inTask):
 		inTask.TID 			= self.TID
@@ -165,9 +187,12 @@ class TaskData:
 		inTask.Ikk_WCRT		= self.Ikk_WCRT
 		inTask.WCRT 		= self.WCRT
 		inTask.Nodes 		= self.Nodes.copy()
-		inTask.AllPaths		= self.AllPaths.copy()
 		inTask.CRP 			= self.CRP.copy()
 		inTask.ID_Blocks	= self.ID_Blocks.copy()
+		inTask.ID_Block_Widths	= self.ID_Block_Widths.copy()
+		inTask.ID_Block_Heights	= self.ID_Block_Heights.copy()
+		inTask.ID_Block_Offsets	= self.ID_Block_Offsets.copy()
+		inTask.Min_Job_Exec_Time	= self.Min_Job_Exec_Time
 
 class VertexTuple:
 	def __init__(self):
@@ -175,101 +200,128 @@ class VertexTuple:
 		self.Delta = []
 		self.ResponseTime = 0
 
-class TreeNode: 
-	def __init__(self, key): 
-		self.key = key
-		self.left = None
-		self.right = None
+class DecompositionTree:
+	'''
+	The binary decomposition tree of an NFJ DAG task kept in parallel arrays indexed by its tree nodes, so that it is built
+	and traversed without recursion. Series (SE) and parallel (PA) nodes are the inner nodes and the leaves hold the JIDs of
+	the vertices. Each node counts the alive leaves of its subtree: a removed leaf invalidates the nodes above it by
+	decrementing their counts, and a node is alive as long as its count is not 0.
+	'''
+	def __init__(self):
+		self.Root 			= -1
+		self.Key 			= []
+		self.Left 			= []
+		self.Right 			= []
+		self.Parent 		= []
+		self.AliveLeaves 	= []
+		self.KeyCount 		= {}
+
+	def newNode(self, Key, Left=-1, Right=-1):
+		n = len(self.Key)
+		self.Key.append(Key)
+		self.Left.append(-1)
+		self.Right.append(-1)
+		self.Parent.append(-1)
+		self.AliveLeaves.append(0)
+		self.KeyCount[Key] = self.KeyCount.get(Key, 0) + 1
+		if self.IsLeaf(n) == True:
+			self.AliveLeaves[n] = 1
+		if Left != -1:
+			self.setLeft(n, Left)
+		if Right != -1:
+			self.setRight(n, Right)
+		return n
+
+	def setLeft(self, n, Child):
+		self.Left[n] = Child
+		self.Parent[Child] = n
+		self.UpdateAliveLeaves(n, self.AliveLeaves[Child])
+
+	def setRight(self, n, Child):
+		self.Right[n] = Child
+		self.Parent[Child] = n
+		self.UpdateAliveLeaves(n, self.AliveLeaves[Child])
+
+	def UpdateAliveLeaves(self, n, Change):
+		while (n != -1) and (Change != 0):
+			self.AliveLeaves[n] += Change
+			n = self.Parent[n]
+
+	def IsLeaf(self, n):
+		return (self.Key[n] != SE) and (self.Key[n] != PA)
+
+	def IsAlive(self, n):
+		return (n != -1) and (self.AliveLeaves[n] > 0)
+
+	# The keys of all nodes are counted, so this answers the former search of a vertex ID in the tree
+	def Contains(self, Key):
+		return self.KeyCount.get(Key, 0) > 0
+
+	def RemoveLeaf(self, n):
+		self.UpdateAliveLeaves(n, -self.AliveLeaves[n])
+
+	def getPreorder(self, Root):
+		Order = []
+		Stack = [Root]
+		while len(Stack) > 0:
+			n = Stack.pop()
+			if n == -1:
+				continue
+			Order.append(n)
+			Stack.append(self.Right[n])
+			Stack.append(self.Left[n])
+		return Order
+
+	def getLabel(self, n):
+		key = None
+		if self.IsAlive(n) == True:
+			key = NUM_TO_STR(self.Key[n])
+		if key != 'SE' and key != 'PA' and key != None:
+			return 'J%s' % key
+		return '%s' % key
 
 	def display(self):
-		lines, _, _, _ = self._display_aux()
+		lines, _, _, _ = self._display_aux(self.Root)
 		for line in lines:
 			print(line)
 
-	def _display_aux(self):
+	def _display_aux(self, Root):
 		"""Returns list of strings, width, height, and horizontal coordinate of the root."""
-		# No child.
-		try:
-			if self.right is None and self.left is None:
-				# if self.key != None:
-				key = NUM_TO_STR(self.key)
-				if key != 'SE' and key != 'PA' and key != None:
-					line = 'J%s' % key
-				else:
-					line = '%s' % key
-				width = len(line)
-				height = 1
-				middle = width // 2
-				return [line], width, height, middle
-		except NameError:
-			pass
-
-		try:
+		Aux = {}
+		for Node in reversed(self.getPreorder(Root)):
+			s = self.getLabel(Node)
+			u = len(s)
+			# No child.
+			if self.Left[Node] == -1 and self.Right[Node] == -1:
+				Aux[Node] = [s], u, 1, u // 2
 			# Only left child.
-			if self.right is None:
-				if self.left != None:
-					lines, n, p, x = self.left._display_aux()
-				# if self.key != None:
-				key = NUM_TO_STR(self.key)
-				if key != 'SE' and key != 'PA' and key != None:
-					s = 'J%s' % key
-				else:
-					s = '%s' % key
-				# s = 'J%s' % NUM_TO_STR(self.key)
-				u = len(s)
+			elif self.Right[Node] == -1:
+				lines, n, p, x = Aux[self.Left[Node]]
 				first_line = (x + 1) * ' ' + (n - x - 1) * '_' + s
 				second_line = x * ' ' + '/' + (n - x - 1 + u) * ' '
 				shifted_lines = [line + u * ' ' for line in lines]
-				return [first_line, second_line] + shifted_lines, n + u, p + 2, n + u // 2
-		except NameError:
-			pass
-
-
-		try:
+				Aux[Node] = [first_line, second_line] + shifted_lines, n + u, p + 2, n + u // 2
 			# Only right child.
-			if self.left is None:
-				if self.right != None:
-					lines, n, p, x = self.right._display_aux()
-				# if self.key != None:
-				key = NUM_TO_STR(self.key)
-				if key != 'SE' and key != 'PA' and key != None:
-					s = 'J%s' % key
-				else:
-					s = '%s' % key
-				# s = 'J%s' % NUM_TO_STR(self.key)
-				u = len(s)
+			elif self.Left[Node] == -1:
+				lines, n, p, x = Aux[self.Right[Node]]
 				first_line = s + x * '_' + (n - x) * ' '
 				second_line = (u + x) * ' ' + '\\' + (n - x - 1) * ' '
 				shifted_lines = [u * ' ' + line for line in lines]
-				return [first_line, second_line] + shifted_lines, n + u, p + 2, u // 2
-		except NameError:
-			pass
-
-		try:
+				Aux[Node] = [first_line, second_line] + shifted_lines, n + u, p + 2, u // 2
 			# Two children.
-			if (self.left != None):
-				left, n, p, x = self.left._display_aux()
-			if (self.right != None):
-				right, m, q, y = self.right._display_aux()
-			# if self.key != None:
-			key = NUM_TO_STR(self.key)
-			if key != 'SE' and key != 'PA' and key != None:
-				s = 'J%s' % key
 			else:
-				s = '%s' % key
-
-			u = len(s)
-			first_line = (x + 1) * ' ' + (n - x - 1) * '_' + s + y * '_' + (m - y) * ' '
-			second_line = x * ' ' + '/' + (n - x - 1 + u + y) * ' ' + '\\' + (m - y - 1) * ' '
-			if p < q:
-				left += [n * ' '] * (q - p)
-			elif q < p:
-				right += [m * ' '] * (p - q)
-			zipped_lines = zip(left, right)
-			lines = [first_line, second_line] + [a + u * ' ' + b for a, b in zipped_lines]
-			return lines, n + m + u, max(p, q) + 2, n + u // 2
-		except NameError:
-			pass
+				left, n, p, x = Aux[self.Left[Node]]
+				right, m, q, y = Aux[self.Right[Node]]
+				first_line = (x + 1) * ' ' + (n - x - 1) * '_' + s + y * '_' + (m - y) * ' '
+				second_line = x * ' ' + '/' + (n - x - 1 + u + y) * ' ' + '\\' + (m - y - 1) * ' '
+				if p < q:
+					left = left + [n * ' '] * (q - p)
+				elif q < p:
+					right = right + [m * ' '] * (p - q)
+				zipped_lines = zip(left, right)
+				lines = [first_line, second_line] + [a + u * ' ' + b for a, b in zipped_lines]
+				Aux[Node] = lines, n + m + u, max(p, q) + 2, n + u // 2
+		return Aux[Root]
 
 class ID_Block:
 	def __init__(self):
@@ -378,154 +430,11 @@ def PrintTuple(iTuple_t, PredTuple):
 def get_hyper_period(numbers):
 	return reduce(lambda x, y: (x*y)/gcd(x,y), numbers, 1) 
 
-def UpdateSuccessors(TaskSetInfo):
-	for n in range(0, len(TaskSetInfo)):
-		for m in range(0, len(TaskSetInfo[n].Nodes)):			
-			for p in range(0, len(TaskSetInfo[n].Nodes[m].Pred)):
-				TaskSetInfo[n].Nodes[TaskSetInfo[n].Nodes[m].Pred[p]].Succ.clear()
-
-	for n in range(0, len(TaskSetInfo)):
-		for m in range(0, len(TaskSetInfo[n].Nodes)):			
-			for p in range(0, len(TaskSetInfo[n].Nodes[m].Pred)):
-				TaskSetInfo[n].Nodes[TaskSetInfo[n].Nodes[m].Pred[p]].Succ.append(TaskSetInfo[n].Nodes[m].JID)
-
-def getAllPaths(Nodes, InputNode, outAllPaths, AllPaths):    
-	AllPaths.append(InputNode)
-	if len(InputNode.Succ) > 0:
-		for m in range(0, len(InputNode.Succ)):
-			getAllPaths(Nodes, Nodes[InputNode.Succ[m]], outAllPaths, AllPaths)
-			for n in range(0, len(AllPaths)):                
-				if AllPaths[n].JID == Nodes[InputNode.Succ[m]].JID:
-					del AllPaths[n:]                        
-					break
-	else:
-		Skip = True
-		for n in range(0, len(AllPaths) - 1):            
-			Skip = True
-			for m in range(0, len(AllPaths[n].Succ)):
-				if (AllPaths[n].Succ[m] == AllPaths[n+1].JID):
-					Skip = False
-					break
-		if Skip == False:
-			newPath = AllPaths.copy()
-			outAllPaths.append(newPath)
-		
-
-def getCriticalPaths_wrt_WCET(inAllPaths):
-	WCET = 0
-	CriticalPaths = []
-
-	WCET_SUM = 0
-	
-	for n in range(0, len(inAllPaths[0])):
-		WCET_SUM += inAllPaths[0][n].WCET
-	WCET = WCET_SUM
-	CriticalPaths.append(inAllPaths[0])    
-	WCET_SUM = 0
-
-	for n in range(1, len(inAllPaths)):
-		for m in range(0, len(inAllPaths[n])):
-			WCET_SUM += inAllPaths[n][m].WCET
-		if (WCET < WCET_SUM):
-			WCET = WCET_SUM
-			CriticalPaths.clear()
-			CriticalPaths.append(inAllPaths[n])
-			WCET_SUM = 0
-		elif (WCET == WCET_SUM):
-			CriticalPaths.append(inAllPaths[n])            
-			WCET_SUM = 0
-		else:
-			WCET_SUM = 0
-
-	return CriticalPaths, WCET
+def UpdateAncestors_of_EachVertex(TaskInfo, Print=False):
+	UpdateReachability_of_EachVertex(TaskInfo.Nodes, Par_v=False, Desc=False)
 
-def getTaskCriticalPathInfo(TaskNodes, Print=False):
-	outAllPaths = []
-	AllPaths = []
-	getAllPaths(TaskNodes, TaskNodes[0], outAllPaths, AllPaths)
 	if Print == True:
-		for p in range(0, len(outAllPaths)):
-			PrintList(outAllPaths[p], True)
-	CRP, CRP_WCET = getCriticalPaths_wrt_WCET(outAllPaths)
-	return (CRP, CRP_WCET, outAllPaths)
-
-def Vertex_in_List(vertex, List):
-	for n in range(0, len(List)):
-		if vertex.JID == List[n].JID:
-			return True
-	return False
-
-def UpdateParallelVertices_of_EachVertex(TaskInfo):
-	for vertex in range(0, len(TaskInfo.Nodes)):
-		TaskInfo.Nodes[vertex].Par_v.clear()
-		CommonPaths = []
-		UncommonPaths = []
-
-		for path in range(0, len(TaskInfo.AllPaths)):
-			if (Vertex_in_List(TaskInfo.Nodes[vertex], TaskInfo.AllPaths[path]) == False):
-				UncommonPaths.append(TaskInfo.AllPaths[path])
-				# PrintVertexPathRelation(TaskInfo.Nodes[vertex], TaskInfo.AllPaths[path], False)
-			else:
-				CommonPaths.append(TaskInfo.AllPaths[path])
-				# PrintVertexPathRelation(TaskInfo.Nodes[vertex], TaskInfo.AllPaths[path], True)
-
-		for uPath in range(0, len(UncommonPaths)):
-			for uVertex in range(0, len(UncommonPaths[uPath])):
-				if (UncommonPaths[uPath][uVertex].ResourceType == TaskInfo.Nodes[vertex].ResourceType):
-					SkipVertex = False
-					for cPath in range(0, len(CommonPaths)):
-						for cVertex in range(0, len(CommonPaths[cPath])):
-							if ((UncommonPaths[uPath][uVertex].JID == CommonPaths[cPath][cVertex].JID) == True):
-								SkipVertex = True
-								break
-						if SkipVertex == True:
-							break
-					if SkipVertex == False:
-						if (Vertex_in_List(UncommonPaths[uPath][uVertex], TaskInfo.Nodes[vertex].Par_v) == False):
-							TaskInfo.Nodes[vertex].Par_v.append(UncommonPaths[uPath][uVertex])
-		
-		CommonPaths.clear()
-		UncommonPaths.clear()	
-		# PrintVertex_Par_v(TaskInfo.Nodes[vertex], True)
-		TaskInfo.Nodes[vertex].Par_v.sort(key=lambda v:v.JID)
-
-def UpdateDescendants_of_EachVertex(TaskInfo):
-	for vertex in range(0, len(TaskInfo.Nodes)):
-		TaskInfo.Nodes[vertex].Desc.clear()	
-		CommonPaths = []
-		for path in range(0, len(TaskInfo.AllPaths)):
-			if (Vertex_in_List(TaskInfo.Nodes[vertex], TaskInfo.AllPaths[path]) == True):
-				CommonPaths.append(TaskInfo.AllPaths[path])
-						
-		for path in range(0, len(CommonPaths)):		
-			for uVertex in range(0, len(CommonPaths[path])):
-				if CommonPaths[path][uVertex].JID > TaskInfo.Nodes[vertex].JID:
-					if (Vertex_in_List(CommonPaths[path][uVertex], TaskInfo.Nodes[vertex].Desc) == False):
-						TaskInfo.Nodes[vertex].Desc.append(CommonPaths[path][uVertex])
-		CommonPaths.clear()
-		TaskInfo.Nodes[vertex].Desc.sort(key=lambda v:v.JID)
-		# PrintVertex_Desc(TaskInfo.Nodes[vertex], True)
-
-def UpdateAncestors_of_EachVertex(TaskInfo, Print=False):
-	for vertex in range(0, len(TaskInfo.Nodes)):
-		TaskInfo.Nodes[vertex].Ancs.clear()
-		CommonPaths = []
-		for path in range(0, len(TaskInfo.AllPaths)):
-			# print("VTX:%d UAEV:%d = %s"%(TaskInfo.Nodes[vertex].JID, path+1, PrintList(TaskInfo.AllPaths[path])))
-			if (Vertex_in_List(TaskInfo.Nodes[vertex], TaskInfo.AllPaths[path]) == True):
-				CommonPaths.append(TaskInfo.AllPaths[path])			
-				# print("VTX:%d CP = %s"%(TaskInfo.Nodes[vertex].JID, PrintList(CommonPaths[len(CommonPaths)-1])))
-
-		for path in range(0, len(CommonPaths)):		
-			for uVertex in range(0, len(CommonPaths[path])):
-				if CommonPaths[path][uVertex].JID < TaskInfo.Nodes[vertex].JID:
-					if (Vertex_in_List(CommonPaths[path][uVertex], TaskInfo.Nodes[vertex].Ancs) == False):
-						TaskInfo.Nodes[vertex].Ancs.append(CommonPaths[path][uVertex])
-		CommonPaths.clear()
-
-		TaskInfo.Nodes[vertex].Ancs.sort(key=lambda v:v.JID)
-
-		if Print == True:
+		for vertex in range(0, len(TaskInfo.Nodes)):
 			PrintVertex_Ancs(TaskInfo.Nodes[vertex], True)
 
 def UpdateVol_G(TaskInfo):
@@ -534,21 +443,22 @@ def UpdateVol_G(TaskInfo):
 		VOL_G += TaskInfo.Nodes[vertex].WCET
 	TaskInfo.VOL_G = VOL_G
 	
+# The volume of each resource type is summed up in one pass over the vertices
 def get_Min_Job_Exec_Time(TaskInfo):
 	Body_Job_Exec_Time = 0
 
+	VOL_s_G = [0] * RSC_Type
+	for v in range(0, len(TaskInfo.Nodes)):
+		if 1 <= TaskInfo.Nodes[v].ResourceType <= RSC_Type:
+			VOL_s_G[TaskInfo.Nodes[v].ResourceType-1] += TaskInfo.Nodes[v].WCET
+
 	for RSC in range(0, RSC_Type):
-		VOL_s_G = 0
-		for v in range(0, len(TaskInfo.Nodes)):
-			if TaskInfo.Nodes[v].ResourceType == RSC+1:
-				VOL_s_G += TaskInfo.Nodes[v].WCET
-	
-		Body_Job_Exec_Time += (VOL_s_G/Cores_Per_RSC_Type[RSC])
+		Body_Job_Exec_Time += (VOL_s_G[RSC]/Cores_Per_RSC_Type[RSC])
 
 	return Body_Job_Exec_Time	
 
 def getBodyJobInt(Nr_Of_Body_Jobs, TaskInfo):
-	return (Nr_Of_Body_Jobs*get_Min_Job_Exec_Time(TaskInfo))
+	return (Nr_Of_Body_Jobs*TaskInfo.Min_Job_Exec_Time)
 
 def getTotalJobsPerHyperPeriod(TaskSetInfo):
 	TotalJobsPerHyperPeriod = 0
@@ -570,135 +480,47 @@ def ExtractTaskSetData(FileName, scale=ms2us):
 	the lists of predecessors and successors with respect to the Job IDs. Final results
 	can be reported for each vertex by increasing the JIDs and TIDs by 1 again.
 	'''
-	RSC_Type = 0
 	Cores_Per_RSC_Type = {}
-	TaskSetInfo = []
-	counter = 0
-	FP = open(FileName, 'r')
-	data = csv.reader(FP, skipinitialspace=True)
-	FirstEntryFound = False
-	TotalJobsPerHyperPeriod = 0
-
-	Task = TaskData()
-
-	for row in data:
-		if row[0] == 'R':
-			RSC_Type = int(row[1])
-		elif row[0] == 'M':
-			cores = int(row[1])
-			Cores_Per_RSC_Type[counter] = cores
-			counter = counter + 1
-		elif row[0] == '#':
-			continue
-		elif row[0] == 'T':
-			if FirstEntryFound == True:				
-				lvTask = TaskData()
-				Task.Copy(lvTask)
-				TaskSetInfo.append(lvTask)
-				Task.ClearData()
-			else:
-				FirstEntryFound = True
-			# parse new task declaration
-			# A ’T’ row consists of the following columns:
-			# 	1) ’T’
-			# 	2) a unique numeric ID
-			# 	3) the period (in milliseconds, fractional is ok)
-			# 	4) the relative deadline        
-			Task.TID = int(row[1])
-			Task.Period  = scale(float(row[2]))
-			Task.Deadline = scale(float(row[3]))
-			Task.Priority  = int(row[4])
-			
-			if Task.Priority == int(row[3]):
-				Task.Priority = scale(Task.Priority)
-			
-
-			assert Task.TID >= 0
-			assert Task.Period > 0
-			assert Task.Deadline > 0
-
-		elif row[0] == 'V':
-			Node = NodeData()
-			# parse vertex information
-			# A ‘V’ row consists for the following columns (unbounded number):
-			# 	1) ‘V’
-			# 	2) task ID to which it belongs
-			# 	3) a numeric vertex ID (unique w.r.t. its task)
-			# 	4) earliest release time r^min (relative to start of period, may be zero)
-			# 	5) latest release time r^max (relative to start of period)
-			# 	6) BCET
-			# 	7) WCET
-			#   8) ResourceType
-			# 	9) first predecessor (vertex ID), if any
-			# 	10) second predecessor (vertex ID), if any
-			# 	11) third predecessor (vertex ID), if any
-			# 	… and so on …  
-			Node.TID = int(row[1]) - 1
-			Node.JID = int(row[2]) - 1
-			Node.r_min = scale(float(row[3]))
-			Node.r_max = scale(float(row[4]))
-			Node.BCET  = scale(float(row[5]))
-			Node.WCET  = scale(float(row[6]))
-			Node.ResourceType  = (int(row[7]))
-			Node.Pred = [int(Node.Pred) for Node.Pred in row[8:] if Node.Pred != '']
-			
-			for n in range(0, len(Node.Pred)):
-				Node.Pred[n] = Node.Pred[n] - 1
-
-			assert 0 <= Node.r_min <= Node.r_max
-			assert 0 <= Node.BCET <= Node.WCET
-			assert Node.JID >= 0
-			assert Node.TID >= 0
 
-			Task.Nodes.append(Node)
-		else:
-			print(row)
-			assert False # badly formatted input???
-	
-	TaskSetInfo.append(Task)
+	lvTaskSet = ReadTaskSetFile(FileName, scale)
+	for counter in range(0, len(lvTaskSet.Cores)):
+		Cores_Per_RSC_Type[counter] = lvTaskSet.Cores[counter]
 
-	UpdateSuccessors(TaskSetInfo)
-
-	Periods = []
-	for n in range(0, len(TaskSetInfo)):
-		TaskSetInfo[n].CRP, TaskSetInfo[n].CRP_WCET, TaskSetInfo[n].AllPaths = getTaskCriticalPathInfo(TaskSetInfo[n].Nodes)
-		Periods.append(TaskSetInfo[n].Period)
+	TaskSetInfo = getTaskSetInfo(lvTaskSet, TaskData, NodeData)
 
 	TotalJobsPerHyperPeriod = getTotalJobsPerHyperPeriod(TaskSetInfo)
 
 	for Task in range(0, len(TaskSetInfo)):
-		UpdateParallelVertices_of_EachVertex(TaskSetInfo[Task])
-		UpdateDescendants_of_EachVertex(TaskSetInfo[Task])
-		UpdateAncestors_of_EachVertex(TaskSetInfo[Task])
+		UpdateReachability_of_EachVertex(TaskSetInfo[Task].Nodes)
 		UpdateVol_G(TaskSetInfo[Task])
 
 	TaskSetInfo.sort(key=lambda v:v.Priority)
 	
-	return (RSC_Type, Cores_Per_RSC_Type, TaskSetInfo, TotalJobsPerHyperPeriod)
+	return (lvTaskSet.RSC_Type, Cores_Per_RSC_Type, TaskSetInfo, TotalJobsPerHyperPeriod)
+
+# The share of each vertex in the interference of its parallel vertices, indexed by JID
+def getPar_vWeights(TaskInfo, Cores_Per_RSC_Type):
+	return [float(Node.WCET/Cores_Per_RSC_Type[Node.ResourceType-1]) for Node in TaskInfo.Nodes]
 
-def GetWCETSumPar_v(InputVertex, PredDelta, Cores_Per_RSC_Type):
+def GetWCETSumPar_v(InputVertex, PredDelta, Par_vWeights):
+	'''
+	Sums up the weights of the Par_v of the vertex which are not in the Par_v of the closest
+	vertex of the same resource type on the path, in the order of their JIDs as in Par_v
+	'''
 	WCET_SUM = 0.0
 
-	SelectedPar_v = []
-	ClosestNode = NodeData()
+	SelectedPar_v = InputVertex.Par_vMask
 
 	for n in reversed(range(len(PredDelta))):
 		if InputVertex.ResourceType == PredDelta[n].ResourceType:
-			PredDelta[n].Copy(ClosestNode)
-			# print("Vertex:%d ClosestNode:%d"%(InputVertex.JID, ClosestNode.JID))
+			SelectedPar_v &= ~PredDelta[n].Par_vMask
+			# print("Vertex:%d ClosestNode:%d"%(InputVertex.JID, PredDelta[n].JID))
 			break
 
-	for n in range(0, len(InputVertex.Par_v)):
-		Conflict = False
-		for m in range(0, len(ClosestNode.Par_v)):
-			if ClosestNode.Par_v[m].JID == InputVertex.Par_v[n].JID:
-				Conflict = True
-				break
-		if Conflict == False:
-			SelectedPar_v.append(InputVertex.Par_v[n])
-
-	for n in range(0, len(SelectedPar_v)):
-		WCET_SUM += float(SelectedPar_v[n].WCET/Cores_Per_RSC_Type[SelectedPar_v[n].ResourceType-1])
+	while SelectedPar_v != 0:
+		lvBit = SelectedPar_v & (-SelectedPar_v)
+		WCET_SUM += Par_vWeights[lvBit.bit_length() - 1]
+		SelectedPar_v ^= lvBit
 
 	return WCET_SUM
 
@@ -718,28 +540,22 @@ def GetPathDelta(vertex, PredDelta, RSC_Type):
 
 	return Delta
 
-def RemoveTuples(TupleSet, ParentIDs):
-	for m in range(0, len(ParentIDs)):
-		for n in range(0, len(TupleSet)):
-			if ParentIDs[m] == TupleSet[n].vertex.JID:
-				# print("Removing Tuple:%d"%TupleSet[n].vertex.JID)
-				TupleSet.remove(TupleSet[n])
-				break
-
 def DeltaIntersection(ExistingDelta, NewDelta):
 	'''
 	If any Par_v of any vertex of ExistingDelta matches descendants 
-	of any vertex of NewDelta then return True else False
+	of any vertex of NewDelta then return True else False.
+	The Par_v of a vertex are of its own resource type, so a match is
+	of the same resource type and the masks can be merged per Delta.
 	'''
+	Par_vMask = 0
 	for ed in range(0, len(ExistingDelta)):
-		for par_v in range(0, len(ExistingDelta[ed].Par_v)):
-			for nd in range(0, len(NewDelta)):
-				for desc in range(0, len(NewDelta[nd].Desc)):
-					if NewDelta[nd].Desc[desc].ResourceType == ExistingDelta[ed].ResourceType:
-						if NewDelta[nd].Desc[desc].JID == ExistingDelta[ed].Par_v[par_v].JID:						
-							# print("DeltaIntersection Found")
-							return True 
-	return False
+		Par_vMask |= ExistingDelta[ed].Par_vMask
+
+	DescMask = 0
+	for nd in range(0, len(NewDelta)):
+		DescMask |= NewDelta[nd].DescMask
+
+	return (Par_vMask & DescMask) != 0
 
 def If_Tuple_Already_Dominated(iTuple_t, TupleSet, RSC_Type):
 	for Tuple in range(0, len(TupleSet)):
@@ -753,43 +569,73 @@ def If_Tuple_Already_Dominated(iTuple_t, TupleSet, RSC_Type):
 					return True
 	return False
 
-def All_Tuples_are_Sink_Nodes(TupleSet, TaskInfo):
-	Result = list(filter(lambda Tuple:(Tuple.vertex.JID != TaskInfo.Nodes[len(TaskInfo.Nodes)-1].JID), TupleSet))
-	if len(Result) > 0:
-		return False
-	return True
+class TupleFrontier:
+	'''
+	The tuples of GetMaxRPi in the order of their creation, indexed by their vertices. A new tuple
+	competes only with the tuples of its own vertex, so these are looked up instead of scanning all
+	tuples. The number of tuples which are not at the sink vertex is maintained along the way.
+	'''
+	def __init__(self, TaskInfo):
+		self.Tuples 		= []
+		self.VertexTuples 	= {}
+		self.SinkJID 		= TaskInfo.Nodes[len(TaskInfo.Nodes)-1].JID
+		self.NonSinkTuples 	= 0
+
+	def Append(self, Tuple):
+		self.Tuples.append(Tuple)
+		self.VertexTuples.setdefault(Tuple.vertex.JID, []).append(Tuple)
+		if Tuple.vertex.JID != self.SinkJID:
+			self.NonSinkTuples += 1
+
+	def getCompetingTuples(self, vertex):
+		return self.VertexTuples.get(vertex.JID, [])
+
+	# The expanded parents are removed at once after a round of expansions
+	def RemoveTuples(self, Parents):
+		lvRemoved = set(id(Tuple) for Tuple in Parents)
+
+		self.Tuples = [Tuple for Tuple in self.Tuples if id(Tuple) not in lvRemoved]
+		for JID in set(Tuple.vertex.JID for Tuple in Parents):
+			self.VertexTuples[JID] = [Tuple for Tuple in self.VertexTuples[JID] if id(Tuple) not in lvRemoved]
+
+		for Tuple in Parents:
+			if Tuple.vertex.JID != self.SinkJID:
+				self.NonSinkTuples -= 1
 
 def GetMaxRPi(RSC_Type, Cores_Per_RSC_Type, TaskInfo):
 	MaxRPi = 0
-	TupleSet = []
+	Frontier = TupleFrontier(TaskInfo)
+	Par_vWeights = getPar_vWeights(TaskInfo, Cores_Per_RSC_Type)
 
 	iTuple = VertexTuple()
 	iTuple.vertex 		= TaskInfo.Nodes[0]
 	iTuple.Delta.append(TaskInfo.Nodes[0])
 	iTuple.ResponseTime = TaskInfo.Nodes[0].WCET
-	TupleSet.append(iTuple)
+	Frontier.Append(iTuple)
 
-	while (len(TupleSet) > 0) and (All_Tuples_are_Sink_Nodes(TupleSet, TaskInfo) == False):
+	while (len(Frontier.Tuples) > 0) and (Frontier.NonSinkTuples > 0):
 
-		ParentIDs = []
+		Parents = []
 		
-		for Tuple in range(0, len(TupleSet)):
-			if len(TupleSet[Tuple].vertex.Succ) > 0:
-				ParentIDs.append(TupleSet[Tuple].vertex.JID)
-			for successor in range(0, len(TupleSet[Tuple].vertex.Succ)):
+		# Only the tuples present at the start of a round are expanded in it
+		for Tuple in range(0, len(Frontier.Tuples)):
+			lvParent = Frontier.Tuples[Tuple]
+			if len(lvParent.vertex.Succ) > 0:
+				Parents.append(lvParent)
+			for successor in range(0, len(lvParent.vertex.Succ)):
 				iTuple_t = VertexTuple()
-				iTuple_t.vertex = TaskInfo.Nodes[TupleSet[Tuple].vertex.Succ[successor]]
-				iTuple_t.Delta = GetPathDelta(iTuple_t.vertex, TupleSet[Tuple].Delta, RSC_Type)
-				iTuple_t.ResponseTime = TupleSet[Tuple].ResponseTime + iTuple_t.vertex.WCET + GetWCETSumPar_v(iTuple_t.vertex, TupleSet[Tuple].Delta, Cores_Per_RSC_Type)
-				if If_Tuple_Already_Dominated(iTuple_t, TupleSet, RSC_Type) == False:
-					TupleSet.append(iTuple_t)
-				# PrintTuple(iTuple_t, TupleSet[Tuple])
+				iTuple_t.vertex = TaskInfo.Nodes[lvParent.vertex.Succ[successor]]
+				iTuple_t.Delta = GetPathDelta(iTuple_t.vertex, lvParent.Delta, RSC_Type)
+				iTuple_t.ResponseTime = lvParent.ResponseTime + iTuple_t.vertex.WCET + GetWCETSumPar_v(iTuple_t.vertex, lvParent.Delta, Par_vWeights)
+				if If_Tuple_Already_Dominated(iTuple_t, Frontier.getCompetingTuples(iTuple_t.vertex), RSC_Type) == False:
+					Frontier.Append(iTuple_t)
+				# PrintTuple(iTuple_t, lvParent)
 			
-		RemoveTuples(TupleSet, ParentIDs)
+		Frontier.RemoveTuples(Parents)
 
-	for Tuple in range(0, len(TupleSet)):
-		if TupleSet[Tuple].ResponseTime > MaxRPi:
-			MaxRPi = TupleSet[Tuple].ResponseTime
+	for Tuple in range(0, len(Frontier.Tuples)):
+		if Frontier.Tuples[Tuple].ResponseTime > MaxRPi:
+			MaxRPi = Frontier.Tuples[Tuple].ResponseTime
 
 	return MaxRPi 
 
@@ -798,8 +644,15 @@ def UpdateIntraTaskResponseTimes(RSC_Type, Cores_Per_RSC_Type, TaskSetInfo):
 		TaskSetInfo[TaskInfo].Ikk_WCRT	=	GetMaxRPi(RSC_Type, Cores_Per_RSC_Type, TaskSetInfo[TaskInfo])
 		TaskSetInfo[TaskInfo].WCRT 		=	TaskSetInfo[TaskInfo].Ikk_WCRT
 		
+'''
+The conflicting edges are removed through an AncestorIndex over the Pred and Succ lists of the nodes, which keeps the
+ancestor masks of the vertices up to date. The critical paths and the Ancs lists are updated once all edges are removed.
+'''
 def Convert_to_NFJ_DAG(TaskInfo, CriticalPaths):
 	cNodes = TaskInfo.Nodes
+	Index = AncestorIndex([Node.Pred for Node in cNodes], [Node.Succ for Node in cNodes], cNodes[0].JID if len(cNodes) > 0 else 0)
+	EdgesRemoved = False
+
 	for vertex in range(0, len(cNodes)):
 		lvPredLen = len(cNodes[vertex].Pred)
 		# print("Vertex:%d lv_Predlength:%d"%(cNodes[vertex].JID, lvPredLen))
@@ -816,17 +669,14 @@ def Convert_to_NFJ_DAG(TaskInfo, CriticalPaths):
 
 				for succ in range(0, len(lvPredVertex.Succ)):
 					if (lvPredVertex.Succ[succ] != cNodes[vertex].JID) \
-					and (Vertex_in_List(cNodes[lvPredVertex.Succ[succ]], cNodes[vertex].Ancs) == False):
+					and (Index.IsAncestor(lvPredVertex.Succ[succ], vertex) == False):
 						ConflictingEdge = True
 						break
 
 				if (ConflictingEdge == True):
 						# print("1 Removing connection between J%d <--> J%d"%(cNodes[vertex].JID, cNodes[vertex].Pred[pred]))
-						cNodes[cNodes[vertex].Pred[pred]].Succ.remove(cNodes[vertex].JID)
-						cNodes[vertex].Pred.remove(cNodes[vertex].Pred[pred])
-						# Update Necessary Task Information
-						TaskInfo.CRP, TaskInfo.CRP_WCET, TaskInfo.AllPaths = getTaskCriticalPathInfo(TaskInfo.Nodes)
-						UpdateAncestors_of_EachVertex(TaskInfo)
+						Index.RemoveEdge(cNodes[vertex].Pred[pred], cNodes[vertex].JID)
+						EdgesRemoved = True
 						PredLen = PredLen - 1
 						if(PredLen == 1):
 							break
@@ -836,11 +686,8 @@ def Convert_to_NFJ_DAG(TaskInfo, CriticalPaths):
 					for p in reversed(range(lvPredLen)):
 						if cNodes[vertex].Pred[p] in lvPredVertex.Pred:
 							# print("2 Removed connection between J%d <--> J%d"%(cNodes[vertex].JID, cNodes[vertex].Pred[p]))							
-							cNodes[cNodes[vertex].Pred[p]].Succ.remove(cNodes[vertex].JID)
-							cNodes[vertex].Pred.remove(cNodes[vertex].Pred[p])
-							# Update Necessary Task Information
-							TaskInfo.CRP, TaskInfo.CRP_WCET, TaskInfo.AllPaths = getTaskCriticalPathInfo(TaskInfo.Nodes)							
-							UpdateAncestors_of_EachVertex(TaskInfo)
+							Index.RemoveEdge(cNodes[vertex].Pred[p], cNodes[vertex].JID)
+							EdgesRemoved = True
 							lvPredLen = lvPredLen - 1
 							PredLen = PredLen - 1
 							if(PredLen == 1):
@@ -849,13 +696,10 @@ def Convert_to_NFJ_DAG(TaskInfo, CriticalPaths):
 				if PredLen > 1:
 					for n in reversed(range(PredLen)):
 						for vtx in reversed(range(PredLen)):
-							if (Vertex_in_List(cNodes[cNodes[vertex].Pred[n]], cNodes[cNodes[vertex].Pred[vtx]].Ancs) == True):
+							if (Index.IsAncestor(cNodes[vertex].Pred[n], cNodes[vertex].Pred[vtx]) == True):
 								# print("ConflictingEdge:J%d <---> J%d"%(cNodes[cNodes[vertex].Pred[n]].JID, cNodes[vertex].JID))
-								cNodes[cNodes[vertex].Pred[n]].Succ.remove(cNodes[vertex].JID)
-								cNodes[vertex].Pred.remove(cNodes[vertex].Pred[n])
-								# Update Necessary Task Information
-								TaskInfo.CRP, TaskInfo.CRP_WCET, TaskInfo.AllPaths = getTaskCriticalPathInfo(cNodes)
-								UpdateAncestors_of_EachVertex(TaskInfo)
+								Index.RemoveEdge(cNodes[vertex].Pred[n], cNodes[vertex].JID)
+								EdgesRemoved = True
 								PredLen = PredLen - 1
 								if(PredLen == 1):
 									break
@@ -866,6 +710,11 @@ def Convert_to_NFJ_DAG(TaskInfo, CriticalPaths):
 				if(PredLen == 1):
 					break
 
+	# Update Necessary Task Information
+	if EdgesRemoved == True:
+		TaskInfo.CRP, TaskInfo.CRP_WCET = getCriticalPathInfo(cNodes, WantPaths=True)
+		UpdateAncestors_of_EachVertex(TaskInfo)
+
 
 def getNFJ_DAG_TaskInfo(TaskSetInfo):
 	NFJ_DAG_TaskSetInfo = []
@@ -877,25 +726,6 @@ def getNFJ_DAG_TaskInfo(TaskSetInfo):
 	# PrintTaskSetData(RSC_Type, Cores_Per_RSC_Type, Converted_TaskSetInfo, True)
 	return Converted_TaskSetInfo
 
-def newTreeNode(ID, left=0, right=0):
-	Tree_Node = TreeNode(ID)
-	if left != 0:
-		Tree_Node.left = left
-	if right !=0:
-		Tree_Node.right = right
-	return Tree_Node
-
-def Is_Already_in_Binary_Tree(VertexID, TreeRoot):
-	# print("Search:%d vs %s"%(VertexID, NUM_TO_STR(TreeRoot.key)))
-	if TreeRoot.key == VertexID:
-		return True
-	if (TreeRoot.left != None) and (Is_Already_in_Binary_Tree(VertexID, TreeRoot.left)==True):
-		return True
-	if (TreeRoot.right != None) and (Is_Already_in_Binary_Tree(VertexID, TreeRoot.right)==True):
-		return True
-
-	return False
-
 def isJoinNodeCommonForSuccessors(TaskInfo, VTX):
 	Nodes = TaskInfo.Nodes
 
@@ -920,152 +750,161 @@ def isJoinCommonForMultipleVTX(VTX=[]):
 	return True
 
 # We can have Parallel_Plain (PA_P), Parallel_Not_Plain (PA_NP), and Series (SE) type next Nodes
-def UpdateTaskDecompositionTree(TreeRoot, TaskInfo, RootNode, VTX = [], VTX_Type = "PA_NP"):
-	# print(">>> Type:%s Num_Vertices:%d First_Input_VTX_ID:%d"%(VTX_Type, len(VTX), VTX[0].JID))
-	Nodes = TaskInfo.Nodes
+# The former recursion is unrolled on a stack of calls, which are taken in the same depth-first order
+def UpdateTaskDecompositionTree(Tree, TaskInfo, RootNode, VTX = [], VTX_Type = "PA_NP"):
+	Calls = [(RootNode, VTX, VTX_Type)]
+
+	while len(Calls) > 0:
+		RootNode, VTX, VTX_Type = Calls.pop()
+		Next = []
 
-	if (VTX_Type == "PA_P") and (len(VTX) == 2):
-		RootNode.left  = newTreeNode(VTX[0].JID)
-		RootNode.right = newTreeNode(VTX[1].JID)
-
-	elif (VTX_Type == "PA_P") and (len(VTX) > 2):
-		RootNode.left  = newTreeNode(VTX[0].JID)
-		# print("PA_P RootNode.left:%d Remaining:%d"%(VTX[0].JID, len(VTX)-1))
-		VTX.pop(0)
-		RootNode.right = newTreeNode(PA)
-		UpdateTaskDecompositionTree(TreeRoot, TaskInfo, RootNode.right, VTX, "PA_P")
-
-	elif (VTX_Type == "PA_NP") and len(VTX) == 2:
-		# print("Two Parallel Nodes with no common join VTX")
-		if (Is_Already_in_Binary_Tree(VTX[0].Succ[0], TreeRoot) == True) and (Is_Already_in_Binary_Tree(VTX[1].Succ[0], TreeRoot) == True):
-			RootNode.left = newTreeNode(VTX[0].JID)
-			RootNode.right = newTreeNode(VTX[1].JID)
-		elif Is_Already_in_Binary_Tree(VTX[0].Succ[0], TreeRoot) == True:
-			RootNode.left = newTreeNode(VTX[0].JID)
+		# print(">>> Type:%s Num_Vertices:%d First_Input_VTX_ID:%d"%(VTX_Type, len(VTX), VTX[0].JID))
+		Nodes = TaskInfo.Nodes
+
+		if (VTX_Type == "PA_P") and (len(VTX) == 2):
+			Tree.setLeft(RootNode, Tree.newNode(VTX[0].JID))
+			Tree.setRight(RootNode, Tree.newNode(VTX[1].JID))
+
+		elif (VTX_Type == "PA_P") and (len(VTX) > 2):
+			Tree.setLeft(RootNode, Tree.newNode(VTX[0].JID))
+			# print("PA_P RootNode.left:%d Remaining:%d"%(VTX[0].JID, len(VTX)-1))
 			VTX.pop(0)
-			RootNode.right = newTreeNode(SE)
-			UpdateTaskDecompositionTree(TreeRoot, TaskInfo, RootNode.right, VTX, "SE")
-		elif Is_Already_in_Binary_Tree(VTX[1].Succ[0], TreeRoot) == True:
-			RootNode.left = newTreeNode(VTX[1].JID)
-			VTX.pop(1)
-			RootNode.right = newTreeNode(SE)
-			UpdateTaskDecompositionTree(TreeRoot, TaskInfo, RootNode.right, VTX, "SE")
-		else:
-			if (VTX[0].Succ[0] == Nodes[VTX[1].Succ[0]].Succ[0]):
-				RootNode.left = newTreeNode(SE)
-				RootNode.right = newTreeNode(SE)
-				lvVTX1 = []
-				lvVTX1.append(VTX[0])
+			Tree.setRight(RootNode, Tree.newNode(PA))
+			Next.append((Tree.Right[RootNode], VTX, "PA_P"))
+
+		elif (VTX_Type == "PA_NP") and len(VTX) == 2:
+			# print("Two Parallel Nodes with no common join VTX")
+			if (Tree.Contains(VTX[0].Succ[0]) == True) and (Tree.Contains(VTX[1].Succ[0]) == True):
+				Tree.setLeft(RootNode, Tree.newNode(VTX[0].JID))
+				Tree.setRight(RootNode, Tree.newNode(VTX[1].JID))
+			elif Tree.Contains(VTX[0].Succ[0]) == True:
+				Tree.setLeft(RootNode, Tree.newNode(VTX[0].JID))
 				VTX.pop(0)
-				UpdateTaskDecompositionTree(TreeRoot, TaskInfo, RootNode.left, lvVTX1, "SE")
-				UpdateTaskDecompositionTree(TreeRoot, TaskInfo, RootNode.right, VTX, "SE")
-			elif (VTX[1].Succ[0] == Nodes[VTX[0].Succ[0]].Succ[0]):
-				RootNode.left = newTreeNode(SE)
-				RootNode.right = newTreeNode(SE)
-				lvVTX1 = []
-				lvVTX1.append(VTX[0])
-				VTX.pop(0)
-				UpdateTaskDecompositionTree(TreeRoot, TaskInfo, RootNode.left, VTX, "SE")
-				UpdateTaskDecompositionTree(TreeRoot, TaskInfo, RootNode.right, lvVTX1, "SE")
+				Tree.setRight(RootNode, Tree.newNode(SE))
+				Next.append((Tree.Right[RootNode], VTX, "SE"))
+			elif Tree.Contains(VTX[1].Succ[0]) == True:
+				Tree.setLeft(RootNode, Tree.newNode(VTX[1].JID))
+				VTX.pop(1)
+				Tree.setRight(RootNode, Tree.newNode(SE))
+				Next.append((Tree.Right[RootNode], VTX, "SE"))
 			else:
-				RootNode.left = newTreeNode(SE)
-				RootNode.right = newTreeNode(SE)
-				lvVTX1 = []
-				lvVTX1.append(VTX[0])
-				VTX.pop(0)
-				UpdateTaskDecompositionTree(TreeRoot, TaskInfo, RootNode.left, lvVTX1, "SE")
-				UpdateTaskDecompositionTree(TreeRoot, TaskInfo, RootNode.right, VTX, "SE")
-
-	elif (VTX_Type == "PA_NP") and len(VTX) > 2:
-		Found_Leaf = False
-		for v in range(0, len(VTX)):
-			if Is_Already_in_Binary_Tree(VTX[v].Succ[0], TreeRoot) == True:
-				RootNode.left = newTreeNode(VTX[v].JID)
-				# print("Found Leaf:%d Remaining VXTs:%d"%(VTX[v].JID, len(VTX)-1))
-				VTX.pop(v)
-				Found_Leaf = True
-				break
-		if Found_Leaf:			
-			# PrintList(VTX, True)
-			if len(VTX) >= 2 and (isJoinCommonForMultipleVTX(VTX) == False):
-				# print("NO Common Join for remaining VTXs")
-				RootNode.right = newTreeNode(PA)
-				UpdateTaskDecompositionTree(TreeRoot, TaskInfo, RootNode.right, VTX, "PA_NP")
-			elif len(VTX) >= 2 and (isJoinCommonForMultipleVTX(VTX) == True) and (Is_Already_in_Binary_Tree(VTX[0].Succ[0], TreeRoot)==False):
-				# print("Yes Common Join %d not in tree"%VTX[0].Succ[0])
-				if Is_Already_in_Binary_Tree(Nodes[VTX[0].Succ[0]].Succ[0], TreeRoot) == True: 
-					RootNode.right = newTreeNode(SE, newTreeNode(PA), newTreeNode(VTX[0].Succ[0]))
-					UpdateTaskDecompositionTree(TreeRoot, TaskInfo, RootNode.right.left, VTX, "PA_P")
+				if (VTX[0].Succ[0] == Nodes[VTX[1].Succ[0]].Succ[0]):
+					Tree.setLeft(RootNode, Tree.newNode(SE))
+					Tree.setRight(RootNode, Tree.newNode(SE))
+					lvVTX1 = []
+					lvVTX1.append(VTX[0])
+					VTX.pop(0)
+					Next.append((Tree.Left[RootNode], lvVTX1, "SE"))
+					Next.append((Tree.Right[RootNode], VTX, "SE"))
+				elif (VTX[1].Succ[0] == Nodes[VTX[0].Succ[0]].Succ[0]):
+					Tree.setLeft(RootNode, Tree.newNode(SE))
+					Tree.setRight(RootNode, Tree.newNode(SE))
+					lvVTX1 = []
+					lvVTX1.append(VTX[0])
+					VTX.pop(0)
+					Next.append((Tree.Left[RootNode], VTX, "SE"))
+					Next.append((Tree.Right[RootNode], lvVTX1, "SE"))
 				else:
-					RootNode.right = newTreeNode(SE, newTreeNode(PA), newTreeNode(SE))
-					UpdateTaskDecompositionTree(TreeRoot, TaskInfo, RootNode.right.left, VTX, "PA_P")
+					Tree.setLeft(RootNode, Tree.newNode(SE))
+					Tree.setRight(RootNode, Tree.newNode(SE))
 					lvVTX1 = []
-					lvVTX1.append(Nodes[VTX[0].Succ[0]])
-					UpdateTaskDecompositionTree(TreeRoot, TaskInfo, RootNode.right.right, lvVTX1, "SE")
-			elif len(VTX) >= 2 and (isJoinCommonForMultipleVTX(VTX) == True) and (Is_Already_in_Binary_Tree(VTX[0].Succ[0], TreeRoot)==True):
-				# print("Yes Common Join %d is in tree"%VTX[0].Succ[0])
-				RootNode.right = newTreeNode(PA)
-				UpdateTaskDecompositionTree(TreeRoot, TaskInfo, RootNode.right, VTX, "PA_P")
-			elif len(VTX) == 1:
-				RootNode.right = newTreeNode(SE)
-				UpdateTaskDecompositionTree(TreeRoot, TaskInfo, RootNode.right, VTX, "SE")
-		else:
-			RootNode.right = newTreeNode(SE)
-			lvVTX = []
-			lvVTX.append(VTX[0])
-			# print("Created Series Nodes with the first:%d "%VTX[0].JID)
-			UpdateTaskDecompositionTree(TreeRoot, TaskInfo, RootNode.right, lvVTX, "SE")
-			VTX.pop(0)
-			RootNode.left = newTreeNode(PA)
-			# print("Created PA_NP Nodes with the first:%d "%VTX[0].JID)
-			UpdateTaskDecompositionTree(TreeRoot, TaskInfo, RootNode.left, VTX, "PA_NP")
+					lvVTX1.append(VTX[0])
+					VTX.pop(0)
+					Next.append((Tree.Left[RootNode], lvVTX1, "SE"))
+					Next.append((Tree.Right[RootNode], VTX, "SE"))
+
+		elif (VTX_Type == "PA_NP") and len(VTX) > 2:
+			Found_Leaf = False
+			for v in range(0, len(VTX)):
+				if Tree.Contains(VTX[v].Succ[0]) == True:
+					Tree.setLeft(RootNode, Tree.newNode(VTX[v].JID))
+					# print("Found Leaf:%d Remaining VXTs:%d"%(VTX[v].JID, len(VTX)-1))
+					VTX.pop(v)
+					Found_Leaf = True
+					break
+			if Found_Leaf:			
+				# PrintList(VTX, True)
+				if len(VTX) >= 2 and (isJoinCommonForMultipleVTX(VTX) == False):
+					# print("NO Common Join for remaining VTXs")
+					Tree.setRight(RootNode, Tree.newNode(PA))
+					Next.append((Tree.Right[RootNode], VTX, "PA_NP"))
+				elif len(VTX) >= 2 and (isJoinCommonForMultipleVTX(VTX) == True) and (Tree.Contains(VTX[0].Succ[0])==False):
+					# print("Yes Common Join %d not in tree"%VTX[0].Succ[0])
+					if Tree.Contains(Nodes[VTX[0].Succ[0]].Succ[0]) == True: 
+						Tree.setRight(RootNode, Tree.newNode(SE, Tree.newNode(PA), Tree.newNode(VTX[0].Succ[0])))
+						Next.append((Tree.Left[Tree.Right[RootNode]], VTX, "PA_P"))
+					else:
+						Tree.setRight(RootNode, Tree.newNode(SE, Tree.newNode(PA), Tree.newNode(SE)))
+						Next.append((Tree.Left[Tree.Right[RootNode]], VTX, "PA_P"))
+						lvVTX1 = []
+						lvVTX1.append(Nodes[VTX[0].Succ[0]])
+						Next.append((Tree.Right[Tree.Right[RootNode]], lvVTX1, "SE"))
+				elif len(VTX) >= 2 and (isJoinCommonForMultipleVTX(VTX) == True) and (Tree.Contains(VTX[0].Succ[0])==True):
+					# print("Yes Common Join %d is in tree"%VTX[0].Succ[0])
+					Tree.setRight(RootNode, Tree.newNode(PA))
+					Next.append((Tree.Right[RootNode], VTX, "PA_P"))
+				elif len(VTX) == 1:
+					Tree.setRight(RootNode, Tree.newNode(SE))
+					Next.append((Tree.Right[RootNode], VTX, "SE"))
+			else:
+				Tree.setRight(RootNode, Tree.newNode(SE))
+				lvVTX = []
+				lvVTX.append(VTX[0])
+				# print("Created Series Nodes with the first:%d "%VTX[0].JID)
+				Next.append((Tree.Right[RootNode], lvVTX, "SE"))
+				VTX.pop(0)
+				Tree.setLeft(RootNode, Tree.newNode(PA))
+				# print("Created PA_NP Nodes with the first:%d "%VTX[0].JID)
+				Next.append((Tree.Left[RootNode], VTX, "PA_NP"))
 
-	elif (VTX_Type == "SE"):
+		elif (VTX_Type == "SE"):
 
-		RootNode.left = newTreeNode(VTX[0].JID) # Todo start debug here
-		# print("Input SE_VTX_ID:%d"%VTX[0].JID)
+			Tree.setLeft(RootNode, Tree.newNode(VTX[0].JID)) # Todo start debug here
+			# print("Input SE_VTX_ID:%d"%VTX[0].JID)
 
-		if len(VTX[0].Succ) > 1: # it is a fork node
+			if len(VTX[0].Succ) > 1: # it is a fork node
 			
-			lvVTX = []
-			for n in range(0, len(VTX[0].Succ)):
-				lvVTX.append(Nodes[VTX[0].Succ[n]])
+				lvVTX = []
+				for n in range(0, len(VTX[0].Succ)):
+					lvVTX.append(Nodes[VTX[0].Succ[n]])
 			
-			if (isJoinNodeCommonForSuccessors(TaskInfo, VTX[0]) == True):
-				# print("<<< SE VTX[0].JID:%d ForkNum_0f_Succ:%d Common Join VTX ID:%d"%(VTX[0].JID, len(VTX[0].Succ), getCommonJoinVTX(TaskInfo, VTX[0]).JID))
-				if (Is_Already_in_Binary_Tree(getCommonJoinVTX(TaskInfo, VTX[0]).JID, TreeRoot) == False):
+				if (isJoinNodeCommonForSuccessors(TaskInfo, VTX[0]) == True):
+					# print("<<< SE VTX[0].JID:%d ForkNum_0f_Succ:%d Common Join VTX ID:%d"%(VTX[0].JID, len(VTX[0].Succ), getCommonJoinVTX(TaskInfo, VTX[0]).JID))
+					if (Tree.Contains(getCommonJoinVTX(TaskInfo, VTX[0]).JID) == False):
 					
-					if Is_Already_in_Binary_Tree(getCommonJoinVTX(TaskInfo, VTX[0]).Succ[0], TreeRoot) == True:
-						RootNode.right = newTreeNode(SE, newTreeNode(PA), newTreeNode(getCommonJoinVTX(TaskInfo, VTX[0]).JID))
-						# print("1 Creating PA_P with %d lvVTX"%len(lvVTX))
-						UpdateTaskDecompositionTree(TreeRoot, TaskInfo, RootNode.right.left, lvVTX, "PA_P")
+						if Tree.Contains(getCommonJoinVTX(TaskInfo, VTX[0]).Succ[0]) == True:
+							Tree.setRight(RootNode, Tree.newNode(SE, Tree.newNode(PA), Tree.newNode(getCommonJoinVTX(TaskInfo, VTX[0]).JID)))
+							# print("1 Creating PA_P with %d lvVTX"%len(lvVTX))
+							Next.append((Tree.Left[Tree.Right[RootNode]], lvVTX, "PA_P"))
+						else:
+							Tree.setRight(RootNode, Tree.newNode(SE, Tree.newNode(PA), Tree.newNode(SE)))
+							lvVTX1 = []
+							lvVTX1.append(getCommonJoinVTX(TaskInfo, VTX[0]))
+							Next.append((Tree.Right[Tree.Right[RootNode]], lvVTX1, "SE"))
+							# print("2 Creating PA_P with %d lvVTX"%len(lvVTX))
+							Next.append((Tree.Left[Tree.Right[RootNode]], lvVTX, "PA_P"))
 					else:
-						RootNode.right = newTreeNode(SE, newTreeNode(PA), newTreeNode(SE))
-						lvVTX1 = []
-						lvVTX1.append(getCommonJoinVTX(TaskInfo, VTX[0]))
-						UpdateTaskDecompositionTree(TreeRoot, TaskInfo, RootNode.right.right, lvVTX1, "SE")
-						# print("2 Creating PA_P with %d lvVTX"%len(lvVTX))
-						UpdateTaskDecompositionTree(TreeRoot, TaskInfo, RootNode.right.left, lvVTX, "PA_P")
+						Tree.setRight(RootNode, Tree.newNode(PA))
+						Next.append((Tree.Right[RootNode], lvVTX, "PA_P"))
+
+				else: # Join node is not common
+					# print("Succ of %d has no common Join Releasing PA_NP"%VTX[0].JID)
+					Tree.setRight(RootNode, Tree.newNode(PA))
+					Next.append((Tree.Right[RootNode], lvVTX, "PA_NP"))
+
+			else: # It is not a fork node
+				# print("Not Fork Node::Next Succ...:%d whose succ to check...:%d"%(Nodes[VTX[0].Succ[0]].JID, Nodes[VTX[0].Succ[0]].Succ[0]))
+				if Tree.Contains(Nodes[VTX[0].Succ[0]].Succ[0]) == True:
+					# print("No further successors, simply leaf: VTX:%d VTX_Succ:%d VTX_Succ_Succ:%d"%(VTX[0].JID, VTX[0].Succ[0], Nodes[VTX[0].Succ[0]].Succ[0]))
+					Tree.setRight(RootNode, Tree.newNode(VTX[0].Succ[0]))
 				else:
-					RootNode.right = newTreeNode(PA)
-					UpdateTaskDecompositionTree(TreeRoot, TaskInfo, RootNode.right, lvVTX, "PA_P")
-
-			else: # Join node is not common
-				# print("Succ of %d has no common Join Releasing PA_NP"%VTX[0].JID)
-				RootNode.right = newTreeNode(PA)
-				UpdateTaskDecompositionTree(TreeRoot, TaskInfo, RootNode.right, lvVTX, "PA_NP")
-
-		else: # It is not a fork node
-			# print("Not Fork Node::Next Succ...:%d whose succ to check...:%d"%(Nodes[VTX[0].Succ[0]].JID, Nodes[VTX[0].Succ[0]].Succ[0]))
-			if Is_Already_in_Binary_Tree(Nodes[VTX[0].Succ[0]].Succ[0], TreeRoot) == True:
-				# print("No further successors, simply leaf: VTX:%d VTX_Succ:%d VTX_Succ_Succ:%d"%(VTX[0].JID, VTX[0].Succ[0], Nodes[VTX[0].Succ[0]].Succ[0]))
-				RootNode.right = newTreeNode(VTX[0].Succ[0])
-			else:
-				lvVTX = []
-				RootNode.right = newTreeNode(SE)
-				lvVTX.append(Nodes[VTX[0].Succ[0]])
-				UpdateTaskDecompositionTree(TreeRoot, TaskInfo, RootNode.right, lvVTX, "SE")				
-	
+					lvVTX = []
+					Tree.setRight(RootNode, Tree.newNode(SE))
+					lvVTX.append(Nodes[VTX[0].Succ[0]])
+					Next.append((Tree.Right[RootNode], lvVTX, "SE"))				
+
+		Calls.extend(reversed(Next))
+
 def Update_NFJ_DAG_DecompositionTree(NFJ_DAG_TaskSetInfo):
 	for TaskInfo in range(0, len(NFJ_DAG_TaskSetInfo)):
 
@@ -1073,19 +912,21 @@ def Update_NFJ_DAG_DecompositionTree(NFJ_DAG_TaskSetInfo):
 		VTX = []
 		lvTaskInfo = NFJ_DAG_TaskSetInfo[TaskInfo]
 		Nr_of_Nodes = len(lvTaskInfo.Nodes)
-		RootNode = None
+		RootNode = -1
+		Tree = DecompositionTree()
+		lvTaskInfo.Tree = Tree
 		
 		# print("------------------ NFJ_DAG_TASK:%d Binary Decomposition Tree----Len(Nodes):%d--"%(lvTaskInfo.TID, Nr_of_Nodes))
 
 		if Nr_of_Nodes < 1:
 			return False
 		elif Nr_of_Nodes == 1: 
-			lvTaskInfo.TreeRoot = newTreeNode(SE, newTreeNode(lvTaskInfo.Nodes[0].JID), newTreeNode(SE))
+			Tree.Root = Tree.newNode(SE, Tree.newNode(lvTaskInfo.Nodes[0].JID), Tree.newNode(SE))
 		elif Nr_of_Nodes == 2: 
-			lvTaskInfo.TreeRoot = newTreeNode(SE, newTreeNode(lvTaskInfo.Nodes[0].JID), newTreeNode(lvTaskInfo.Nodes[len(lvTaskInfo.Nodes)-1].JID))
+			Tree.Root = Tree.newNode(SE, Tree.newNode(lvTaskInfo.Nodes[0].JID), Tree.newNode(lvTaskInfo.Nodes[len(lvTaskInfo.Nodes)-1].JID))
 		elif Nr_of_Nodes == 3:
-			lvTaskInfo.TreeRoot = newTreeNode(SE, newTreeNode(lvTaskInfo.Nodes[0].JID),\
-			 newTreeNode(SE, newTreeNode(lvTaskInfo.Nodes[len(lvTaskInfo.Nodes)-2].JID), newTreeNode(lvTaskInfo.Nodes[len(lvTaskInfo.Nodes)-1].JID)))
+			Tree.Root = Tree.newNode(SE, Tree.newNode(lvTaskInfo.Nodes[0].JID),\
+			 Tree.newNode(SE, Tree.newNode(lvTaskInfo.Nodes[len(lvTaskInfo.Nodes)-2].JID), Tree.newNode(lvTaskInfo.Nodes[len(lvTaskInfo.Nodes)-1].JID)))
 		else:
 			SecondLastPredID = 0
 			for n in range(0, len(lvTaskInfo.Nodes[len(lvTaskInfo.Nodes)-1].Pred)):
@@ -1103,15 +944,15 @@ def Update_NFJ_DAG_DecompositionTree(NFJ_DAG_TaskSetInfo):
 						VTX.append(lvTaskInfo.Nodes[lvTaskInfo.Nodes[0].Succ[succ]])
 
 					if SecondLastPredID == 0:
-						lvTaskInfo.TreeRoot = newTreeNode(SE, newTreeNode(lvTaskInfo.Nodes[0].JID),\
-							newTreeNode(SE, newTreeNode(PA), newTreeNode(lvTaskInfo.Nodes[len(lvTaskInfo.Nodes)-1].JID)))
+						Tree.Root = Tree.newNode(SE, Tree.newNode(lvTaskInfo.Nodes[0].JID),\
+							Tree.newNode(SE, Tree.newNode(PA), Tree.newNode(lvTaskInfo.Nodes[len(lvTaskInfo.Nodes)-1].JID)))
 					else:
-						lvTaskInfo.TreeRoot = newTreeNode(SE, newTreeNode(lvTaskInfo.Nodes[0].JID),\
-							newTreeNode(SE, newTreeNode(PA), newTreeNode(SE, newTreeNode(SecondLastPredID), newTreeNode(lvTaskInfo.Nodes[len(lvTaskInfo.Nodes)-1].JID))))
+						Tree.Root = Tree.newNode(SE, Tree.newNode(lvTaskInfo.Nodes[0].JID),\
+							Tree.newNode(SE, Tree.newNode(PA), Tree.newNode(SE, Tree.newNode(SecondLastPredID), Tree.newNode(lvTaskInfo.Nodes[len(lvTaskInfo.Nodes)-1].JID))))
 					
-					RootNode 	 	= lvTaskInfo.TreeRoot.right.left	
+					RootNode 	 	= Tree.Left[Tree.Right[Tree.Root]]	
 
-					UpdateTaskDecompositionTree(lvTaskInfo.TreeRoot, lvTaskInfo, RootNode, VTX, VTX_Type)
+					UpdateTaskDecompositionTree(Tree, lvTaskInfo, RootNode, VTX, VTX_Type)
 
 				else:
 					CommonSuccessorJoinVTX = getCommonJoinVTX(lvTaskInfo, lvTaskInfo.Nodes[0]) # We get the common join of the successors of lvTaskInfo.Nodes[0]
@@ -1123,14 +964,14 @@ def Update_NFJ_DAG_DecompositionTree(NFJ_DAG_TaskSetInfo):
 							VTX.append(lvTaskInfo.Nodes[lvTaskInfo.Nodes[0].Succ[succ]])
 
 						if SecondLastPredID == 0:
-							lvTaskInfo.TreeRoot = newTreeNode(SE, newTreeNode(lvTaskInfo.Nodes[0].JID),\
-								newTreeNode(SE, newTreeNode(PA), newTreeNode(lvTaskInfo.Nodes[len(lvTaskInfo.Nodes)-1].JID)))
+							Tree.Root = Tree.newNode(SE, Tree.newNode(lvTaskInfo.Nodes[0].JID),\
+								Tree.newNode(SE, Tree.newNode(PA), Tree.newNode(lvTaskInfo.Nodes[len(lvTaskInfo.Nodes)-1].JID)))
 						else:
-							lvTaskInfo.TreeRoot = newTreeNode(SE, newTreeNode(lvTaskInfo.Nodes[0].JID),\
-								newTreeNode(SE, newTreeNode(PA), newTreeNode(SE, newTreeNode(SecondLastPredID), newTreeNode(lvTaskInfo.Nodes[len(lvTaskInfo.Nodes)-1].JID))))
+							Tree.Root = Tree.newNode(SE, Tree.newNode(lvTaskInfo.Nodes[0].JID),\
+								Tree.newNode(SE, Tree.newNode(PA), Tree.newNode(SE, Tree.newNode(SecondLastPredID), Tree.newNode(lvTaskInfo.Nodes[len(lvTaskInfo.Nodes)-1].JID))))
 
-						RootNode 	 	= lvTaskInfo.TreeRoot.right.left
-						UpdateTaskDecompositionTree(lvTaskInfo.TreeRoot, lvTaskInfo, RootNode, VTX, VTX_Type)
+						RootNode 	 	= Tree.Left[Tree.Right[Tree.Root]]
+						UpdateTaskDecompositionTree(Tree, lvTaskInfo, RootNode, VTX, VTX_Type)
 					else:
 						Join_is_Second_Last = False
 						for pred in lvTaskInfo.Nodes[len(lvTaskInfo.Nodes)-1].Pred:
@@ -1144,264 +985,241 @@ def Update_NFJ_DAG_DecompositionTree(NFJ_DAG_TaskSetInfo):
 								VTX.append(lvTaskInfo.Nodes[lvTaskInfo.Nodes[0].Succ[succ]])
 
 							if SecondLastPredID == 0:						
-								lvTaskInfo.TreeRoot = newTreeNode(SE, newTreeNode(lvTaskInfo.Nodes[0].JID),\
-									newTreeNode(SE, newTreeNode(SE, newTreeNode(PA), newTreeNode(SE)), newTreeNode(lvTaskInfo.Nodes[len(lvTaskInfo.Nodes)-1].JID)))
+								Tree.Root = Tree.newNode(SE, Tree.newNode(lvTaskInfo.Nodes[0].JID),\
+									Tree.newNode(SE, Tree.newNode(SE, Tree.newNode(PA), Tree.newNode(SE)), Tree.newNode(lvTaskInfo.Nodes[len(lvTaskInfo.Nodes)-1].JID)))
 							else:
-								lvTaskInfo.TreeRoot = newTreeNode(SE, newTreeNode(lvTaskInfo.Nodes[0].JID),\
-									newTreeNode(SE, newTreeNode(SE, newTreeNode(PA), newTreeNode(SE)), newTreeNode(SE, newTreeNode(SecondLastPredID), newTreeNode(lvTaskInfo.Nodes[len(lvTaskInfo.Nodes)-1].JID))))
-							RootNode 	 	= lvTaskInfo.TreeRoot.right.left.left
-							UpdateTaskDecompositionTree(lvTaskInfo.TreeRoot, lvTaskInfo, RootNode, VTX, VTX_Type)
+								Tree.Root = Tree.newNode(SE, Tree.newNode(lvTaskInfo.Nodes[0].JID),\
+									Tree.newNode(SE, Tree.newNode(SE, Tree.newNode(PA), Tree.newNode(SE)), Tree.newNode(SE, Tree.newNode(SecondLastPredID), Tree.newNode(lvTaskInfo.Nodes[len(lvTaskInfo.Nodes)-1].JID))))
+							RootNode 	 	= Tree.Left[Tree.Left[Tree.Right[Tree.Root]]]
+							UpdateTaskDecompositionTree(Tree, lvTaskInfo, RootNode, VTX, VTX_Type)
 							VTX_Type = "SE"
 							VTX.clear()
 							VTX.append(CommonSuccessorJoinVTX)
-							RootNode 	 	= lvTaskInfo.TreeRoot.right.left.right
-							UpdateTaskDecompositionTree(lvTaskInfo.TreeRoot, lvTaskInfo, RootNode, VTX, VTX_Type)
+							RootNode 	 	= Tree.Right[Tree.Left[Tree.Right[Tree.Root]]]
+							UpdateTaskDecompositionTree(Tree, lvTaskInfo, RootNode, VTX, VTX_Type)
 						else:
 							VTX_Type = "PA_P"
 							for succ in range(0, len(lvTaskInfo.Nodes[0].Succ)):
 								VTX.append(lvTaskInfo.Nodes[lvTaskInfo.Nodes[0].Succ[succ]])
 
 							if SecondLastPredID == 0:						
-								lvTaskInfo.TreeRoot = newTreeNode(SE, newTreeNode(lvTaskInfo.Nodes[0].JID),\
-									newTreeNode(SE, newTreeNode(SE, newTreeNode(PA), newTreeNode(SE)), newTreeNode(lvTaskInfo.Nodes[len(lvTaskInfo.Nodes)-1].JID)))
+								Tree.Root = Tree.newNode(SE, Tree.newNode(lvTaskInfo.Nodes[0].JID),\
+									Tree.newNode(SE, Tree.newNode(SE, Tree.newNode(PA), Tree.newNode(SE)), Tree.newNode(lvTaskInfo.Nodes[len(lvTaskInfo.Nodes)-1].JID)))
 							else:
-								lvTaskInfo.TreeRoot = newTreeNode(SE, newTreeNode(lvTaskInfo.Nodes[0].JID),\
-									newTreeNode(SE, newTreeNode(PA), newTreeNode(SE, newTreeNode(CommonSuccessorJoinVTX.JID), newTreeNode(lvTaskInfo.Nodes[len(lvTaskInfo.Nodes)-1].JID))))
+								Tree.Root = Tree.newNode(SE, Tree.newNode(lvTaskInfo.Nodes[0].JID),\
+									Tree.newNode(SE, Tree.newNode(PA), Tree.newNode(SE, Tree.newNode(CommonSuccessorJoinVTX.JID), Tree.newNode(lvTaskInfo.Nodes[len(lvTaskInfo.Nodes)-1].JID))))
 
-							RootNode 	 	= lvTaskInfo.TreeRoot.right.left
-							UpdateTaskDecompositionTree(lvTaskInfo.TreeRoot, lvTaskInfo, RootNode, VTX, VTX_Type)
+							RootNode 	 	= Tree.Left[Tree.Right[Tree.Root]]
+							UpdateTaskDecompositionTree(Tree, lvTaskInfo, RootNode, VTX, VTX_Type)
 								
 			else:
 				# print("now We were here yes...")
 				if SecondLastPredID !=0:
 					# print("checked in here... seoncdlast node ID.%d"%SecondLastPredID)
-					lvTaskInfo.TreeRoot = newTreeNode(SE, newTreeNode(lvTaskInfo.Nodes[0].JID),\
-								newTreeNode(SE, newTreeNode(SE), newTreeNode(SE, newTreeNode(SecondLastPredID), newTreeNode(lvTaskInfo.Nodes[len(lvTaskInfo.Nodes)-1].JID))))
+					Tree.Root = Tree.newNode(SE, Tree.newNode(lvTaskInfo.Nodes[0].JID),\
+								Tree.newNode(SE, Tree.newNode(SE), Tree.newNode(SE, Tree.newNode(SecondLastPredID), Tree.newNode(lvTaskInfo.Nodes[len(lvTaskInfo.Nodes)-1].JID))))
 				else:
-					lvTaskInfo.TreeRoot = newTreeNode(SE, newTreeNode(lvTaskInfo.Nodes[0].JID),\
-					 newTreeNode(SE, newTreeNode(SE), newTreeNode(lvTaskInfo.Nodes[len(lvTaskInfo.Nodes)-1].JID)))
+					Tree.Root = Tree.newNode(SE, Tree.newNode(lvTaskInfo.Nodes[0].JID),\
+					 Tree.newNode(SE, Tree.newNode(SE), Tree.newNode(lvTaskInfo.Nodes[len(lvTaskInfo.Nodes)-1].JID)))
 				
 				VTX_Type = "SE"
 				VTX.append(lvTaskInfo.Nodes[lvTaskInfo.Nodes[0].Succ[0]])
 				# print("Appended Node:%d"%VTX[0].JID)
-				RootNode 	 	= lvTaskInfo.TreeRoot.right.left
+				RootNode 	 	= Tree.Left[Tree.Right[Tree.Root]]
 
-				UpdateTaskDecompositionTree(lvTaskInfo.TreeRoot, lvTaskInfo, RootNode, VTX, VTX_Type)
+				UpdateTaskDecompositionTree(Tree, lvTaskInfo, RootNode, VTX, VTX_Type)
 			
-		# lvTaskInfo.TreeRoot.display()
+		# Tree.display()
 
 			# break
 
 	return True
 
-def Get_Nodes_with_Max_Parallelism(TreeRoot, Nodes): 
-	Pi_L=[]
-	Pi_R=[]
-	Interference_Left_Nodes = 0
-	Interference_Right_Nodes = 0
-	Nodes_with_max_parallelism = []
-	# print("TreeRoot.left=%s TreeRoot.right=%s"%(NUM_TO_STR(TreeRoot.left.key), NUM_TO_STR(TreeRoot.right.key)))
-	try:
-		if (TreeRoot.key == SE):
-			try:
-				if TreeRoot.left.key != SE and TreeRoot.left.key != PA and TreeRoot.left.key != None:
-					Pi_L.append(Nodes[TreeRoot.left.key])
-				else:
-					lvPi_L = Get_Nodes_with_Max_Parallelism(TreeRoot.left, Nodes)
-					for v in range(0, len(lvPi_L)):
-						Pi_L.append(lvPi_L[v])
-			except NameError:
-				# print("Error # 1")
-				pass
-
-			try:
-				if TreeRoot.right.key != SE and TreeRoot.right.key != PA and TreeRoot.right.key != None:
-					Pi_R.append(Nodes[TreeRoot.right.key])
-				else:
-					lvPi_R = Get_Nodes_with_Max_Parallelism(TreeRoot.right, Nodes)
-					for v in range(0, len(lvPi_R)):
-						Pi_R.append(lvPi_R[v])
-			
-			except NameError:
-				# print("Error # 2")
-				pass
-
-			# Get Sum of Interference Parameters of TreeRoot.left
-			Interference_Left_Nodes = 0
-			for v in range(0, len(Pi_L)):
-				Interference_Left_Nodes += (1/(Cores_Per_RSC_Type[Pi_L[v].ResourceType-1]))
-			# Get Sum of Interference Parameters of TreeRoot.right
-			Interference_Right_Nodes = 0
-			for v in range(0, len(Pi_R)):
-				Interference_Right_Nodes += (1/(Cores_Per_RSC_Type[Pi_R[v].ResourceType-1]))
-		
-		elif (TreeRoot.key == PA):
-			try:
-				if TreeRoot.left.key != SE and TreeRoot.left.key != PA and TreeRoot.left.key != None:
-					Pi_L.append(Nodes[TreeRoot.left.key])
-				else:
-					lvPi_L = Get_Nodes_with_Max_Parallelism(TreeRoot.left, Nodes)
-					for v in range(0, len(lvPi_L)):
-						Pi_L.append(lvPi_L[v])
-			except NameError:
-				# print("Error # 3")
-				pass
-
-			try:
-				if TreeRoot.right.key != SE and TreeRoot.right.key != PA and TreeRoot.right.key != None:
-					Pi_R.append(Nodes[TreeRoot.right.key])
-				else:
-					lvPi_R = Get_Nodes_with_Max_Parallelism(TreeRoot.right, Nodes)
-					for v in range(0, len(lvPi_R)):
-						Pi_R.append(lvPi_R[v])
-			except NameError:
-				# print("Error # 4")
-				pass			
-		
-	except NameError:
-		# print("Error # 5")
-		pass
-
-	# Decide which ones will be part of Nodes_with_max_parallelism based on interference parameter
-	if TreeRoot.key == SE:
-		if Interference_Left_Nodes >= Interference_Right_Nodes:
-			for v in range(0, len(Pi_L)):
-				Nodes_with_max_parallelism.append(Pi_L[v])
-		else:
-			for v in range(0, len(Pi_R)):
-				Nodes_with_max_parallelism.append(Pi_R[v])
-
-	elif TreeRoot.key == PA:
-		for v in range(0, len(Pi_L)):
-			Nodes_with_max_parallelism.append(Pi_L[v])
-		for v in range(0, len(Pi_R)):
-				Nodes_with_max_parallelism.append(Pi_R[v])
-
-	Nodes_with_max_parallelism.sort(key=lambda v:v.JID)
-
-	return Nodes_with_max_parallelism
-
-
-def Find_and_Delete_Vertex(NodeID, TreeRoot):
-	if TreeRoot.key != None:
-
-		try:
-			if TreeRoot.key == NodeID:		
-				TreeRoot.key = None	
-				TreeRoot = None
-				return True
-			elif (TreeRoot.left != None) and (Find_and_Delete_Vertex(NodeID, TreeRoot.left)==True):
-				# print("1 Deleted TreeRoot.Right:%s TreeRoot.Left:%s"%(NUM_TO_STR(TreeRoot.right.key), NUM_TO_STR(TreeRoot.left.key)))
-				if TreeRoot.right.key != None or TreeRoot.left.key != None:
-					return True
-				else:
-					# print("Invalidate %s Node"%NUM_TO_STR(TreeRoot.key))
-					TreeRoot.key = None
-					TreeRoot = None
-					return True
-	 
-				return True
-
-			elif (TreeRoot.right != None) and (Find_and_Delete_Vertex(NodeID, TreeRoot.right)==True):
-				# print("2 Deleted TreeRoot.Right:%s TreeRoot.Left:%s"%(NUM_TO_STR(TreeRoot.right.key), NUM_TO_STR(TreeRoot.left.key)))
-				if TreeRoot.left.key != None or TreeRoot.right.key != None:
-					return True
-				else:
-					# print("Invalidate %s Node"%NUM_TO_STR(TreeRoot.key))
-					TreeRoot.key = None
-					TreeRoot = None
-					return True			
-		except NameError:
-
-			pass
-
-	return False
-
-def Get_Interference_Distribution_Block(TreeRoot, Nodes):
-	lvID_Block = ID_Block()
-	# 1 Get Pi(v) = Nodes with maximum parallelism aka interference parameters
-	Nodes_max_par = []
-		
-	Nodes_max_par = Get_Nodes_with_Max_Parallelism(TreeRoot, Nodes)
-	# PrintList(Nodes_max_par, True)
-
-	# 2 Get Minimum WCET out of all nodes, it is width
-	Min_WCET = DUMMY_NUMBER
-	for v in range(0, len(Nodes_max_par)):
-		if Nodes_max_par[v].WCET < Min_WCET:
-			Min_WCET = Nodes_max_par[v].WCET
-
-	# 3 Get height = sum of their (interference distribution = 1/Ms ; s = gama(v))
-	SUM_ID = 0
-	for v in range(0, len(Nodes_max_par)):
-		SUM_ID += (1/(Cores_Per_RSC_Type[Nodes_max_par[v].ResourceType-1]))
-
-	# 4 Create a ID_Block with width and height
-	lvID_Block.Width 	= Min_WCET
-	lvID_Block.Height 	= SUM_ID
-
-	# 5 Decrease the min_wcet from all of Pi(v) nodes.
-	for v in range(0, len(Nodes_max_par)):
-		Nodes[Nodes_max_par[v].JID].WCET -= Min_WCET
+class InterferenceDistributionSweep:
+	'''
+	The ID blocks of a task are built in one sweep over the finishing times of its vertices, instead of walking the
+	decomposition tree for every block. Each node of the tree keeps the vertices
+	with maximum parallelism of its subtree (sorted w.r.t JIDs) along with the sum of their interference parameters.
+	These are only updated on the way from a removed leaf to the root. The vertices selected at the root progress on a
+	common clock, so a block ends at the earliest finishing time out of a heap of events and the WCETs are not modified.
+	A vertex whose remaining WCET is 0 removes one of its leaves per block, the first one in preorder. A vertex with two
+	leaves selected at once is consumed twice as fast, and it is finished as soon as nothing of its WCET is left.
+	'''
+	def __init__(self, Tree, Nodes):
+		self.Tree 			= Tree
+		self.Leaves 		= {}
+		self.Weight 		= {}
+
+		Order = Tree.getPreorder(Tree.Root)
+		for n in Order:
+			if Tree.IsLeaf(n) == True:
+				self.Leaves.setdefault(Tree.Key[n], []).append(n)
+				self.Weight[Tree.Key[n]] = (1/(Cores_Per_RSC_Type[Nodes[Tree.Key[n]].ResourceType-1]))
+
+		self.Remaining 		= {JID: Nodes[JID].WCET for JID in self.Leaves}
+		self.Selected 		= [[] for n in range(0, len(Tree.Key))]
+		self.Interference 	= [0] * len(Tree.Key)
+
+		for n in reversed(Order):
+			self.UpdateNode(n)
+
+	def getChild(self, Child):
+		if Child == -1:
+			return [], 0
+		return self.Selected[Child], self.Interference[Child]
+
+	# Series nodes take over the side with more interference, parallel nodes the vertices of both sides
+	def UpdateNode(self, n):
+		if self.Tree.IsLeaf(n) == True:
+			if self.Tree.IsAlive(n) == True:
+				self.Selected[n] 		= [self.Tree.Key[n]]
+				self.Interference[n] 	= self.Weight[self.Tree.Key[n]]
+			else:
+				self.Selected[n] 		= []
+				self.Interference[n] 	= 0
+			return
 
-	# 6 whicever node out of Nodes has 0 WCET, remove its leaf from  the TreeRoot
-	for v in range(0, len(Nodes)):
-		if Nodes[v].WCET == 0:
-			Find_and_Delete_Vertex(Nodes[v].JID, TreeRoot)
+		Pi_L, Interference_Left_Nodes = self.getChild(self.Tree.Left[n])
+		Pi_R, Interference_Right_Nodes = self.getChild(self.Tree.Right[n])
 
-	# 7 return ID_Block
-	return lvID_Block
+		if self.Tree.Key[n] == SE:
+			if Interference_Left_Nodes >= Interference_Right_Nodes:
+				self.Selected[n] 		= Pi_L
+				self.Interference[n] 	= Interference_Left_Nodes
+			else:
+				self.Selected[n] 		= Pi_R
+				self.Interference[n] 	= Interference_Right_Nodes
+		else:
+			self.Selected[n] = sorted(Pi_L + Pi_R)
+			SUM_ID = 0
+			for JID in self.Selected[n]:
+				SUM_ID += self.Weight[JID]
+			self.Interference[n] = SUM_ID
+
+	# A removed leaf changes the nodes on its way to the root until one of them keeps its vertices
+	def RemoveLeaf(self, Leaf):
+		self.Tree.RemoveLeaf(Leaf)
+		n = Leaf
+		while n != -1:
+			lvSelected = self.Selected[n]
+			self.UpdateNode(n)
+			if (n != Leaf) and (self.Selected[n] == lvSelected):
+				break
+			n = self.Tree.Parent[n]
+
+	def getBlocks(self):
+		Blocks 		= []
+		Clock 		= 0
+		Rate 		= {}
+		Virtual 	= {}
+		Events 		= {}
+		Finished 	= set(JID for JID in self.Remaining if self.Remaining[JID] == 0)
+
+		while self.Tree.IsAlive(self.Tree.Root) == True:
+			# A vertex selected through k leaves progresses k times per unit of the clock, its remaining WCET is Virtual - k*Clock
+			lvRate = {}
+			for JID in self.Selected[self.Tree.Root]:
+				lvRate[JID] = lvRate.get(JID, 0) + 1
+			for JID in [JID for JID in Rate if lvRate.get(JID) != Rate[JID]]:
+				self.Remaining[JID] = Virtual.pop(JID) - (Rate.pop(JID)*Clock)
+			for JID in lvRate:
+				if JID not in Rate:
+					Rate[JID] = lvRate[JID]
+					Virtual[JID] = self.Remaining[JID] + (Rate[JID]*Clock)
+					heapq.heappush(Events.setdefault(Rate[JID], []), (Virtual[JID], JID))
+				elif JID in Finished:
+					heapq.heappush(Events[Rate[JID]], (Virtual[JID], JID))
+
+			# The width of the block is the least remaining WCET out of the earliest events of each rate
+			Min_WCET = None
+			for k in Events:
+				lvEvents = Events[k]
+				while (len(lvEvents) > 0) and ((Rate.get(lvEvents[0][1]) != k) or (Virtual[lvEvents[0][1]] != lvEvents[0][0])):
+					heapq.heappop(lvEvents)
+				if (len(lvEvents) > 0) and ((Min_WCET == None) or ((lvEvents[0][0] - (k*Clock)) < Min_WCET)):
+					Min_WCET = lvEvents[0][0] - (k*Clock)
+
+			lvID_Block 			= ID_Block()
+			lvID_Block.Width 	= Min_WCET
+			lvID_Block.Height 	= self.Interference[self.Tree.Root]
+			Blocks.append(lvID_Block)
+
+			Clock += Min_WCET
+
+			for k in Events:
+				lvEvents = Events[k]
+				while (len(lvEvents) > 0) and ((lvEvents[0][0] - (k*Clock)) <= 0):
+					Vertex, JID = heapq.heappop(lvEvents)
+					if (Rate.get(JID) == k) and (Virtual[JID] == Vertex):
+						Virtual[JID] = k*Clock
+						Finished.add(JID)
+
+			for JID in sorted(Finished):
+				self.RemoveLeaf(self.Leaves[JID].pop(0))
+				if len(self.Leaves[JID]) == 0:
+					Finished.remove(JID)
+
+		return Blocks
 
 def UpdateInterferenceDistribution(NFJ_DAG_TaskSetInfo):
 	for Task in range(0, len(NFJ_DAG_TaskSetInfo)):
-		Nodes = copy.deepcopy(NFJ_DAG_TaskSetInfo[Task].Nodes)
-		TreeRoot = NFJ_DAG_TaskSetInfo[Task].TreeRoot
-		# TreeRoot.display()
-		while(TreeRoot.key != None):
-			NFJ_DAG_TaskSetInfo[Task].ID_Blocks.append(Get_Interference_Distribution_Block(TreeRoot, Nodes))
-			# TreeRoot.display()
+		Tree = NFJ_DAG_TaskSetInfo[Task].Tree
+		# Tree.display()
+		NFJ_DAG_TaskSetInfo[Task].ID_Blocks.extend(InterferenceDistributionSweep(Tree, NFJ_DAG_TaskSetInfo[Task].Nodes).getBlocks())
+		Update_ID_Block_Arrays(NFJ_DAG_TaskSetInfo[Task])
+		NFJ_DAG_TaskSetInfo[Task].Min_Job_Exec_Time = get_Min_Job_Exec_Time(NFJ_DAG_TaskSetInfo[Task])
 		# for i_d in range(0, len(NFJ_DAG_TaskSetInfo[Task].ID_Blocks)):
 		# 	print("Task:%d ID_Block:%d Width:%d Height:%f"%(Task+1,i_d+1,NFJ_DAG_TaskSetInfo[Task].ID_Blocks[i_d].Width,NFJ_DAG_TaskSetInfo[Task].ID_Blocks[i_d].Height))
 
+'''
+The widths and heights of the ID blocks of a task are kept as arrays along with the intermediate width in front of each block.
+As in the former block by block summation, the intermediate width of a block sums up the widths of all blocks except the one
+directly before it, i.e., the prefix sum of the widths shifted by two blocks.
+'''
+def Update_ID_Block_Arrays(TaskInfo):
+	TaskInfo.ID_Block_Widths 	= np.array([Block.Width for Block in TaskInfo.ID_Blocks], dtype=float)
+	TaskInfo.ID_Block_Heights 	= np.array([Block.Height for Block in TaskInfo.ID_Blocks], dtype=float)
+	TaskInfo.ID_Block_Offsets 	= np.concatenate(([0, 0], np.cumsum(TaskInfo.ID_Block_Widths)))[:len(TaskInfo.ID_Blocks)]
+
+# Delta_i_CI can be an array of carry-in windows, then the carry-in interference of each window is returned
 def getCarryInInt(Delta_i_CI, TaskInfo):
-	Factor_1 = max(0, (Delta_i_CI - (TaskInfo.Period - TaskInfo.WCRT)))
-	Factor_2 = get_Min_Job_Exec_Time(TaskInfo)
-	CarryIn_Interference = min(Factor_1, Factor_2)
+	Factor_1 = np.maximum(0, (Delta_i_CI - (TaskInfo.Period - TaskInfo.WCRT)))
+	Factor_2 = TaskInfo.Min_Job_Exec_Time
+	CarryIn_Interference = np.minimum(Factor_1, Factor_2)
 	return CarryIn_Interference
 
+'''
+Delta_i_CO can be an array of carry-out windows, then the carry-out interference of each window is returned.
+The interference of the blocks is accumulated with a cumulative sum in the order of the blocks, so that the
+floating point result is the same as adding them up one after another.
+'''
 def getCarryOutInt(Delta_i_CO, TaskInfo):
-	CarryOut_Interference = 0
-
-	for ID_Block_Ext in range(0, len(TaskInfo.ID_Blocks)):
-
-		Intermediate_Width = 0
+	Delta_i_CO = np.asarray(Delta_i_CO, dtype=float)
 
-		if ID_Block_Ext > 0:
-			for ID_Block_Int in range(0, ID_Block_Ext-1):
-				Intermediate_Width += TaskInfo.ID_Blocks[ID_Block_Int].Width
+	if len(TaskInfo.ID_Block_Widths) == 0:
+		return np.zeros(Delta_i_CO.shape)
 
-		CarryOut_Interference += TaskInfo.ID_Blocks[ID_Block_Ext].Height * min(TaskInfo.ID_Blocks[ID_Block_Ext].Width, max(0, (Delta_i_CO - Intermediate_Width)))
+	Block_Interference = TaskInfo.ID_Block_Heights * np.minimum(TaskInfo.ID_Block_Widths, np.maximum(0, (Delta_i_CO[..., None] - TaskInfo.ID_Block_Offsets)))
 
-	return CarryOut_Interference
+	return np.cumsum(Block_Interference, axis=-1)[..., -1]
 
+'''
+All splits of the sliding window Delta_i are evaluated at once: the one starting with a complete carry-in job,
+and the ones ending the carry-out window after each ID block.
+'''
 def getMaxIntSlidingWind(Delta_i, iTask):
 	iTask_Int = getCarryOutInt(Delta_i, iTask)
 
 	X1 = iTask.Period - iTask.WCRT
 
-	X1 = X1 + get_Min_Job_Exec_Time(iTask)
-	X2 = Delta_i - X1
-
-	iTask_Int = max(iTask_Int, (getCarryInInt(X1, iTask) + getCarryOutInt(X2, iTask)))
+	X1 = X1 + iTask.Min_Job_Exec_Time
 
-	X2 = 0
+	X2 = np.concatenate(([Delta_i - X1], np.cumsum(iTask.ID_Block_Widths)))
+	X1 = np.concatenate(([X1], Delta_i - X2[1:]))
 
-	for ID_Block in range(0, len(iTask.ID_Blocks)):
-		X2 += iTask.ID_Blocks[ID_Block].Width
-		X1 = Delta_i - X2
-		iTask_Int = max(iTask_Int, (getCarryInInt(X1, iTask) + getCarryOutInt(X2, iTask)))
+	iTask_Int = max(iTask_Int, np.max(getCarryInInt(X1, iTask) + getCarryOutInt(X2, iTask)))
 
-	return iTask_Int		
+	return float(iTask_Int)
 
 def UpdateWorstCaseResponseTime(NFJ_DAG_TaskSetInfo):
 	# Delta_i_CI 			=	(ceil(rk/Ti))*Ti - rk
@@ -1500,8 +1318,29 @@ def Execute_Test(Taskset):
 		Update_and_Print_FinalResults(TaskSetInfo, Results)
 
 	return Results 
-	
-def DispatchTests(directory):
+
+# The worker processes take over the analysis settings established by main()
+def initWorker(Settings):
+	global REMOVE
+	global SINGLE_DAG_ANALYSIS
+
+	REMOVE, SINGLE_DAG_ANALYSIS = Settings
+
+# This analyzes a task set file in a worker process and returns its results along with its printed output
+def Execute_Test_in_Worker(Taskset):
+	Output = io.StringIO()
+
+	with contextlib.redirect_stdout(Output):
+		Results = Execute_Test(Taskset)
+
+	return (Results, Output.getvalue())
+
+'''
+With '--jobs N' the task set files of a directory are analyzed in a pool of N processes, each file with the globals
+of its own process. The results come back in the order of the files, so Results.csv and the printed output are
+the same as in the sequential analysis.
+'''
+def DispatchTests(directory, Pool=None):
 	
 	encoding = 'utf-8'
 	ResultPath = directory+"/SOA_Results/"
@@ -1530,25 +1369,35 @@ def DispatchTests(directory):
 		if len(fileList) > 0:
 			print("Executing %s ..."%dirName)
 
+		TaskSetFiles = []
 		for Files in range(0, len(fileList)):
 			if ("Report" not in fileList[Files]) and ("NOT_FEASIBLE" not in fileList[Files]) and ("TasksetSettings" not in fileList[Files]) and ("Results" not in fileList[Files]) and ("Jobs" not in fileList[Files]) and ("Pred" not in fileList[Files]) and (".png" not in fileList[Files]):
-				results = TestResults()
-				# print("Executing:%s"%(directory+"/"+fileList[Files]))
-				results = Execute_Test(directory+"/"+fileList[Files])
-				FinalResults = results.Filename+","+str(results.Jobs)+","+str(results.Schedulable)+"\n"
-				FP.write(FinalResults)
-
-				if REMOVE == True:
-					lvCMD = "rm -rf "+directory+"/"+fileList[Files]
-					run_command(lvCMD)
-
-				TotalTested += 1
-				if results.Schedulable:
-					Passed += 1
-				else:
-					Failed += 1
-				
-				# results.DisplayResult() 
+				TaskSetFiles.append(directory+"/"+fileList[Files])
+
+		if Pool != None:
+			TaskSetResults = Pool.imap(Execute_Test_in_Worker, TaskSetFiles)
+		else:
+			TaskSetResults = ((Execute_Test(Taskset), "") for Taskset in TaskSetFiles)
+
+		for Taskset in TaskSetFiles:
+			# print("Executing:%s"%(Taskset))
+			results, Output = next(TaskSetResults)
+			print(Output, end="")
+			FinalResults = results.Filename+","+str(results.Jobs)+","+str(results.Schedulable)+"\n"
+			FP.write(FinalResults)
+			FP.flush()
+
+			if REMOVE == True:
+				lvCMD = "rm -rf "+Taskset
+				run_command(lvCMD)
+
+			TotalTested += 1
+			if results.Schedulable:
+				Passed += 1
+			else:
+				Failed += 1
+			
+			# results.DisplayResult() 
 
 		if TotalTested > 0:
 			Ratio = (Passed / TotalTested)*100
@@ -1564,6 +1413,7 @@ def main():
 	global TASK_SET_FILE
 	global REMOVE
 	global SINGLE_DAG_ANALYSIS
+	global JOBS
 
 	opts = parse_args()
 
@@ -1571,17 +1421,26 @@ def main():
 	TASK_SET_FILE = opts.task_set
 	REMOVE = opts.remove
 	SINGLE_DAG_ANALYSIS = opts.single_dag
+	JOBS = opts.jobs
 
 	if rootfolder == "Null" and TASK_SET_FILE == "Null":
 		print("error: Provide proper arguments, use -h for options.")
 		return
 
 	if TASK_SET_FILE == "Null":
+		Pool = None
+		if JOBS > 0:
+			Pool = multiprocessing.Pool(JOBS, initializer=initWorker, initargs=((REMOVE, SINGLE_DAG_ANALYSIS),))
+
 		for dirName, subdirList, fileList in os.walk(rootfolder):
 			if "Results" in dirName or "FEASIBILITY" in dirName or "Visuals" in dirName or "Results" in dirName:
 				continue
 			if len(fileList) > 0:
-				DispatchTests(dirName)
+				DispatchTests(dirName, Pool)
+
+		if Pool != None:
+			Pool.close()
+			Pool.join()
 	else:
 		results = TestResults()
 		results = Execute_Test(TASK_SET_FILE)
@@ -0,0 +1,96 @@
+'''
+****************************** Profile of the Generation of DAG Tasks ************************
+* Author:       Muhammad Junaid Aslam
+* Contact:      junaidaslam1@gmail.com
+* ---------------------------------------------------------------------
+* This software is governed by the No license. You can use, modify    |
+* and redistribute the software under the condition of citing  	      |
+* or crediting the authors of this software in your work.             |
+* ---------------------------------------------------------------------
+*
+* This is part of a research project funded by the EWI EEMCS Group of
+* Technical University of Delft, Netherlands.
+**********************************************************************************
+'''
+'''
+A GenerationProfile keeps a record for each (utilization, task count) cell of a sweep. The record holds the wall time
+and the number of calls of each generation stage and the number of times each rejection reason discarded an attempt.
+The stages are timed with 'with Profile.Stage(Name):' blocks, a stage nested in another one is only counted in the inner
+stage, so the times of a record add up to the time spent in all of its stages. The records of the cells generated in
+worker processes are merged into the profile of the main process and written as one JSON file.
+'''
+import json
+from time import perf_counter
+
+def newRecord():
+	return {"Time": {}, "Calls": {}, "Rejections": {}}
+
+class StageTimer:
+	def __init__(self, Profile, Name):
+		self.Profile 	= Profile
+		self.Name 		= Name
+
+	def __enter__(self):
+		# The time of the nested stages is taken out of the enclosing one
+		self.Profile.Stack.append(0.0)
+		self.Start = perf_counter()
+		return self
+
+	def __exit__(self, Type, Value, Traceback):
+		Elapsed = perf_counter() - self.Start
+		Nested = self.Profile.Stack.pop()
+
+		if len(self.Profile.Stack) > 0:
+			self.Profile.Stack[-1] += Elapsed
+
+		Record = self.Profile.Record
+		if Record != None:
+			Record["Time"][self.Name] = Record["Time"].get(self.Name, 0.0) + (Elapsed - Nested)
+			Record["Calls"][self.Name] = Record["Calls"].get(self.Name, 0) + 1
+
+		return False
+
+class GenerationProfile:
+	def __init__(self):
+		self.Cells 	= {}
+		self.Record = None
+		self.Stack 	= []
+
+	# This selects the record of the given cell, the stages and rejections which follow are counted into it
+	def Open(self, Key):
+		if Key not in self.Cells:
+			self.Cells[Key] = newRecord()
+		self.Record = self.Cells[Key]
+
+	def Stage(self, Name):
+		return StageTimer(self, Name)
+
+	def Reject(self, Reason):
+		if self.Record != None:
+			self.Record["Rejections"][Reason] = self.Record["Rejections"].get(Reason, 0) + 1
+
+	# This adds a record, e.g. one returned by a worker process, to the record of the given cell
+	def Merge(self, Key, Record):
+		if Key not in self.Cells:
+			self.Cells[Key] = newRecord()
+
+		for Field in ("Time", "Calls", "Rejections"):
+			for Name, Value in Record[Field].items():
+				self.Cells[Key][Field][Name] = self.Cells[Key][Field].get(Name, 0) + Value
+
+	# The cells are written along with their coordinates, the totals of all cells are added as well
+	def Write(self, FileName, CoordinateNames):
+		Total = newRecord()
+		Cells = []
+
+		for Key, Record in self.Cells.items():
+			Cell = dict(zip(CoordinateNames, Key))
+			Cell.update(Record)
+			Cells.append(Cell)
+
+			for Field in ("Time", "Calls", "Rejections"):
+				for Name, Value in Record[Field].items():
+					Total[Field][Name] = Total[Field].get(Name, 0) + Value
+
+		with open(FileName, "w") as fp:
+			json.dump({"Cells": Cells, "Total": Total}, fp, indent=1)
@@ -0,0 +1,68 @@
+'''
+****************************** Random Source of DAG Tasks ************************
+* Author:       Muhammad Junaid Aslam
+* Contact:      junaidaslam1@gmail.com
+* ---------------------------------------------------------------------
+* This software is governed by the No license. You can use, modify    |
+* and redistribute the software under the condition of citing  	      |
+* or crediting the authors of this software in your work.             |
+* ---------------------------------------------------------------------
+*
+* This is part of a research project funded by the EWI EEMCS Group of
+* Technical University of Delft, Netherlands.
+**********************************************************************************
+'''
+'''
+The random decisions of the task set generator are served by a RandomSource. It draws its uniform numbers from a
+numpy.random.Generator in blocks and turns each of them into one decision, so a decision costs a list lookup instead of a
+call into NumPy. The categorical decisions (e.g. terminal, fork or join) look the number up in a choice table holding the
+values and their cumulative probabilities, which is built once from the settings. Two sources created with the same seed
+serve the same decisions.
+'''
+import numpy as np
+from bisect import bisect_right
+
+DEFAULT_BLOCK_SIZE = 4096
+
+# This returns the values of a categorical decision along with their cumulative probabilities
+def getChoiceTable(Values, Probabilities):
+	Cumulative = np.cumsum(np.array(Probabilities, dtype=float)).tolist()
+	# The rounding of the sum must not leave a gap above the last value
+	if len(Cumulative) > 0:
+		Cumulative[-1] = 1.0
+	return (list(Values), Cumulative)
+
+class RandomSource:
+	def __init__(self, Seed=None, BlockSize=DEFAULT_BLOCK_SIZE):
+		self.Generator 	= np.random.default_rng(Seed)
+		self.BlockSize 	= BlockSize
+		self.Block 		= []
+		self.Next 		= 0
+
+	# This returns the next uniform number in [0, 1) out of the current block
+	def Draw(self):
+		if self.Next == len(self.Block):
+			self.Block = self.Generator.random(self.BlockSize).tolist()
+			self.Next = 0
+
+		self.Next += 1
+		return self.Block[self.Next - 1]
+
+	# The value whose cumulative probability interval contains the draw, as np.random.choice() picks it
+	def Choice(self, Table):
+		Values, Cumulative = Table
+		return Values[bisect_right(Cumulative, self.Draw())]
+
+	def Bernoulli(self, Probability):
+		return self.Draw() < Probability
+
+	# This returns an integer between Low and High, both inclusive
+	def Integer(self, Low, High):
+		return int(Low) + int(self.Draw() * (int(High) - int(Low) + 1))
+
+	def Uniform(self, Low, High):
+		return Low + (High - Low) * self.Draw()
+
+	# This returns an array of uniform numbers in [0, 1) of the given shape, e.g. for the edges of a whole DAG at once
+	def Uniforms(self, Shape):
+		return self.Generator.random(Shape)
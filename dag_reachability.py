@@ -0,0 +1,204 @@
+'''
+************************ Reachability Index of DAG Tasks *************************
+* Author:       Muhammad Junaid Aslam
+* Contact:      junaidaslam1@gmail.com
+* ---------------------------------------------------------------------
+* This software is governed by the No license. You can use, modify    |
+* and redistribute the software under the condition of citing  	      |
+* or crediting the authors of this software in your work.             |
+* ---------------------------------------------------------------------
+*
+* This is part of a research project funded by the EWI EEMCS Group of
+* Technical University of Delft, Netherlands.
+**********************************************************************************
+'''
+'''
+The transitive closure of a DAG task shared by the generator and the analysis scripts.
+The ancestors and descendants of every vertex are kept as integer bitmasks, where bit n stands
+for the vertex with JID n, i.e., the nodes of a task are expected to be indexed by their JIDs.
+Python integers are arbitrary precision, so the same masks serve DAGs with 10^4 and more vertices.
+Par_v, Desc and Ancs of each vertex are derived from the masks instead of enumerating all paths.
+While edges are removed from a task the ancestor masks are kept up to date by an AncestorIndex.
+'''
+
+'''
+This function returns the vertex IDs of a task in topological order (Kahn's algorithm) out of the successor lists of its vertices.
+Successor IDs are taken as list indices, i.e., an ID of -1 which was not renumbered refers to the last vertex as in Nodes[-1].
+'''
+def getTopologicalOrder_from_Successors(Successors):
+	InDegree = [0] * len(Successors)
+
+	for vertex in range(0, len(Successors)):
+		for succ in Successors[vertex]:
+			InDegree[succ] += 1
+
+	Order = []
+	for vertex in range(0, len(Successors)):
+		if InDegree[vertex] == 0:
+			Order.append(vertex)
+
+	n = 0
+	while n < len(Order):
+		for succ in Successors[Order[n]]:
+			InDegree[succ] -= 1
+			if InDegree[succ] == 0:
+				Order.append(succ % len(Successors))
+		n += 1
+
+	return Order
+
+def getTopologicalOrder(TaskNodes):
+	return getTopologicalOrder_from_Successors([Node.Succ for Node in TaskNodes])
+
+'''
+This returns the ancestor and descendant masks of the vertices reachable from the Root vertex, along with the mask of
+the reached vertices, in one forward and one backward pass over the topological order.
+'''
+def getClosureMasks(Successors, Order, Root=0):
+	Ancs 	= [0] * len(Successors)
+	Desc 	= [0] * len(Successors)
+	Reached = 0
+
+	if len(Successors) == 0:
+		return Ancs, Desc, Reached
+
+	Reached = 1 << Root
+
+	for vertex in Order:
+		if ((Reached >> vertex) & 1) == 0:
+			continue
+		lvMask = Ancs[vertex] | (1 << vertex)
+		for succ in Successors[vertex]:
+			succ = succ % len(Successors)
+			Ancs[succ] |= lvMask
+			Reached |= (1 << succ)
+
+	for vertex in reversed(Order):
+		if ((Reached >> vertex) & 1) == 0:
+			continue
+		for succ in Successors[vertex]:
+			succ = succ % len(Successors)
+			Desc[vertex] |= Desc[succ] | (1 << succ)
+
+	return Ancs, Desc, Reached
+
+class AncestorIndex:
+	'''
+	The ancestor masks of a DAG task whose edges are removed one by one, as during the conversion into a NFJ DAG.
+	The index works on the predecessor and successor lists of the vertices it is given and removes the edges from them.
+	A removal only recomputes the ancestors of the vertex of the removed edge and of those of its descendants whose
+	ancestors change, in the topological order of the task, which stays valid when edges are removed.
+	'''
+	def __init__(self, Predecessors, Successors, Root=0):
+		self.Predecessors 	= Predecessors
+		self.Successors 	= Successors
+		self.Order 			= getTopologicalOrder_from_Successors(Successors)
+		self.Position 		= [0] * len(Successors)
+
+		for n in range(0, len(self.Order)):
+			self.Position[self.Order[n]] = n
+
+		self.Ancs, Desc, self.Reached = getClosureMasks(Successors, self.Order, Root)
+
+	def IsAncestor(self, Ancestor, vertex):
+		return ((self.Ancs[vertex] >> Ancestor) & 1) == 1
+
+	# This removes the edge from Pred to vertex, False is returned if there is no such edge
+	def RemoveEdge(self, Pred, vertex):
+		try:
+			self.Successors[Pred].remove(vertex)
+			self.Predecessors[vertex].remove(Pred)
+		except ValueError:
+			return False
+
+		self.UpdateAncestors(vertex)
+
+		return True
+
+	# The vertices reached from the root stay reached, as only edges into vertices with further predecessors are removed
+	def UpdateAncestors(self, vertex):
+		Affected = 1 << vertex
+
+		for succ in self.Order[self.Position[vertex]:]:
+			if ((Affected >> succ) & 1) == 0:
+				continue
+
+			lvMask = 0
+			for pred in self.Predecessors[succ]:
+				if ((self.Reached >> pred) & 1) == 1:
+					lvMask |= self.Ancs[pred] | (1 << pred)
+
+			if lvMask != self.Ancs[succ]:
+				self.Ancs[succ] = lvMask
+				for lvSucc in self.Successors[succ]:
+					Affected |= 1 << lvSucc
+
+# This returns the nodes whose bits are set in the mask, sorted w.r.t JIDs
+def MaskToNodes(Nodes, Mask):
+	lvNodes = []
+	while Mask != 0:
+		lvBit = Mask & (-Mask)
+		lvNodes.append(Nodes[lvBit.bit_length() - 1])
+		Mask ^= lvBit
+	return lvNodes
+
+class ReachabilityIndex:
+	'''
+	Built in one forward and one backward pass over the topological order. Only the vertices reachable
+	from the source vertex (Nodes[0]) take part, since these are the ones lying on the root-to-sink paths.
+	'''
+	def __init__(self, Nodes):
+		Successors 		= [Node.Succ for Node in Nodes]
+		self.Nodes 		= Nodes
+		self.Order 		= getTopologicalOrder_from_Successors(Successors)
+		self.TypeMask 	= {}
+
+		self.Ancs, self.Desc, self.Reached = getClosureMasks(Successors, self.Order, Nodes[0].JID if len(Nodes) > 0 else 0)
+
+		for vertex in reversed(self.Order):
+			if ((self.Reached >> vertex) & 1) == 0:
+				continue
+			RSC = Nodes[vertex].ResourceType
+			self.TypeMask[RSC] = self.TypeMask.get(RSC, 0) | (1 << vertex)
+
+	def IsReached(self, vertex):
+		return ((self.Reached >> vertex) & 1) == 1
+
+	def IsAncestor(self, Ancestor, vertex):
+		return ((self.Ancs[vertex] >> Ancestor) & 1) == 1
+
+	# Vertices of the same resource type which are neither ancestors nor descendants of the vertex
+	def getParallelMask(self, vertex):
+		if self.IsReached(vertex) == False:
+			return 0
+		lvMask = self.TypeMask.get(self.Nodes[vertex].ResourceType, 0)
+		return lvMask & ~(self.Ancs[vertex] | self.Desc[vertex] | (1 << vertex))
+
+	def getAncestors(self, vertex):
+		return MaskToNodes(self.Nodes, self.Ancs[vertex])
+
+	def getDescendants(self, vertex):
+		return MaskToNodes(self.Nodes, self.Desc[vertex])
+
+	def getParallelVertices(self, vertex):
+		return MaskToNodes(self.Nodes, self.getParallelMask(vertex))
+
+'''
+This is a high level call to fill Par_v, Desc and Ancs of each vertex of a task out of one reachability index.
+The lists are sorted w.r.t JIDs, the same as the path based updates did. The index is returned for further queries.
+Along with the Par_v and Desc lists their bitmasks are kept in Par_vMask and DescMask.
+'''
+def UpdateReachability_of_EachVertex(Nodes, Par_v=True, Desc=True, Ancs=True):
+	Index = ReachabilityIndex(Nodes)
+
+	for vertex in range(0, len(Nodes)):
+		if Par_v == True:
+			Nodes[vertex].Par_vMask = Index.getParallelMask(vertex)
+			Nodes[vertex].Par_v = MaskToNodes(Nodes, Nodes[vertex].Par_vMask)
+		if Desc == True:
+			Nodes[vertex].DescMask = Index.Desc[vertex]
+			Nodes[vertex].Desc = MaskToNodes(Nodes, Nodes[vertex].DescMask)
+		if Ancs == True:
+			Nodes[vertex].Ancs = Index.getAncestors(vertex)
+
+	return Index
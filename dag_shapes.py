@@ -0,0 +1,46 @@
+'''
+****************************** Shapes of DAG Tasks ************************
+* Author:       Muhammad Junaid Aslam
+* Contact:      junaidaslam1@gmail.com
+* ---------------------------------------------------------------------
+* This software is governed by the No license. You can use, modify    |
+* and redistribute the software under the condition of citing  	      |
+* or crediting the authors of this software in your work.             |
+* ---------------------------------------------------------------------
+*
+* This is part of a research project funded by the EWI EEMCS Group of
+* Technical University of Delft, Netherlands.
+**********************************************************************************
+'''
+'''
+Besides the fork-join shapes of the expansion, the generator gives DAG tasks the shapes of two common families of
+synthetic DAGs. The edges between the vertices of such a DAG are drawn in bulk from a RandomSource as a boolean
+adjacency matrix. Its vertices are in a topological order, i.e. there are only edges (i, j) with i < j.
+LAYERED: The vertices are distributed over a number of layers, an edge goes from a vertex to each vertex of a later
+		 layer with the given probability (layer-by-layer random DAGs).
+GNP: 	 An edge goes from a vertex to each later vertex with the given probability (G(n,p) DAGs).
+'''
+import numpy as np
+
+DAG_SHAPES = ("FJ", "LAYERED", "GNP")
+
+# This returns the layers of Count vertices in ascending order, each of the layers gets at least one vertex
+def getLayers(Source, Count, Layers):
+	Layers = max(1, min(Layers, Count))
+	Drawn = np.floor(Source.Uniforms(Count - Layers) * Layers).astype(np.int64)
+	return np.sort(np.concatenate((np.arange(Layers, dtype=np.int64), Drawn)))
+
+def getLayeredAdjacency(Source, Count, Layers, Probability):
+	Layer = getLayers(Source, Count, Layers)
+	return (Source.Uniforms((Count, Count)) < Probability) & (Layer[:, None] < Layer[None, :])
+
+def getGNPAdjacency(Source, Count, Probability):
+	return np.triu(Source.Uniforms((Count, Count)) < Probability, 1)
+
+# This returns the columns of the edges in each row of an adjacency matrix, i.e. the successors of each vertex,
+# or its predecessors for the transposed matrix
+def getAdjacencyLists(Adjacency):
+	Rows, Columns = np.nonzero(Adjacency)
+	Offsets = np.searchsorted(Rows, np.arange(len(Adjacency)+1)).tolist()
+	Columns = Columns.tolist()
+	return [Columns[Offsets[v]:Offsets[v+1]] for v in range(0, len(Adjacency))]
@@ -0,0 +1,382 @@
+'''
+******************************* Task Sets of DAG Tasks ***************************
+* Author:       Muhammad Junaid Aslam
+* Contact:      junaidaslam1@gmail.com
+* ---------------------------------------------------------------------
+* This software is governed by the No license. You can use, modify    |
+* and redistribute the software under the condition of citing  	      |
+* or crediting the authors of this software in your work.             |
+* ---------------------------------------------------------------------
+*
+* This is part of a research project funded by the EWI EEMCS Group of
+* Technical University of Delft, Netherlands.
+**********************************************************************************
+'''
+'''
+The task set files ('R', 'M', 'T' and 'V' rows) are read here for the generator, the job set converter, the response time
+analysis and the verification scripts. A file is parsed in one pass into a TaskSet of DAGTasks, which keep their vertices
+as NumPy columns and their predecessors as CSR arrays (PredOffsets and PredIDs: the predecessors of the vertex at position
+v are PredIDs[PredOffsets[v]:PredOffsets[v+1]]). The successors, the critical paths and the transitive closure of a task are
+only computed when they are asked for, once per task. The critical path engine also serves the NodeData lists of the scripts.
+'''
+import csv
+import numpy as np
+from math import ceil
+from dag_reachability import getTopologicalOrder_from_Successors, getClosureMasks
+
+MS_TO_US = 1000
+
+def ms2us(x):
+	return int(ceil(MS_TO_US * x))
+
+# This returns the WCET of the longest path from the root to each vertex, None for vertices not reachable from the root
+def getLongestPathWCETs(Successors, WCETs, Order):
+	Head = [None] * len(Successors)
+	Head[0] = WCETs[0]
+
+	for vertex in Order:
+		if Head[vertex] == None:
+			continue
+		for succ in Successors[vertex]:
+			lvHead = Head[vertex] + WCETs[succ]
+			if (Head[succ] == None) or (Head[succ] < lvHead):
+				Head[succ] = lvHead
+
+	return Head
+
+'''
+This function returns the critical paths, as lists of vertex indices, out of the longest path WCETs without enumerating
+all paths of the task. A vertex lies on a critical path if it reaches a sink of CRP_WCET through edges (u,v) with
+Head[u] + WCET(v) = Head[v]. The paths are returned in the order of a depth first traversal of the successors from the
+root vertex, i.e., the order in which the former path enumeration visited them. Note: There can be more than 1 critical paths.
+'''
+def getCriticalPaths_from_LongestPathWCETs(Successors, WCETs, Order, Head, CRP_WCET):
+	CriticalPaths = []
+	OnCriticalPath = [False] * len(Successors)
+
+	for vertex in reversed(Order):
+		if Head[vertex] == None:
+			continue
+		if len(Successors[vertex]) == 0:
+			OnCriticalPath[vertex] = (Head[vertex] == CRP_WCET)
+		else:
+			for succ in Successors[vertex]:
+				if OnCriticalPath[succ] and (Head[vertex] + WCETs[succ] == Head[succ]):
+					OnCriticalPath[vertex] = True
+					break
+
+	if OnCriticalPath[0] == False:
+		return CriticalPaths
+
+	if len(Successors[0]) == 0:
+		CriticalPaths.append([0])
+		return CriticalPaths
+
+	Path = [0]
+	lvSuccessors = [iter(Successors[0])]
+
+	while len(lvSuccessors) > 0:
+		succ = next(lvSuccessors[-1], None)
+
+		if succ == None:
+			lvSuccessors.pop()
+			Path.pop()
+		elif OnCriticalPath[succ] and (Head[Path[-1]] + WCETs[succ] == Head[succ]):
+			if len(Successors[succ]) == 0:
+				CriticalPaths.append(Path + [succ])
+			else:
+				Path.append(succ)
+				lvSuccessors.append(iter(Successors[succ]))
+
+	return CriticalPaths
+
+# The critical path WCET is the longest path WCET of the sinks reachable from the root
+def getCriticalPathWCET(Successors, Order, Head):
+	CriticalPaths_WCET = 0
+
+	for vertex in Order:
+		if (Head[vertex] != None) and (len(Successors[vertex]) == 0) and (CriticalPaths_WCET < Head[vertex]):
+			CriticalPaths_WCET = Head[vertex]
+
+	return CriticalPaths_WCET
+
+'''
+This is a high level call to getting the critical path WCET of a task given as a list of nodes in O(V+E). The critical
+paths themselves are only built when WantPaths is True, i.e., for the visuals or to keep critical path edges during NFJ conversion.
+'''
+def getCriticalPathInfo(TaskNodes, WantPaths=False):
+	CriticalPaths = []
+
+	Successors = [Node.Succ for Node in TaskNodes]
+	WCETs = [Node.WCET for Node in TaskNodes]
+
+	Order = getTopologicalOrder_from_Successors(Successors)
+	Head = getLongestPathWCETs(Successors, WCETs, Order)
+	CriticalPaths_WCET = getCriticalPathWCET(Successors, Order, Head)
+
+	if WantPaths == True:
+		for Path in getCriticalPaths_from_LongestPathWCETs(Successors, WCETs, Order, Head, CriticalPaths_WCET):
+			CriticalPaths.append([TaskNodes[vertex] for vertex in Path])
+
+	return CriticalPaths, CriticalPaths_WCET
+
+class DAGTask:
+	'''
+	A DAG task of a task set file. The vertices are kept in the order of their 'V' rows as the columns VID, r_min, r_max,
+	BCET, WCET and ResourceType (scaled as the file was read), the predecessors and the lazily built successors as CSR
+	arrays of vertex IDs and vertex positions respectively. The vertex IDs of a task are expected to be 1..n in the order
+	of the rows, as the generator writes them, so that the position of a vertex is its ID - 1.
+	The generator keeps its tasks in the same form (in milliseconds) with the path lengths of the vertices in Length.
+	'''
+	__slots__ = ('TID', 'Period', 'Deadline', 'Priority', 'VID', 'r_min', 'r_max', 'BCET', 'WCET', 'ResourceType', 'Length',\
+		'PredOffsets', 'PredIDs', 'SuccOffsets', 'SuccIndices', 'Successors', 'Order', 'Head', 'CRP_WCET', 'CRP', 'Closure')
+
+	def __init__(self, TID, Period, Deadline, Priority):
+		self.TID 			= TID
+		self.Period 		= Period
+		self.Deadline 		= Deadline
+		self.Priority 		= Priority
+		self.VID 			= []
+		self.r_min 			= []
+		self.r_max 			= []
+		self.BCET 			= []
+		self.WCET 			= []
+		self.ResourceType 	= []
+		self.Length 		= None
+		self.PredOffsets 	= [0]
+		self.PredIDs 		= []
+		self.SuccOffsets 	= None
+		self.SuccIndices 	= None
+		self.Successors 	= None
+		self.Order 			= None
+		self.Head 			= None
+		self.CRP_WCET 		= None
+		self.CRP 			= None
+		self.Closure 		= None
+
+	def __len__(self):
+		return len(self.VID)
+
+	def AddVertex(self, VID, r_min, r_max, BCET, WCET, ResourceType, Pred):
+		self.VID.append(VID)
+		self.r_min.append(r_min)
+		self.r_max.append(r_max)
+		self.BCET.append(BCET)
+		self.WCET.append(WCET)
+		self.ResourceType.append(ResourceType)
+		self.PredIDs.extend(Pred)
+		self.PredOffsets.append(len(self.PredIDs))
+
+	# The columns collected while reading the file are turned into arrays once the file is read
+	def Freeze(self):
+		self.VID 			= np.array(self.VID, dtype=np.int32)
+		self.r_min 			= np.array(self.r_min)
+		self.r_max 			= np.array(self.r_max)
+		self.BCET 			= np.array(self.BCET)
+		self.WCET 			= np.array(self.WCET)
+		self.ResourceType 	= np.array(self.ResourceType, dtype=np.int32)
+		self.PredOffsets 	= np.array(self.PredOffsets, dtype=np.int32)
+		self.PredIDs 		= np.array(self.PredIDs, dtype=np.int32)
+
+	# The copy shares nothing with the task, its caches are built again when they are asked for
+	def Clone(self):
+		Task = DAGTask(self.TID, self.Period, self.Deadline, self.Priority)
+		Task.VID 			= self.VID.copy()
+		Task.r_min 			= self.r_min.copy()
+		Task.r_max 			= self.r_max.copy()
+		Task.BCET 			= self.BCET.copy()
+		Task.WCET 			= self.WCET.copy()
+		Task.ResourceType 	= self.ResourceType.copy()
+		Task.Length 		= None if self.Length is None else self.Length.copy()
+		Task.PredOffsets 	= self.PredOffsets.copy()
+		Task.PredIDs 		= self.PredIDs.copy()
+		return Task
+
+	# The critical paths depend on the WCETs, the other caches on the edges only
+	def ClearCaches(self, Edges=True):
+		self.Head 		= None
+		self.CRP_WCET 	= None
+		self.CRP 		= None
+
+		if Edges == True:
+			self.SuccOffsets 	= None
+			self.SuccIndices 	= None
+			self.Successors 	= None
+			self.Order 			= None
+			self.Closure 		= None
+
+	# This removes the edge from the vertex at position Pred to the vertex at position vertex, False is returned if there is no such edge
+	def RemoveEdge(self, Pred, vertex):
+		Start = self.PredOffsets[vertex]
+		Found = np.flatnonzero(self.PredIDs[Start:self.PredOffsets[vertex+1]] == self.VID[Pred])
+
+		if len(Found) == 0:
+			return False
+
+		self.PredIDs = np.delete(self.PredIDs, Start + Found[0])
+		self.PredOffsets[vertex+1:] -= 1
+		self.ClearCaches()
+
+		return True
+
+	# This returns the predecessor IDs of each vertex as Python lists
+	def getPredecessorLists(self):
+		Offsets = self.PredOffsets.tolist()
+		PredIDs = self.PredIDs.tolist()
+		return [PredIDs[Offsets[v]:Offsets[v+1]] for v in range(0, len(self))]
+
+	# This returns the predecessor positions of a vertex
+	def getPredecessors(self, vertex):
+		return (self.PredIDs[self.PredOffsets[vertex]:self.PredOffsets[vertex+1]] - 1).tolist()
+
+	'''
+	The successors are the predecessor edges sorted w.r.t their sources by a stable sort, so that the successors of a
+	vertex are in the order of the rows which name it as a predecessor.
+	'''
+	def getSuccessorArrays(self):
+		if self.SuccOffsets is None:
+			Sources = self.PredIDs - 1
+			Targets = np.repeat(np.arange(len(self), dtype=np.int64), np.diff(self.PredOffsets))
+			self.SuccIndices = Targets[np.argsort(Sources, kind='stable')]
+			self.SuccOffsets = np.zeros(len(self)+1, dtype=np.int64)
+			np.cumsum(np.bincount(Sources, minlength=len(self)), out=self.SuccOffsets[1:])
+		return self.SuccOffsets, self.SuccIndices
+
+	# This returns the successor positions of each vertex as Python lists
+	def getSuccessorLists(self):
+		if self.Successors is None:
+			SuccOffsets, SuccIndices = self.getSuccessorArrays()
+			Offsets = SuccOffsets.tolist()
+			Indices = SuccIndices.tolist()
+			self.Successors = [Indices[Offsets[v]:Offsets[v+1]] for v in range(0, len(self))]
+		return self.Successors
+
+	def getSuccessors(self, vertex):
+		return self.getSuccessorLists()[vertex]
+
+	def getTopologicalOrder(self):
+		if self.Order is None:
+			self.Order = getTopologicalOrder_from_Successors(self.getSuccessorLists())
+		return self.Order
+
+	# This returns the critical paths as lists of vertex positions (only when WantPaths is True) and the critical path WCET
+	def getCriticalPathInfo(self, WantPaths=False):
+		if self.Head is None:
+			Successors = self.getSuccessorLists()
+			self.Head = getLongestPathWCETs(Successors, self.WCET.tolist(), self.getTopologicalOrder())
+			self.CRP_WCET = getCriticalPathWCET(Successors, self.Order, self.Head)
+
+		if (WantPaths == True) and (self.CRP is None):
+			self.CRP = getCriticalPaths_from_LongestPathWCETs(self.getSuccessorLists(), self.WCET.tolist(), self.Order, self.Head, self.CRP_WCET)
+
+		return (self.CRP if WantPaths == True else []), self.CRP_WCET
+
+	# This returns the ancestor and descendant masks of the vertices reachable from the root and the mask of the reached vertices
+	def getClosure(self):
+		if self.Closure is None:
+			self.Closure = getClosureMasks(self.getSuccessorLists(), self.getTopologicalOrder())
+		return self.Closure
+
+class TaskSet:
+	def __init__(self):
+		self.RSC_Type 	= 0
+		self.Cores 		= []
+		self.Tasks 		= []
+
+'''
+This function reads a task set file in one pass. The periods, deadlines, release times and execution times are scaled
+with 'scale' and the priority is scaled as well when it equals the deadline. The task set files of the ECRTS_19 paper have
+no resource type column, they are read with ResourceTypeColumn=False and all of their vertices are of resource type 1.
+'''
+def ReadTaskSetFile(FileName, scale=ms2us, ResourceTypeColumn=True):
+	lvTaskSet = TaskSet()
+	Tasks = {}
+	PredColumn = 8 if ResourceTypeColumn == True else 7
+
+	with open(FileName, 'r') as FP:
+		for row in csv.reader(FP, skipinitialspace=True):
+			if row[0] == 'R':
+				lvTaskSet.RSC_Type = int(row[1])
+			elif row[0] == 'M':
+				lvTaskSet.Cores.append(int(row[1]))
+			elif row[0] == '#':
+				continue
+			elif row[0] == 'T':
+				# A 'T' row consists of: 'T', a unique numeric ID, the period, the relative deadline and the priority
+				# The priority is taken from the deadline when the row has no priority column (ECRTS_19 task sets)
+				Task = DAGTask(int(row[1]), scale(float(row[2])), scale(float(row[3])), int(row[4]) if len(row) > 4 else int(row[3]))
+
+				if Task.Priority == int(row[3]):
+					Task.Priority = scale(Task.Priority)
+
+				assert Task.TID >= 0
+				assert Task.Period > 0
+				assert Task.Deadline > 0
+
+				Tasks[Task.TID] = Task
+				lvTaskSet.Tasks.append(Task)
+			elif row[0] == 'V':
+				# A 'V' row consists of: 'V', the task ID, a numeric vertex ID (unique w.r.t its task), r^min, r^max, BCET, WCET,
+				# the resource type and the predecessors (vertex IDs), if any
+				TID 	= int(row[1])
+				VID 	= int(row[2])
+				r_min 	= scale(float(row[3]))
+				r_max 	= scale(float(row[4]))
+				BCET 	= scale(float(row[5]))
+				WCET 	= scale(float(row[6]))
+				RSC 	= int(row[7]) if ResourceTypeColumn == True else 1
+
+				assert 0 <= r_min <= r_max
+				assert 0 <= BCET <= WCET
+				assert VID >= 0
+				assert TID >= 0
+
+				Tasks[TID].AddVertex(VID, r_min, r_max, BCET, WCET, RSC, [int(Pred) for Pred in row[PredColumn:] if Pred != ''])
+			else:
+				print(row)
+				assert False # badly formatted input???
+
+	for Task in lvTaskSet.Tasks:
+		Task.Freeze()
+
+	return lvTaskSet
+
+'''
+This fills the TaskData and NodeData objects of the analysis and verification scripts out of a task set. These index the
+nodes of a task by their JIDs, hence the TIDs, JIDs and predecessor IDs are decreased by 1 and the successors are the
+vertex positions. Final results can be reported for each vertex by increasing the JIDs and TIDs by 1 again.
+The critical paths are kept as lists of nodes along with their WCET.
+'''
+def getTaskSetInfo(lvTaskSet, TaskData, NodeData):
+	TaskSetInfo = []
+
+	for Task in lvTaskSet.Tasks:
+		lvTask = TaskData()
+		lvTask.TID 		= Task.TID
+		lvTask.Period 	= Task.Period
+		lvTask.Deadline = Task.Deadline
+		lvTask.Priority = Task.Priority
+
+		Pred = Task.getPredecessorLists()
+		Succ = Task.getSuccessorLists()
+		Columns = zip(Task.VID.tolist(), Task.r_min.tolist(), Task.r_max.tolist(), Task.BCET.tolist(), Task.WCET.tolist(), Task.ResourceType.tolist())
+
+		for vertex, (VID, r_min, r_max, BCET, WCET, RSC) in enumerate(Columns):
+			Node = NodeData()
+			Node.TID 			= Task.TID - 1
+			Node.JID 			= VID - 1
+			Node.r_min 			= r_min
+			Node.r_max 			= r_max
+			Node.BCET 			= BCET
+			Node.WCET 			= WCET
+			Node.ResourceType 	= RSC
+			Node.Pred 			= [ID - 1 for ID in Pred[vertex]]
+			Node.Succ 			= Succ[vertex].copy()
+			lvTask.Nodes.append(Node)
+
+		CRP, lvTask.CRP_WCET = Task.getCriticalPathInfo(WantPaths=True)
+		lvTask.CRP = [[lvTask.Nodes[vertex] for vertex in Path] for Path in CRP]
+
+		TaskSetInfo.append(lvTask)
+
+	return TaskSetInfo
@@ -0,0 +1,426 @@
+"""
+Expansion of DAG task sets into job sets + edge lists for the schedulability analysis.
+
+This is the importable part of dag-tasks-to-jobs_hetero.py, so that the task set
+generator can expand job sets in-process, straight from the task sets it holds in memory.
+A task set is the tuple returned by parse_dag_task_file():
+
+    (periods, deadlines, priorities, nodes, max_rcst, nodes_per_resource)
+
+The jobs and edges of a job set are kept as int64 NumPy arrays, one row per job
+(in the order of JOB_COLUMNS) and one row per edge (from TID, from JID, to TID, to JID).
+"""
+
+import csv
+import heapq
+
+from math import ceil, log10
+
+from collections import defaultdict
+
+import fractions
+
+import numpy as np
+
+from dag_task_set import ReadTaskSetFile
+
+US_TO_NS = 1000
+MS_TO_US = 1000
+MS_TO_MS = 1
+DUMMY_NUMBER    =   99999
+
+def next_power_of_10(x):
+    return 10**(ceil(log10(x)))
+
+def ms2us(x):
+    # return int(ceil(MS_TO_US * x))
+    return int(ceil(MS_TO_US * x))
+
+def lcm(a,b):
+    return abs(a * b) // fractions.gcd(a,b) if a and b else 0
+
+def hyperperiod(periods):
+    h = 1
+    for p in periods:
+        h = lcm(h, p)
+    return h
+
+def parse_dag_task_file(fname, scale=ms2us):
+    # the task set is read by the parser shared with the other scripts and turned into the task set tuple
+    task_set = ReadTaskSetFile(fname, scale)
+    periods = {}
+    deadlines = {}
+    priorities = {}
+    nodes = defaultdict(list)
+    max_rcst = task_set.RSC_Type + 1
+    nodes_per_resource = {0: 0}
+
+    for (i, cores) in enumerate(task_set.Cores):
+        nodes_per_resource[i + 1] = cores
+
+    for task in task_set.Tasks:
+        assert task.Priority != DUMMY_NUMBER
+
+        periods[task.TID] = task.Period
+        deadlines[task.TID] = task.Deadline
+        priorities[task.TID] = task.Priority
+
+        if len(task) > 0:
+            max_rcst = max(max_rcst, int(task.ResourceType.max()))
+
+        nodes[task.TID].extend(zip(task.VID.tolist(), task.r_min.tolist(), task.r_max.tolist(), task.BCET.tolist(),
+                                   task.WCET.tolist(), task.ResourceType.tolist(), task.getPredecessorLists()))
+
+    return (periods, deadlines, priorities, nodes, max_rcst, nodes_per_resource)
+
+def mkedges(tid, num_task_instances, nodes, first_instance=0):
+    # the edge template of one instance in terms of vertex positions, shifted by the first job ID of each instance
+    vid2pos  = {vid: pos for (pos, (vid, r_min, r_max, bcet, wcet, rcst, preds)) in enumerate(nodes)}
+    template = np.array([(vid2pos[p], pos) for (pos, node) in enumerate(nodes) for p in node[6]],
+                        dtype=np.int64).reshape(-1, 2)
+    base = np.arange(first_instance, first_instance + num_task_instances, dtype=np.int64) * next_power_of_10(len(nodes)) + 1
+
+    edges = np.empty((num_task_instances, len(template), 4), dtype=np.int64)
+    edges[:, :, 0] = tid
+    edges[:, :, 1] = base[:, None] + template[:, 0]
+    edges[:, :, 2] = tid
+    edges[:, :, 3] = base[:, None] + template[:, 1]
+
+    return edges.reshape(-1, 4)
+
+def mkjobs(tid, num_task_instances, period, deadline, priority, nodes, mkprio, first_instance=0):
+    # the vertices of the task as column arrays, one entry per vertex
+    cols  = np.array([(r_min, r_max, bcet, wcet, rcst) for (vid, r_min, r_max, bcet, wcet, rcst, preds) in nodes],
+                     dtype=np.int64).reshape(-1, 5)
+    r_min, r_max, bcet, wcet, rcst = cols.T
+
+    # release times, absolute deadlines and priorities of the instances
+    instances = np.arange(first_instance, first_instance + num_task_instances, dtype=np.int64)
+    rel  = instances * period
+    adl  = rel + deadline
+    prio = np.broadcast_to(np.asarray(mkprio(tid, adl, period), dtype=np.int64), adl.shape)
+    # the first job ID of each instance, the vertices follow it in their order
+    base = instances * next_power_of_10(len(nodes)) + 1
+
+    jobs = np.empty((num_task_instances, len(nodes), 9), dtype=np.int64)
+    jobs[:, :, 0] = base[:, None] + np.arange(len(nodes), dtype=np.int64)
+    jobs[:, :, 1] = rel[:, None] + r_min
+    jobs[:, :, 2] = rel[:, None] + r_max
+    jobs[:, :, 3] = bcet
+    jobs[:, :, 4] = wcet
+    jobs[:, :, 5] = adl[:, None]
+    jobs[:, :, 6] = prio[:, None]
+    jobs[:, :, 7] = rcst
+    jobs[:, :, 8] = tid
+
+    return jobs.reshape(-1, 9), mkedges(tid, num_task_instances, nodes, first_instance)
+
+# The columns of a job, i.e., of a row of the jobs array, in the order returned by mkjobs
+JOB_COLUMNS = ("Job ID", "Arrival min", "Arrival max", "Cost min", "Cost max",
+               "Deadline", "Priority", "ResourceType", "Task ID")
+
+# The CSV rows start with the task ID
+JOB_CSV_ORDER  = [8, 0, 1, 2, 3, 4, 5, 6, 7]
+JOB_CSV_FORMAT = "%10d, %10d, %20d, %20d, %20d, %20d, %20d, %20d, %20d"
+
+JOBS_CSV_HEADER = \
+    "{7:>10s}, {0:>10s}, {1:>20s}, {2:>20s}, {3:>20s}, {4:>20s}, {5:>20s}, " \
+    "{6:>20s}, {8:>20s}\n".format(
+        "Job ID", "Arrival min", "Arrival max", "Cost min", "Cost max",
+        "Deadline", "Priority", "Task ID", "ResourceType")
+
+def write_jobs_header(f, max_rcst, nodes_per_resource):
+    Rcst = "ResourceTypes, " + str((max_rcst))+"\n"
+    f.write(Rcst)
+
+    for i in range(0, max_rcst):
+        lvStr = "M"+str(i)+", "+str(nodes_per_resource[i])+"\n"
+        f.write(lvStr)
+    
+    lvStr = "#\n"
+    f.write(lvStr)
+    f.write(JOBS_CSV_HEADER)
+
+def write_jobs(fname, jobs, max_rcst, nodes_per_resource):
+    f = open(fname, 'w')
+    write_jobs_header(f, max_rcst, nodes_per_resource)
+    np.savetxt(f, jobs[:, JOB_CSV_ORDER], fmt=JOB_CSV_FORMAT)
+    f.close()
+
+EDGES_CSV_HEADER = \
+    "{0:>8s}, {1:>8s}, {2:>8s}, {3:>8s}\n".format(
+        "From TID",	"From JID",	"To TID", "To JID")
+
+EDGE_CSV_FORMAT = "%8d, %8d, %8d, %8d"
+
+def write_edges(fname, edges):
+    f = open(fname, 'w')
+    f.write(EDGES_CSV_HEADER)
+    np.savetxt(f, edges, fmt=EDGE_CSV_FORMAT)
+    f.close()
+
+def prio_table(params):
+    p = [(params[tid], tid) for tid in params]
+    p.sort()
+    lut = {}
+    for i, (_, tid) in enumerate(p):
+        lut[tid] = i + 1
+    return lut
+
+def mkprio_for_policy(policy, periods, deadlines, priorities):
+    rm_table = prio_table(periods)
+    dm_table = prio_table(deadlines)
+
+    if policy == 'EDF':
+        mkprio = lambda tid, deadline, period: deadline # EDF by default
+    elif policy == 'RM':
+        mkprio = lambda tid, deadline, period: rm_table[tid]
+    elif policy == 'DM':
+        mkprio = lambda tid, deadline, period: dm_table[tid]
+    elif policy == 'FP':
+        # FP == fixed priority => just re-use the given task ID as priority
+        mkprio = lambda tid, deadline, period: tid
+    elif policy == 'NC':
+        # NC ==> NC says to use distinct task priorities set w.r.t priod values and use EDF to set for jobs
+        mkprio = lambda tid, deadline, period: priorities[tid]
+    else:
+        assert False # unsupported prio order
+
+    return mkprio
+
+def expand_job_set(task_set, policy='EDF'):
+    (periods, deadlines, priorities, nodes, max_rcst, nodes_per_resource) = task_set
+
+    h = hyperperiod(periods.values())
+
+    mkprio = mkprio_for_policy(policy, periods, deadlines, priorities)
+
+    all_jobs  = [np.empty((0, 9), dtype=np.int64)]
+    all_edges = [np.empty((0, 4), dtype=np.int64)]
+
+    for tid in periods:
+        if nodes[tid]:
+            per = periods[tid]
+            dl  = deadlines[tid]
+            pr  = priorities[tid]
+            jobs, edges = mkjobs(tid, h // per, per, dl, pr, nodes[tid], mkprio)
+            all_jobs.append(jobs)
+            all_edges.append(edges)
+
+    all_jobs  = np.concatenate(all_jobs)
+    all_edges = np.concatenate(all_edges)
+
+    # a stable sort w.r.t the earliest arrival, the same as sorting the list of job tuples
+    all_jobs = all_jobs[np.argsort(all_jobs[:, 1], kind='stable')]
+
+    return all_jobs, all_edges
+
+def write_job_set(task_set, jobs_file, edges_file, policy='EDF', binary_file=None):
+    (periods, deadlines, priorities, nodes, max_rcst, nodes_per_resource) = task_set
+
+    jobs, edges = expand_job_set(task_set, policy)
+
+    write_jobs(jobs_file, jobs, max_rcst, nodes_per_resource)
+    write_edges(edges_file, edges)
+
+    if binary_file is not None:
+        write_job_set_binary(binary_file, jobs, edges, max_rcst, nodes_per_resource)
+
+# The number of job rows held back before they are written in the streaming mode
+STREAM_BUFFER_ROWS = 65536
+
+def task_jobs_in_arrival_order(tid, num_task_instances, period, deadline, priority, nodes, mkprio, chunk):
+    """
+    Yields the jobs of one task lazily as (arrival, job ID, row) in the order of the
+    stable arrival sort, i.e., w.r.t (arrival, instance, vertex position). The instances
+    are expanded 'chunk' at a time. A job is held back only as long as a later instance
+    may still release a job before it, since the jobs of instance i cannot arrive before
+    i * period + min(r_min).
+    """
+    min_r_min = min(r_min for (vid, r_min, r_max, bcet, wcet, rcst, preds) in nodes)
+    pending = []
+    for first in range(0, num_task_instances, chunk):
+        jobs, _ = mkjobs(tid, min(chunk, num_task_instances - first), period, deadline, priority, nodes, mkprio, first)
+        for j in jobs.tolist():
+            heapq.heappush(pending, (j[1], j[0], j))
+        # the jobs of the instances from 'first + chunk' on arrive at or after this point
+        limit = (first + chunk) * period + min_r_min
+        while pending and pending[0][0] <= limit:
+            yield heapq.heappop(pending)
+    while pending:
+        yield heapq.heappop(pending)
+
+def write_job_set_streaming(task_set, jobs_file, edges_file, policy='EDF', buffer_rows=STREAM_BUFFER_ROWS, binary_file=None):
+    """
+    Same files as write_job_set(), but the job set is never materialized: the jobs of
+    each task are produced lazily in arrival order and merged with a heap, and rows are
+    written in chunks of at most buffer_rows. The peak memory is O(number of tasks + buffer)
+    instead of O(jobs per hyperperiod). The chunks also go to the binary job set file,
+    whose counts are known from the task set before the first chunk is written.
+    """
+    (periods, deadlines, priorities, nodes, max_rcst, nodes_per_resource) = task_set
+
+    h = hyperperiod(periods.values())
+
+    mkprio = mkprio_for_policy(policy, periods, deadlines, priorities)
+
+    tids = [tid for tid in periods if nodes[tid]]
+    # instances per expansion step, such that all tasks together stay within the buffer
+    chunks = {tid: max(1, buffer_rows // (len(tids) * len(nodes[tid]))) for tid in tids}
+
+    # the task index breaks ties among tasks in the order the job tuples were sorted
+    def tagged(index, tid):
+        for (arrival, jid, j) in task_jobs_in_arrival_order(tid, h // periods[tid], periods[tid], deadlines[tid],
+                                                            priorities[tid], nodes[tid], mkprio, chunks[tid]):
+            yield (arrival, index, jid, j)
+
+    streams = [tagged(index, tid) for (index, tid) in enumerate(tids)]
+
+    num_edges = {tid: sum(len(preds) for (vid, r_min, r_max, bcet, wcet, rcst, preds) in nodes[tid]) for tid in tids}
+
+    fb = None
+    if binary_file is not None:
+        fb = open(binary_file, 'wb')
+        write_job_set_binary_header(fb, sum((h // periods[tid]) * len(nodes[tid]) for tid in tids),
+                                    sum((h // periods[tid]) * num_edges[tid] for tid in tids), max_rcst, nodes_per_resource)
+
+    def write_job_rows(f, buffer):
+        jobs = np.array(buffer, dtype=np.int64).reshape(-1, 9)
+        np.savetxt(f, jobs[:, JOB_CSV_ORDER], fmt=JOB_CSV_FORMAT)
+        if fb is not None:
+            fb.write(job_records(jobs).tobytes())
+
+    f = open(jobs_file, 'w')
+    write_jobs_header(f, max_rcst, nodes_per_resource)
+    buffer = []
+    for (_, _, _, j) in heapq.merge(*streams):
+        buffer.append(j)
+        if len(buffer) >= buffer_rows:
+            write_job_rows(f, buffer)
+            buffer = []
+    if buffer:
+        write_job_rows(f, buffer)
+    f.close()
+
+    f = open(edges_file, 'w')
+    f.write(EDGES_CSV_HEADER)
+    for tid in tids:
+        chunk = max(1, buffer_rows // max(1, num_edges[tid]))
+        for first in range(0, h // periods[tid], chunk):
+            edges = mkedges(tid, min(chunk, h // periods[tid] - first), nodes[tid], first)
+            np.savetxt(f, edges, fmt=EDGE_CSV_FORMAT)
+            if fb is not None:
+                fb.write(edge_records(edges).tobytes())
+    f.close()
+
+    if fb is not None:
+        fb.close()
+
+# Binary job set container
+#
+# A job set and its edges in one file, laid out as:
+#
+#   1) JOB_SET_MAGIC (8 bytes)
+#   2) header length, number of jobs, number of edges (little-endian uint64 each)
+#   3) the header: the 'ResourceTypes' and 'M' rows of the jobs CSV file, padded to 8 bytes
+#   4) the jobs as JOB_DTYPE records, in the row order of the jobs CSV file
+#   5) the edges as EDGE_DTYPE records, in the row order of the edges CSV file
+#
+# The records are read back as read-only memory maps, without any parsing.
+
+JOB_SET_MAGIC = b"DAGJOBS1"
+JOB_SET_BINARY_EXT = ".bin"
+
+JOB_DTYPE = np.dtype([
+    ("task_id", "<i4"), ("job_id", "<i8"),
+    ("arrival_min", "<i8"), ("arrival_max", "<i8"),
+    ("cost_min", "<i8"), ("cost_max", "<i8"),
+    ("deadline", "<i8"), ("priority", "<i8"),
+    ("resource_type", "<i4")])
+
+EDGE_DTYPE = np.dtype([
+    ("from_tid", "<i4"), ("from_jid", "<i8"),
+    ("to_tid", "<i4"), ("to_jid", "<i8")])
+
+COUNTS_DTYPE = np.dtype("<u8")
+
+def job_records(jobs):
+    records = np.empty(len(jobs), dtype=JOB_DTYPE)
+    for (name, col) in zip(JOB_DTYPE.names, JOB_CSV_ORDER):
+        records[name] = jobs[:, col]
+    return records
+
+def edge_records(edges):
+    records = np.empty(len(edges), dtype=EDGE_DTYPE)
+    for (col, name) in enumerate(EDGE_DTYPE.names):
+        records[name] = edges[:, col]
+    return records
+
+def records_to_rows(records):
+    # the records as int64 rows with the columns of the CSV files
+    return np.stack([records[name].astype(np.int64) for name in records.dtype.names], axis=1)
+
+def write_job_set_binary_header(f, num_jobs, num_edges, max_rcst, nodes_per_resource):
+    header = "ResourceTypes, " + str(max_rcst) + "\n"
+    for i in range(0, max_rcst):
+        header += "M" + str(i) + ", " + str(nodes_per_resource[i]) + "\n"
+    header = header.encode('ascii')
+    header += b" " * (-len(header) % 8)
+
+    f.write(JOB_SET_MAGIC)
+    f.write(np.array([len(header), num_jobs, num_edges], dtype=COUNTS_DTYPE).tobytes())
+    f.write(header)
+
+def write_job_set_binary(fname, jobs, edges, max_rcst, nodes_per_resource):
+    f = open(fname, 'wb')
+    write_job_set_binary_header(f, len(jobs), len(edges), max_rcst, nodes_per_resource)
+    f.write(job_records(jobs).tobytes())
+    f.write(edge_records(edges).tobytes())
+    f.close()
+
+def read_job_set_binary(fname):
+    """
+    Returns (jobs, edges, max_rcst, nodes_per_resource) of a binary job set file,
+    where jobs and edges are read-only memory-mapped record arrays.
+    """
+    f = open(fname, 'rb')
+    magic = f.read(len(JOB_SET_MAGIC))
+    assert magic == JOB_SET_MAGIC # not a binary job set file???
+    (header_len, num_jobs, num_edges) = np.frombuffer(f.read(3 * COUNTS_DTYPE.itemsize), dtype=COUNTS_DTYPE).tolist()
+    header = f.read(header_len).decode('ascii')
+    f.close()
+
+    max_rcst = 0
+    nodes_per_resource = {}
+    for row in csv.reader(header.split("\n"), skipinitialspace=True):
+        if not row or not row[0].strip():
+            continue
+        elif row[0] == 'ResourceTypes':
+            max_rcst = int(row[1])
+        else:
+            nodes_per_resource[int(row[0][1:])] = int(row[1])
+
+    offset = len(JOB_SET_MAGIC) + 3 * COUNTS_DTYPE.itemsize + header_len
+    jobs = np.memmap(fname, dtype=JOB_DTYPE, mode='r', offset=offset, shape=(num_jobs,)) \
+        if num_jobs else np.empty(0, dtype=JOB_DTYPE)
+    offset += num_jobs * JOB_DTYPE.itemsize
+    edges = np.memmap(fname, dtype=EDGE_DTYPE, mode='r', offset=offset, shape=(num_edges,)) \
+        if num_edges else np.empty(0, dtype=EDGE_DTYPE)
+
+    return jobs, edges, max_rcst, nodes_per_resource
+
+def job_set_binary_to_csv(fname, jobs_file, edges_file, buffer_rows=STREAM_BUFFER_ROWS):
+    # writes the jobs and edges CSV files expected by nptest, buffer_rows at a time
+    jobs, edges, max_rcst, nodes_per_resource = read_job_set_binary(fname)
+
+    f = open(jobs_file, 'w')
+    write_jobs_header(f, max_rcst, nodes_per_resource)
+    for first in range(0, len(jobs), buffer_rows):
+        np.savetxt(f, records_to_rows(jobs[first:first + buffer_rows]), fmt=JOB_CSV_FORMAT)
+    f.close()
+
+    f = open(edges_file, 'w')
+    f.write(EDGES_CSV_HEADER)
+    for first in range(0, len(edges), buffer_rows):
+        np.savetxt(f, records_to_rows(edges[first:first + buffer_rows]), fmt=EDGE_CSV_FORMAT)
+    f.close()
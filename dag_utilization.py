@@ -0,0 +1,114 @@
+'''
+****************************** Utilizations of DAG Tasks ************************
+* Author:       Muhammad Junaid Aslam
+* Contact:      junaidaslam1@gmail.com
+* ---------------------------------------------------------------------
+* This software is governed by the No license. You can use, modify    |
+* and redistribute the software under the condition of citing  	      |
+* or crediting the authors of this software in your work.             |
+* ---------------------------------------------------------------------
+*
+* This is part of a research project funded by the EWI EEMCS Group of
+* Technical University of Delft, Netherlands.
+**********************************************************************************
+'''
+'''
+RandFixSum (R. Stafford, "Random vectors with fixed sum", 2006) draws vectors of Count values in [Low, High] with a
+fixed Total, uniformly distributed over that part of the simplex. With Low = 0 these are the vectors UUniFast-Discard
+accepts, but without discarding any of them. The Sets vectors are drawn at once, the only loop runs over the Count
+dimensions. The transition table of the simplices is built as in Stafford's randfixedsum.m.
+The splits of UUniFast are uniformly distributed over the simplex as well, i.e. they follow a flat Dirichlet distribution.
+A UUniFastPool draws them in batches as normalized exponential spacings and keeps a batch for each number of parts.
+A split of 1 is scaled to the quantity it is asked for, so the pool of a number of parts serves all quantities. A batch
+starts small and doubles with each refill up to about Values numbers, so a number of parts which is rarely asked for
+draws few splits, and only the batches of the Counts most recently asked numbers of parts are kept.
+'''
+import numpy as np
+
+DEFAULT_POOL_VALUES = 1 << 16
+DEFAULT_POOL_COUNTS = 64 # Numbers of parts whose batches are kept
+DEFAULT_POOL_SPLITS = 16 # Splits of the first batch of a number of parts
+
+def RandFixSum(Source, Count, Total, Sets, Low=0.0, High=1.0):
+	Sum = (Total - Count*Low) / (High - Low)
+
+	# A sum at the bounds of the box leaves only one vector
+	if (Count == 1) or (Sum <= 0) or (Sum >= Count):
+		Value = Total/Count if Count == 1 else (Low if Sum <= 0 else High)
+		return np.full((Sets, Count), float(Value))
+
+	k = max(min(int(np.floor(Sum)), Count-1), 0)
+	s1 = Sum - np.arange(k, k-Count, -1, dtype=float)
+	s2 = np.arange(k+Count, k, -1, dtype=float) - Sum
+
+	Tiny = np.finfo(float).tiny
+	w = np.zeros((Count, Count+1))
+	w[0, 1] = np.finfo(float).max
+	t = np.zeros((Count-1, Count))
+
+	for i in range(2, Count+1):
+		tmp1 = w[i-2, 1:i+1] * s1[0:i] / i
+		tmp2 = w[i-2, 0:i] * s2[Count-i:Count] / i
+		w[i-1, 1:i+1] = tmp1 + tmp2
+		tmp3 = w[i-1, 1:i+1] + Tiny
+		tmp4 = s2[Count-i:Count] > s1[0:i]
+		t[i-2, 0:i] = (tmp2 / tmp3) * tmp4 + (1 - tmp1 / tmp3) * (~tmp4)
+
+	rt = Source.Uniforms((Count-1, Sets)) # the simplex of the next dimension
+	rs = Source.Uniforms((Count-1, Sets)) # the position in the simplex
+
+	s = np.full(Sets, Sum)
+	j = np.full(Sets, k+1, dtype=np.int64)
+	sm = np.zeros(Sets)
+	pr = np.ones(Sets)
+	x = np.zeros((Count, Sets))
+
+	for i in range(Count-1, 0, -1):
+		e = rt[Count-i-1] <= t[i-1, j-1]
+		sx = rs[Count-i-1] ** (1.0 / i)
+		sm = sm + (1.0 - sx) * pr * s / (i+1)
+		pr = sx * pr
+		x[Count-i-1] = sm + pr * e
+		s = s - e
+		j = j - e
+
+	x[Count-1] = sm + pr * s
+
+	# The values come out in the order of the dimensions, so each vector is shuffled
+	Order = np.argsort(Source.Uniforms((Sets, Count)), axis=1)
+	return Low + (High - Low) * np.take_along_axis(x.T, Order, axis=1)
+
+# This returns Sets splits of 1 into Count parts as the rows of a matrix
+def UUniFastSplits(Source, Count, Sets):
+	Spacings = -np.log1p(-Source.Uniforms((Sets, Count)))
+	return Spacings / Spacings.sum(axis=1, keepdims=True)
+
+class UUniFastPool:
+	def __init__(self, Source, Values=DEFAULT_POOL_VALUES, Counts=DEFAULT_POOL_COUNTS):
+		self.Source = Source
+		self.Values = Values
+		self.Counts = Counts
+		self.Pools 	= {}
+
+	# This returns the next split of Quantity into Count parts, a larger batch is drawn when it runs out
+	def Split(self, Count, Quantity):
+		if Count <= 1:
+			return [Quantity]
+
+		# The pool of a number of parts holds its batch, the next row to be served and the number of rows of the next batch,
+		# it is taken out and put back so that the pools are kept in the order they were last asked for
+		Pool = self.Pools.pop(Count, None)
+		if Pool == None:
+			Pool = [None, 0, max(1, min(DEFAULT_POOL_SPLITS, self.Values // Count))]
+		if (Pool[0] is None) or (Pool[1] == len(Pool[0])):
+			Pool[0] = UUniFastSplits(self.Source, Count, Pool[2])
+			Pool[1] = 0
+			Pool[2] = max(Pool[2], min(2 * Pool[2], self.Values // Count))
+
+		self.Pools[Count] = Pool
+		if len(self.Pools) > self.Counts:
+			del self.Pools[next(iter(self.Pools))]
+
+		Split = Pool[0][Pool[1]]
+		Pool[1] += 1
+		return (Quantity * Split).tolist()
@@ -36,11 +36,22 @@ import subprocess
 import datetime
 import sys
 import os
-import threading
-import copy
+import multiprocessing
+import contextlib
+import io
+import json
+import glob
 import random
 from fractions import gcd
 from functools import reduce
+from dag_task_set import DAGTask, getCriticalPathInfo
+from dag_reachability import AncestorIndex
+from dag_random import RandomSource, getChoiceTable
+from dag_profile import GenerationProfile
+from dag_utilization import RandFixSum, UUniFastPool
+from dag_shapes import DAG_SHAPES, getLayeredAdjacency, getGNPAdjacency, getAdjacencyLists
+from dag_tasks_to_jobs import ms2us, write_job_set, JOB_SET_BINARY_EXT
+from collections import defaultdict
 
 # MACRO definitions for the visualization tool
 RSC0_COLOR = "blue"
@@ -68,7 +79,9 @@ DEFAULT_TASK_EXPANSION_TRIES = DUMMY_NUMBER
 DEFAULT_TASK_GENERATION_TRIES = 1000000
 DEFAULT_FEASIBLE_TASK_GENERATION_TRIES = 25000
 DEFAULT_TASK_UUFD_TRIES = DUMMY_NUMBER
+DEFAULT_RFS_CANDIDATES = 64 # Utilization vectors drawn at once by RandFixSum
 DEFAULT_MIN_REQUIRED_FEASIBILITY = 0.000 
+SEED_STATE_WORDS = 4 # 32-bit words of the seed of a cell or workload stream
 LONGEST_JOB_PATH_COLOR = 11
 LONGEST_WCET_PATH_COLOR = 12
 IS_TERMINAL =   1
@@ -84,6 +97,7 @@ WANT_ALL_RSC_TYPE_NODES = False
 WANT_GRAPH = False
 WANT_JOBSET = False
 WANT_TASKJOB_SET = False
+WANT_BINARY_JOBSET = False
 WANT_HETEROGENEOUS  =   False
 WANT_CRITICAL_PATH_JOBS  =   False
 WANT_CRITICAL_PATH_WCET  =   False
@@ -103,11 +117,19 @@ PERIOD_ASSIGNMENT = ""
 PERIODS_ARRAY = []
 PRIORITY_ARRAY = []
 PRIORITY_POLICY = ""
-MULTI_THREADING = False
+WORKERS = 0
 EQUAL_DEADLINE_TASKS_GENERATION = True
 EQUAL_PRIORITY_TASKS_GENERATION = False
 DEFAULT_ECRTS_19_MIN_PERIOD		= 500
 NON_NESTED_FORK_JOIN	=	False
+CONSTRUCTIVE_GENERATION = False
+DAG_SHAPE = "FJ"
+SEED = None
+CELL = None
+RESUME = False
+COMPLETED_RUNS = {}
+# The stages and rejections of the generation are recorded per (utilization, task count) cell, see dag_profile.py
+PROFILE = GenerationProfile()
 
 '''
 Specifications of Task Set Generation specified in TasksetSettings.csv
@@ -139,6 +161,9 @@ MAX_NODES = 0
 MAX_NODES_FOR_ALL_TASKS = 0
 MAX_NODE_WCET = 0
 MAX_RECURSION_DEPTH = 0
+# The node counts the expansion of the current DAG aims at, see Generate_DAG_Task()
+EXPANSION_MIN_NODES = 0
+EXPANSION_MAX_NODES = 0
 RELEASE_JITTER_R_Min = 0 
 RELEASE_JITTER_R_Max = 0
 TOTAL_NR_OF_UTILIZATION = 0
@@ -147,9 +172,26 @@ EXEC_TIME_VARIATION = 0
 MAX_JOBS_PER_HYPER_PERIOD = 0
 RSC_ASSIGNMENT_BY_PROBABILITY = False
 
-# The class whose objects hold per node data
+# The random decisions of the DAG expansion are served by RANDOM_SOURCE out of the choice tables built by UpdateChoiceTables()
+RANDOM_SOURCE = RandomSource()
+# The UUniFast splits of the utilizations and execution times are served by UUNIFAST_POOL out of batches drawn from RANDOM_SOURCE
+UUNIFAST_POOL = UUniFastPool(RANDOM_SOURCE)
+# The utilization vectors drawn by RandFixSum for each (number of tasks, utilization) which are not used yet
+RFS_CANDIDATES = {}
+NODE_TYPE_TABLE = None
+TERMINAL_TABLE = None
+JOIN_PARALLEL_TABLE = None
+SIBLINGS_TABLE = None
+RESOURCE_TABLE = None
+
+'''
+The class whose objects hold per node data while a task is expanded, afterwards the nodes of the task are frozen into a DAGTask.
+The visuals take the nodes out of the DAGTask again, along with Par_v, Desc and Ancs (and their masks) when they are updated.
+'''
 class NodeInfo:
-	
+	__slots__ = ('TID', 'JID', 'r_min', 'r_max', 'BCET', 'WCET', 'Pred', 'Succ', 'Par_v', 'Desc', 'Ancs', 'Par_vMask', 'DescMask',\
+		'Term', 'ResourceType', 'Deadline', 'Length')
+
 	def __init__(self): 
 		self.TID   = 0
 		self.JID   = 0
@@ -162,6 +204,8 @@ class NodeInfo:
 		self.Par_v = []
 		self.Desc  = []
 		self.Ancs  = []
+		self.Par_vMask = 0
+		self.DescMask  = 0
 		self.Term  = False
 		self.ResourceType = 1
 		self.Deadline = 0
@@ -180,18 +224,6 @@ class TaskData:
 		self.Deadline = 0
 		self.Priority = 0
 
-# The class spawns threads to generate tasks in parallel; where each thread works for a specific utilization point
-class myThread(threading.Thread):
-	def __init__(self, path, Utilization, FA):
-		threading.Thread.__init__(self)
-		self.path  = path
-		self.Utilization  = Utilization
-		self.FA = FA
-	def run(self):
-		print("Starting " + self.path)
-		CreateWorkloadRuns(self.path, self.Utilization, self.FA)
-		print("Exiting " + self.path)
-
 # The function returns the desired color w.r.t input number to be used in visuals
 def getColor(RSC_TYPE):
 	if RSC_TYPE == 0:
@@ -233,77 +265,78 @@ def getRandomSample(min, max):
 	return np.random.random_sample(min, max)
 
 def getRandomInteger(min, max):
-	return np.random.random_integers(min, max)
+	return RANDOM_SOURCE.Integer(min, max)
 
 # This function returns the number of parallel branches to be forked from a node during the task set generation
 def getSiblingsCount(NodesCreated = 2):
-	values = []
-	p_values = []
-
-	if NodesCreated >= MAX_NODES:
+	if NodesCreated >= EXPANSION_MAX_NODES:
 		return 0
-	elif (MAX_NODES - NodesCreated) < MAX_PAR_BRANCHES:
-		return (MAX_NODES - NodesCreated)
+	elif (EXPANSION_MAX_NODES - NodesCreated) < MAX_PAR_BRANCHES:
+		return (EXPANSION_MAX_NODES - NodesCreated)
 
-	'''
-	This if block assigns probabilities to the random selection of number of siblings count so as to assign highest
-	probability to the maximum possible parallel sub-branches subsequently assigning lower probabilities to lesser 
-	number of possible branches. 
-	'''
 	if WANT_MORE_SIBLINGS == True:
-		for n in reversed(range(MAX_PAR_BRANCHES)):
-			values.append(n+1)
-			if n == MAX_PAR_BRANCHES-1:
-				lval = (1/MAX_PAR_BRANCHES) + (0.5/MAX_PAR_BRANCHES)
-				p_values.append(lval)
-			elif n == 0:
-				p_values.append(0.5/MAX_PAR_BRANCHES)
-			else:
-				p_values.append(1/MAX_PAR_BRANCHES)
+		return RANDOM_SOURCE.Choice(SIBLINGS_TABLE)
 	else:
 		return getRandomInteger(MIN_PAR_BRANCHES, MAX_PAR_BRANCHES)
 
-	return np.random.choice(values, p = p_values)
-
 # This function returns a number uniformly between min and max number
 def getUniform(min, max):
-	return np.random.uniform(min, max)
+	return RANDOM_SOURCE.Uniform(min, max)
 
 # This returns the possibility of a node to be either Terminal or fork based on settings specified in TasksetSettings.csv file
 def isTerminalNodeOrParallelSubGraph():
-	values = [IS_TERMINAL, IS_PARALLEL, IS_JOIN]
-	p_values = [PROB_TERMINAL, PROB_PARALLEL, 1 - PROB_TERMINAL - PROB_PARALLEL]
-	return np.random.choice(values, p = p_values)
+	return RANDOM_SOURCE.Choice(NODE_TYPE_TABLE)
 
 # In the case of heterogeneous task set generation, this gets the resource type of nodes by probability
 def getResourcebyProbability():
-	values = []
-	p_values = []
-
-	for n in range(0, RESOURCE_TYPES):
-		RSC = n+1
-		values.append(RSC)
-		p_values.append((float)(CORES_PER_RESOURCE[n] / TOTAL_COMPUTING_NODES))
-
-	return np.random.choice(values, p = p_values)
+	return RANDOM_SOURCE.Choice(RESOURCE_TABLE)
 
 # This function checks either a node is terminal or joining; Not used at this moment
 def isTerminalNode():
-	values = [IS_TERMINAL, IS_JOIN]
-	p_values = [PROB_TERMINAL, 1 - PROB_TERMINAL]
-	return np.random.choice(values, p = p_values)
+	return RANDOM_SOURCE.Choice(TERMINAL_TABLE)
 
 # This function checks either a node is a fork or joining; Not used at this moment
 def isJoinOrParallelSubGraph():
-	values = [IS_PARALLEL, IS_JOIN]
-	p_values = [PROB_PARALLEL, 1 - PROB_TERMINAL - PROB_PARALLEL]
-	return np.random.choice(values, p = p_values)
+	return RANDOM_SOURCE.Choice(JOIN_PARALLEL_TABLE)
 
 # This function checks whether an edge between two siblings should be created or not based on probability specified in TasksetSettings.csv
 def ShouldAddEdge():
-	values = [True, False]
-	p_values = [PROB_ADD_EDGE, 1 - PROB_ADD_EDGE]
-	return np.random.choice(values, p = p_values)
+	return RANDOM_SOURCE.Bernoulli(PROB_ADD_EDGE)
+
+'''
+This builds the choice tables of the random decisions once the settings are known and whenever the resources change.
+The siblings count gets the highest probability for the maximum possible parallel sub-branches, subsequently assigning
+lower probabilities to lesser number of possible branches.
+'''
+def UpdateChoiceTables():
+	global NODE_TYPE_TABLE
+	global TERMINAL_TABLE
+	global JOIN_PARALLEL_TABLE
+	global SIBLINGS_TABLE
+	global RESOURCE_TABLE
+
+	NODE_TYPE_TABLE 	= getChoiceTable([IS_TERMINAL, IS_PARALLEL, IS_JOIN], [PROB_TERMINAL, PROB_PARALLEL, 1 - PROB_TERMINAL - PROB_PARALLEL])
+	TERMINAL_TABLE 		= getChoiceTable([IS_TERMINAL, IS_JOIN], [PROB_TERMINAL, 1 - PROB_TERMINAL])
+	JOIN_PARALLEL_TABLE = getChoiceTable([IS_PARALLEL, IS_JOIN], [PROB_PARALLEL, 1 - PROB_TERMINAL - PROB_PARALLEL])
+
+	values = []
+	p_values = []
+	for n in reversed(range(MAX_PAR_BRANCHES)):
+		values.append(n+1)
+		if n == MAX_PAR_BRANCHES-1:
+			p_values.append((1/MAX_PAR_BRANCHES) + (0.5/MAX_PAR_BRANCHES))
+		elif n == 0:
+			p_values.append(0.5/MAX_PAR_BRANCHES)
+		else:
+			p_values.append(1/MAX_PAR_BRANCHES)
+	SIBLINGS_TABLE = getChoiceTable(values, p_values)
+
+	values = []
+	p_values = []
+	for n in range(0, RESOURCE_TYPES):
+		values.append(n+1)
+		p_values.append((float)(CORES_PER_RESOURCE[n] / TOTAL_COMPUTING_NODES))
+	RESOURCE_TABLE = getChoiceTable(values, p_values)
 
 # This gets the resource assignment randomly when generating heterogeneous task sets
 def getRandomResourceAssignment(SelfSuspending = False):
@@ -325,24 +358,6 @@ def getResourceAssignmentbyProbability(SelfSuspending = False):
 	else:
 		return getResourcebyProbability()
 
-# This function generated utilizations using randfixsum method. Not used at this moment
-def RandFixSum(Utilizations_Per_Task, List_of_Nodes_Per_Task):
-	nums = []
-	for i in totals:
-		if i == 0: 
-			nums.append([0 for i in range(6)])
-			continue
-		total = i
-		temp = []
-		for i in range(5):
-			val = np.random.randint(0, total)
-			temp.append(val)
-			total -= val
-		temp.append(total)
-		nums.append(temp)
-
-	print(nums)
-
 def PrintNodes(Nodes):
 	for n in range(0, len(Nodes)):
 		Nodes[n].DisplayData()
@@ -377,18 +392,14 @@ def getLogUniformPeriod():
 
 def Print_TaskSet(TaskSet, Utilizations, Periods, PRINT=False):
 	for Task in range(0, len(TaskSet)):
-		outAllPaths = []
-		AllPaths = []
-		CriticalPaths = []
-		getAllPaths(TaskSet[Task], TaskSet[Task][0], outAllPaths, AllPaths)
-		CriticalPaths, CriticalPaths_WCET = getCriticalPaths_wrt_WCET(outAllPaths)
+		CriticalPaths, CriticalPaths_WCET = TaskSet[Task].getCriticalPathInfo()
 
 		if PRINT:
 			print("---CRP_WCET:%d----Util:%f%% = %f-------Period:%d---VOL_G=%d-----"\
 				%(CriticalPaths_WCET, Utilizations[Task]/TOTAL_COMPUTING_NODES, Utilizations[Task], Periods[Task], Utilizations[Task]*Periods[Task]))
 			
 			for Vertex in range(0, len(TaskSet[Task])):
-				print("J%d BCET:%d WCET:%d"%(TaskSet[Task][Vertex].JID, TaskSet[Task][Vertex].BCET, TaskSet[Task][Vertex].WCET))
+				print("J%d BCET:%d WCET:%d"%(Vertex, TaskSet[Task].BCET[Vertex], TaskSet[Task].WCET[Vertex]))
 
 def PrintExtractedParameters():
 	lvTotalResources = 0
@@ -594,38 +605,18 @@ def ExtractParameters(Settings):
 		TOTAL_COMPUTING_NODES   =   TotalComputingNodes
 		# TOTAL_UTILIZATION =  float(TotalComputingNodes * MaxUtilizationPercentage)
 
-# Get the utilization, or any other set of quantities using UUnifast method
+# Get the utilization, or any other set of quantities using UUnifast method, the splits are drawn in batches by UUNIFAST_POOL
 def UUniFast(Number_of_Items, Quantity):
-	# Classic UUniFast algorithm:
-	Separated_Quantities = []
-	sumU = Quantity
-	nextSumU = 0
-
-	for i in range(0, Number_of_Items-1):
-		nextSumU = sumU * (random.random() ** (1.0 / (Number_of_Items - i)))
-		Separated_Quantities.append(sumU - nextSumU)
-		sumU = nextSumU
-		
-	Separated_Quantities.append(sumU)
-
-	return Separated_Quantities
+	return UUNIFAST_POOL.Split(Number_of_Items, Quantity)
 
-# This returns Volum of a Task
+# This returns Volum of a Task, summed up in the order of the nodes
 def getTotalTaskWCET(Nodes):
-	WCET_SUM = 0
-	
-	for n in range(0, len(Nodes)):
-		WCET_SUM += Nodes[n].WCET
-
-	return WCET_SUM
+	return sum(Nodes.WCET.tolist())
 
 # This returns Task Period using the formula Volume / Utilization
 def getTaskPeriod(utilization, Nodes):
 	
-	WCET_SUM = 0
-	
-	for n in range(0, len(Nodes)):
-		WCET_SUM += Nodes[n].WCET
+	WCET_SUM = getTotalTaskWCET(Nodes)
 
 	Period = int(WCET_SUM / (utilization))
 
@@ -643,36 +634,33 @@ def csvWriteRow(Writer, List):
 	Writer.writerow(List)
 	List.clear()
 
-# This function uses the tool dag-tasks-to-jobs_hetero.py to create job set files from task set files.
-def create_job_set(FileName): 
+# The time columns of a task are float arrays as soon as one of its nodes has a fractional value, whole values are written as integers
+def getColumnValues(Column):
+	return [int(x) if float(x).is_integer() else x for x in Column.tolist()]
+
+# This returns the names of the job set files of a task set file, the binary one is None unless it is wanted
+def getJobSetFileNames(FileName):
 	lvFileName = FileName.split('.')
 	
 	lvJobFileName   =   lvFileName[0]+"_Jobs.csv"
 	lvPredFileName   =   lvFileName[0]+"_Pred.csv"
+	lvBinaryFileName =   None
 
-	pwd = str(run_command("pwd")).split("\\")
-	lvpwd = pwd[0].split("'")
+	if WANT_BINARY_JOBSET == True:
+		lvBinaryFileName = lvFileName[0]+"_Jobs"+JOB_SET_BINARY_EXT
 
-	lvCMD = "python3 -W ignore "+lvpwd[1]+"/dag-tasks-to-jobs_hetero.py -p "+PRIORITY_POLICY+" "+FileName+" "+lvJobFileName+" "+lvPredFileName
+	return lvJobFileName, lvPredFileName, lvBinaryFileName
 
-	res = run_command(lvCMD)
+# This function expands the task set in-process with dag_tasks_to_jobs (the API of dag-tasks-to-jobs_hetero.py) into job set files.
+def create_job_set(FileName, TaskCount, TaskSetList, Periods, Priorities):
+	lvJobFileName, lvPredFileName, lvBinaryFileName = getJobSetFileNames(FileName)
 
-	# If '-j z' option is specified at command line then below lines are not executed to remove the task set file
-	if WANT_TASKJOB_SET == False:
-		lvCMD = "rm -rf "+FileName
-		res = run_command(lvCMD)
+	write_job_set(getJobSetTaskData(TaskCount, TaskSetList, Periods, Priorities), lvJobFileName, lvPredFileName, PRIORITY_POLICY, lvBinaryFileName)
 
 	return lvJobFileName, lvPredFileName
 
-'''
-This function simply creates the task set files
-TODO: Assignment of Task IDs as per their sorting w.r.t to their periods
-At this moment, The task IDs which were assigned initially are retained; 
-it should be reassigned based on sorted tasks in the final file.
-'''
-def create_tasks_file(TaskCount, TaskSetList, FileName, Periods, Priorities):
-	TaskSetFileData = []
-
+# The tasks are written to the task set file and expanded into jobs in the order of their periods
+def getSortedTaskSetData(TaskCount, TaskSetList, Periods, Priorities):
 	TaskSetData = []
 
 	for Task in range(0, TaskCount):
@@ -686,6 +674,55 @@ def create_tasks_file(TaskCount, TaskSetList, FileName, Periods, Priorities):
 
 	TaskSetData.sort(key = lambda x:x.Period)
 
+	return TaskSetData
+
+'''
+This returns the task set in the form parse_dag_task_file() reads it back from the task set file, i.e., 
+the same 'R', 'M', 'T' and 'V' entries scaled to micro seconds, so that no CSV round-trip is needed.
+'''
+def getJobSetTaskData(TaskCount, TaskSetList, Periods, Priorities):
+	periods = {}
+	deadlines = {}
+	priorities = {}
+	nodes = defaultdict(list)
+	max_rcst = RESOURCE_TYPES + 1
+	nodes_per_resource = {0: 0}
+
+	for i in range(0, RESOURCE_TYPES):
+		nodes_per_resource[i+1] = CORES_PER_RESOURCE[i]
+
+	TaskSetData = getSortedTaskSetData(TaskCount, TaskSetList, Periods, Priorities)
+
+	for Task in range(0, TaskCount):
+		tid = TaskSetData[Task].TID
+		periods[tid] = ms2us(float(TaskSetData[Task].Period))
+		deadlines[tid] = ms2us(float(TaskSetData[Task].Deadline))
+		priorities[tid] = int(TaskSetData[Task].Priority)
+		if priorities[tid] == int(TaskSetData[Task].Deadline):
+			priorities[tid] = ms2us(priorities[tid])
+
+		Nodes = TaskSetData[Task].Nodes
+		if len(Nodes) > 0:
+			max_rcst = max(max_rcst, int(Nodes.ResourceType.max()))
+
+		Columns = zip(Nodes.VID.tolist(), Nodes.r_min.tolist(), Nodes.r_max.tolist(), Nodes.BCET.tolist(), Nodes.WCET.tolist(), Nodes.ResourceType.tolist(), Nodes.getPredecessorLists())
+
+		for VID, r_min, r_max, BCET, WCET, RSC, preds in Columns:
+			nodes[tid].append((VID, ms2us(float(r_min)), ms2us(float(r_max)), ms2us(float(BCET)), ms2us(float(WCET)), RSC, preds))
+
+	return (periods, deadlines, priorities, nodes, max_rcst, nodes_per_resource)
+
+'''
+This function simply creates the task set files
+TODO: Assignment of Task IDs as per their sorting w.r.t to their periods
+At this moment, The task IDs which were assigned initially are retained; 
+it should be reassigned based on sorted tasks in the final file.
+'''
+def create_tasks_file(TaskCount, TaskSetList, FileName, Periods, Priorities):
+	TaskSetFileData = []
+
+	TaskSetData = getSortedTaskSetData(TaskCount, TaskSetList, Periods, Priorities)
+
 	with open(FileName, 'w') as csvfile:
 		TaskWriter = csv.writer(csvfile, delimiter=',', quotechar='|', quoting=csv.QUOTE_MINIMAL)
 
@@ -731,19 +768,21 @@ def create_tasks_file(TaskCount, TaskSetList, FileName, Periods, Priorities):
 			#   10) second predecessor (vertex ID), if any
 			#   11) third predecessor (vertex ID), if any
 			#   … and so on …
-			for Node in range(0, len(TaskSetData[Task].Nodes)):
+			Nodes = TaskSetData[Task].Nodes
+			Columns = zip(Nodes.VID.tolist(), getColumnValues(Nodes.r_min), getColumnValues(Nodes.r_max), getColumnValues(Nodes.BCET),\
+				getColumnValues(Nodes.WCET), Nodes.ResourceType.tolist(), Nodes.getPredecessorLists())
+
+			for VID, r_min, r_max, BCET, WCET, RSC, Pred in Columns:
 
 					TaskSetFileData.append('V')
 					TaskSetFileData.append(TaskSetData[Task].TID)
-					TaskSetFileData.append(TaskSetData[Task].Nodes[Node].JID+1)
-					TaskSetFileData.append(TaskSetData[Task].Nodes[Node].r_min)
-					TaskSetFileData.append(TaskSetData[Task].Nodes[Node].r_max)
-					TaskSetFileData.append(TaskSetData[Task].Nodes[Node].BCET)
-					TaskSetFileData.append(TaskSetData[Task].Nodes[Node].WCET)
-					TaskSetFileData.append(TaskSetData[Task].Nodes[Node].ResourceType)
-
-					for p in range(0, len(TaskSetData[Task].Nodes[Node].Pred)):
-						TaskSetFileData.append(TaskSetData[Task].Nodes[Node].Pred[p]+1)
+					TaskSetFileData.append(VID)
+					TaskSetFileData.append(r_min)
+					TaskSetFileData.append(r_max)
+					TaskSetFileData.append(BCET)
+					TaskSetFileData.append(WCET)
+					TaskSetFileData.append(RSC)
+					TaskSetFileData.extend(Pred)
 
 					csvWriteRow(TaskWriter, TaskSetFileData)                         
 
@@ -773,12 +812,7 @@ def getNodesCountOfRSCType(Nodes):
 	Nodes_Per_RSC_Type = []
 	
 	for RSC in range(1, RESOURCE_TYPES+1):
-		Type_Nodes = 0
-		for v in range(0, len(Nodes)):
-			if Nodes[v].ResourceType == RSC:
-				Type_Nodes += 1
-		Nodes_Per_RSC_Type.append(Type_Nodes)
-		Type_Nodes = 0
+		Nodes_Per_RSC_Type.append(int(np.count_nonzero(Nodes.ResourceType == RSC)))
 
 	return Nodes_Per_RSC_Type
 
@@ -805,40 +839,52 @@ def UpdateTaskExecutionTimes_by_RSC_STRICTLY(TaskNodes, Utilization, Period):
 	# Get WCET  for each type of nodes
 	for RSC in range(0, RESOURCE_TYPES):
 		WCET_Per_Node = UUniFast(Nodes_Per_RSC_Type[RSC], VOL_G_Per_RSC_Type_Nodes[RSC])
-		TypeNodeCounter = 0
-		for vertex in range(0, len(TaskNodes)):
-			if TaskNodes[vertex].ResourceType == RSC+1:
-				TaskNodes[vertex].WCET = math.ceil(WCET_Per_Node[TypeNodeCounter])
-				TaskNodes[vertex].BCET = math.ceil(TaskNodes[vertex].WCET * EXEC_TIME_VARIATION)
-				if TaskNodes[vertex].BCET > TaskNodes[vertex].WCET:
-					TaskNodes[vertex].BCET = TaskNodes[vertex].WCET
-				TypeNodeCounter += 1
+		Type_Nodes = (TaskNodes.ResourceType == RSC+1)
+		TaskNodes.WCET[Type_Nodes] = np.ceil(WCET_Per_Node[:Nodes_Per_RSC_Type[RSC]])
+		TaskNodes.BCET[Type_Nodes] = np.minimum(np.ceil(TaskNodes.WCET[Type_Nodes] * EXEC_TIME_VARIATION), TaskNodes.WCET[Type_Nodes])
+
+	TaskNodes.ClearCaches(Edges=False)
 
 def UpdateTaskExecutionTimes(TaskNodes, Utilization, Period):
 	# Get nodes of each type of each task Nodes_Per_RSC_Type = getNodesOfType(Nodes)
 	# Get WCET  for each type of nodes
 	Volume = Utilization * Period
 	WCET_Per_Node = UUniFast(len(TaskNodes), Volume)
-	for vertex in TaskNodes:
-		vertex.WCET = math.ceil(WCET_Per_Node[vertex.JID])
-		vertex.BCET = math.ceil(vertex.WCET * EXEC_TIME_VARIATION)
-		if vertex.BCET > vertex.WCET:
-			vertex.BCET = vertex.WCET
+	TaskNodes.WCET = np.ceil(WCET_Per_Node).astype(np.int64)
+	TaskNodes.BCET = np.minimum(np.ceil(TaskNodes.WCET * EXEC_TIME_VARIATION).astype(np.int64), TaskNodes.WCET)
+	TaskNodes.ClearCaches(Edges=False)
+
+# This scales the execution and release times of the nodes of a task along with its period
+def ScaleTaskTimes(Nodes, ScalingFactor):
+	Nodes.WCET = np.ceil(Nodes.WCET*ScalingFactor).astype(np.int64)
+	Nodes.BCET = np.minimum(np.ceil(Nodes.BCET*ScalingFactor).astype(np.int64), Nodes.WCET)
+	Nodes.r_max = np.ceil(Nodes.r_max*ScalingFactor).astype(np.int64)
+	Nodes.r_min = np.minimum(np.ceil(Nodes.r_min*ScalingFactor).astype(np.int64), Nodes.r_max)
+	Nodes.ClearCaches(Edges=False)
 
 # Updating the release times of jobs if it is required to assign release jitter
 def UpdateReleaseTimes(Nodes):
+	r_min = Nodes.r_min.tolist()
+	r_max = Nodes.r_max.tolist()
+	BCET = Nodes.BCET.tolist()
+	WCET = Nodes.WCET.tolist()
+
+	# The JIDs of the nodes are in topological order, so the release times of the predecessors are updated first
 	for vertex in range(1, len(Nodes)):
 		MAX_of_r_min_plus_BCET = 0
 		MAX_of_r_max_plus_WCET = 0
 
-		for pred in range(0, len(Nodes[vertex].Pred)):
-			if (MAX_of_r_min_plus_BCET < (Nodes[Nodes[vertex].Pred[pred]].r_min + Nodes[Nodes[vertex].Pred[pred]].BCET)):
-				MAX_of_r_min_plus_BCET = (Nodes[Nodes[vertex].Pred[pred]].r_min + Nodes[Nodes[vertex].Pred[pred]].BCET)
-			if (MAX_of_r_max_plus_WCET < (Nodes[Nodes[vertex].Pred[pred]].r_max + Nodes[Nodes[vertex].Pred[pred]].WCET)):
-				MAX_of_r_max_plus_WCET = (Nodes[Nodes[vertex].Pred[pred]].r_max + Nodes[Nodes[vertex].Pred[pred]].WCET)
+		for pred in Nodes.getPredecessors(vertex):
+			if (MAX_of_r_min_plus_BCET < (r_min[pred] + BCET[pred])):
+				MAX_of_r_min_plus_BCET = (r_min[pred] + BCET[pred])
+			if (MAX_of_r_max_plus_WCET < (r_max[pred] + WCET[pred])):
+				MAX_of_r_max_plus_WCET = (r_max[pred] + WCET[pred])
+
+		r_min[vertex] = MAX_of_r_min_plus_BCET
+		r_max[vertex] = MAX_of_r_max_plus_WCET
 
-		Nodes[vertex].r_min = MAX_of_r_min_plus_BCET
-		Nodes[vertex].r_max = MAX_of_r_max_plus_WCET
+	Nodes.r_min = np.array(r_min)
+	Nodes.r_max = np.array(r_max)
 
 def AssignPeriod(Task, Nodes, Utilization, inPeriods=[]):
 	#------------------------------- # Assigning Period to the Task # ------------------------ #
@@ -868,6 +914,7 @@ def AssignPeriod(Task, Nodes, Utilization, inPeriods=[]):
 		if DEBUG == 'e':
 			print("Failed for Period:%d Invalid Generation:%d"%(Period))
 			print("------------------------------------------------------")
+		PROFILE.Reject("PERIOD_INVALID")
 		return Period
 	
 	# Scaling the Period according to given MIN_PERIOD
@@ -875,50 +922,24 @@ def AssignPeriod(Task, Nodes, Utilization, inPeriods=[]):
 		if Period < MIN_PERIOD:
 			ScalingFactor = float(MIN_PERIOD / Period)
 			Period = MIN_PERIOD
-			for n in range(0, len(Nodes)):
-				Nodes[n].WCET = int(math.ceil(Nodes[n].WCET*ScalingFactor))
-				Nodes[n].BCET = int(math.ceil(Nodes[n].BCET*ScalingFactor))
-				Nodes[n].r_min = int(math.ceil(Nodes[n].r_min*ScalingFactor))
-				Nodes[n].r_max = int(math.ceil(Nodes[n].r_max*ScalingFactor))
-
-				if Nodes[n].BCET > Nodes[n].WCET:
-					Nodes[n].BCET = Nodes[n].WCET
-				if Nodes[n].r_min > Nodes[n].r_max:
-					Nodes[n].r_min = Nodes[n].r_max
+			ScaleTaskTimes(Nodes, ScalingFactor)
 
 		elif Period > MAX_PERIOD:
 			if DEBUG == 'e':
 				print("Failed for Task:%d Period:%d > MAX_PERIOD:%d"%(Task, Period, MAX_PERIOD))
 				print("------------------------------------------------------")
+			PROFILE.Reject("MAX_PERIOD")
 			return Period
 		elif ((Period % MIN_PERIOD) != 0):
 			if (PERIOD_ASSIGNMENT == "Default"): 
 				ScalingFactor = float((Period + (MIN_PERIOD - (Period%MIN_PERIOD))) / Period)
 				Period += (MIN_PERIOD - (Period%MIN_PERIOD)) 
-				for n in range(0, len(Nodes)):
-					Nodes[n].WCET = int(math.ceil(Nodes[n].WCET*ScalingFactor))
-					Nodes[n].BCET = int(math.ceil(Nodes[n].BCET*ScalingFactor))
-					Nodes[n].r_min = int(math.ceil(Nodes[n].r_min*ScalingFactor))
-					Nodes[n].r_max = int(math.ceil(Nodes[n].r_max*ScalingFactor))
-				
-					if Nodes[n].BCET > Nodes[n].WCET:
-						Nodes[n].BCET = Nodes[n].WCET
-					if Nodes[n].r_min > Nodes[n].r_max:
-						Nodes[n].r_min = Nodes[n].r_max
+				ScaleTaskTimes(Nodes, ScalingFactor)
 			elif (PERIOD_ASSIGNMENT == "ECRTS_19"):
 				ChosenScaledPeriod = min(PERIODS_ARRAY, key=lambda y:abs(y-Period))
 				ScalingFactor = float(ChosenScaledPeriod / Period)
 				Period = ChosenScaledPeriod
-				for n in range(0, len(Nodes)):
-					Nodes[n].WCET = int(math.ceil(Nodes[n].WCET*ScalingFactor))
-					Nodes[n].BCET = int(math.ceil(Nodes[n].BCET*ScalingFactor))
-					Nodes[n].r_min = int(math.ceil(Nodes[n].r_min*ScalingFactor))
-					Nodes[n].r_max = int(math.ceil(Nodes[n].r_max*ScalingFactor))
-				
-					if Nodes[n].BCET > Nodes[n].WCET:
-						Nodes[n].BCET = Nodes[n].WCET
-					if Nodes[n].r_min > Nodes[n].r_max:
-						Nodes[n].r_min = Nodes[n].r_max
+				ScaleTaskTimes(Nodes, ScalingFactor)
 
 	# We do it at the end so that period scaling is taken into account
 	if (PERIOD_ASSIGNMENT == "UNIFORM") or (PERIOD_ASSIGNMENT == "LOG_UNIFORM") or (PERIOD_ASSIGNMENT == "ECRTS_19_FIXED"):
@@ -927,12 +948,14 @@ def AssignPeriod(Task, Nodes, Utilization, inPeriods=[]):
 		else:
 			UpdateTaskExecutionTimes(Nodes, Utilization, Period)
 
-	CRP, CRP_WCET = getCriticalPathInfo(Nodes)
+	with PROFILE.Stage("Critical path"):
+		CRP, CRP_WCET = Nodes.getCriticalPathInfo()
  
 	if Period < CRP_WCET:
 		if DEBUG == 'e':
 			print("Failed for Task:%d Period:%d < CRP_WCET:%d"%(Task, Period, CRP_WCET))
 			print("------------------------------------------------------")
+		PROFILE.Reject("CRP_WCET")
 		Period = 0 # This marks that this is invalid period
 		return Period
 
@@ -956,7 +979,9 @@ def checkNecessaryCondition(TaskSetList, Utilizations, inputUtilization, Periods
 	if (EQUAL_DEADLINE_TASKS_GENERATION == True):
 		for Task in range(0, len(TaskSetList)):
 			lvPeriod = 0
-			lvPeriod = AssignPeriod(Task, TaskSetList[Task], Utilizations[Task], Periods)
+			# The periods are reported as in the generation with constrained deadlines, not as part of this stage
+			with PROFILE.Stage("Period assignment"):
+				lvPeriod = AssignPeriod(Task, TaskSetList[Task], Utilizations[Task], Periods)
 			if lvPeriod == 0 or lvPeriod > MAX_PERIOD:
 				return False, TotalJobsPerHyperPeriod
 			Periods.append(lvPeriod)
@@ -970,12 +995,14 @@ def checkNecessaryCondition(TaskSetList, Utilizations, inputUtilization, Periods
 		if DEBUG == 'e':
 			print("Failed for HyperPeriods:%d > MAX_HYPER_PERIOD:%d"%(HyperPeriod, MAX_HYPER_PERIOD))
 			print("------------------------------------------------------")
+		PROFILE.Reject("MAX_HYPER_PERIOD")
 		return False, TotalJobsPerHyperPeriod
 
 	if (MAX_JOBS_PER_HYPER_PERIOD != 0) and (TotalJobsPerHyperPeriod > MAX_JOBS_PER_HYPER_PERIOD): 
 		if DEBUG == 'e':
 			print("Failed for TotalJobsPerHyperPeriod:%d > MAX_JOBS_PER_HYPER_PERIOD:%d"%(TotalJobsPerHyperPeriod, MAX_JOBS_PER_HYPER_PERIOD))
 			print("------------------------------------------------------")
+		PROFILE.Reject("MAX_JOBS_PER_HP")
 		return False, TotalJobsPerHyperPeriod
 
 	U_RSC = []
@@ -983,17 +1010,18 @@ def checkNecessaryCondition(TaskSetList, Utilizations, inputUtilization, Periods
 	for RSC in range(0, RESOURCE_TYPES): 
 		Ui_RSC = 0
 		for TaskNodes in range(0, TotalNrOfTasks):
-			for Node in range(0, len(TaskSetList[TaskNodes])):
-				TotalNodesOfAllTasks = TotalNodesOfAllTasks + 1
-				if (SELF_SUSPENDING == True) and (TaskSetList[TaskNodes][Node].ResourceType == SS_RSC):
-					FoundSSNode = True
-				if TaskSetList[TaskNodes][Node].ResourceType == RSC+1: # Added 1 to Elude Self Suspending
-					Ui_RSC +=  (float)(TaskSetList[TaskNodes][Node].WCET / Periods[TaskNodes])
+			TotalNodesOfAllTasks = TotalNodesOfAllTasks + len(TaskSetList[TaskNodes])
+			if (SELF_SUSPENDING == True) and (SS_RSC in TaskSetList[TaskNodes].ResourceType):
+				FoundSSNode = True
+			# Added 1 to Elude Self Suspending
+			for WCET in TaskSetList[TaskNodes].WCET[TaskSetList[TaskNodes].ResourceType == RSC+1].tolist():
+				Ui_RSC +=  (float)(WCET / Periods[TaskNodes])
 		
 		if TotalNodesOfAllTasks > MAX_NODES_FOR_ALL_TASKS:
 			if DEBUG == 'e':
 				print("Failed for TotalNodesOfAllTasks:%d > MAX_NODES_FOR_ALL_TASKS:%d"%(TotalNodesOfAllTasks, MAX_NODES_FOR_ALL_TASKS))
 				print("------------------------------------------------------")
+			PROFILE.Reject("MAX_NODES_FOR_ALL_TASKS")
 			return False, TotalJobsPerHyperPeriod
 		'''
 		if (inputUtilization > 1) and ((Ui_RSC*inputUtilization) > (CORES_PER_RESOURCE[RSC]*inputUtilization)):
@@ -1013,6 +1041,7 @@ def checkNecessaryCondition(TaskSetList, Utilizations, inputUtilization, Periods
 			if DEBUG == 'e':
 				print("Failed for RSC:%d Ui_RSC:%f%% > %f%% CORES_PER_RESOURCE[%d]:%d"%(RSC+1, Ui_RSC, CORES_PER_RESOURCE[RSC]*inputUtilization, RSC+1, CORES_PER_RESOURCE[RSC]))
 				print("------------------------------------------------------")
+			PROFILE.Reject("RSC_UTILIZATION")
 			return False, TotalJobsPerHyperPeriod
 		else:
 			U_RSC.append(Ui_RSC)
@@ -1030,6 +1059,7 @@ def checkNecessaryCondition(TaskSetList, Utilizations, inputUtilization, Periods
 	if (SELF_SUSPENDING == True) and (FoundSSNode == False):
 		if DEBUG == 'e':
 			print("Failed for No SS_NODE_FOUND")
+		PROFILE.Reject("NO_SS_NODE")
 		return False, TotalJobsPerHyperPeriod
 
 	return True, TotalJobsPerHyperPeriod
@@ -1048,7 +1078,13 @@ def parse_args():
 						action='store', type=str, metavar="Job_Set",
 						required=False,
 						help="If taskset file created choose Y to create jobset. If you don`t want to remove taskset file, then choose Z with this option\n\
-						This option requires 'dag-tasks-to-jobs_hetero.py' script to be placed in the same location as of this DAG generation script")
+						This option requires the 'dag_tasks_to_jobs.py' module (job set expansion of dag-tasks-to-jobs_hetero.py) to be placed in the same location as of this DAG generation script")
+
+	parser.add_argument('-jb', '--job-set-binary', dest='job_set_binary', default='n', 
+						action='store', type=str, metavar="Job_Set_Binary",
+						required=False,
+						help="Choose Y to store each job set additionally in a binary job set file (_Jobs.bin) along with the CSV files.\n\
+						It can be converted back to CSV with 'job-set-binary-to-csv.py'")
 
 	parser.add_argument('-ss', '--self_suspending', dest='self_suspending', default='n', 
 						action='store', type=str, metavar="self_suspending",
@@ -1100,8 +1136,13 @@ def parse_args():
 	parser.add_argument('-mt', '--multi_threading', dest='multi_threading', default='N', 
 						action='store', type=str, metavar="TYPE",
 						required=False,
-						help='Choose Y or y to enable one thread per utilization exploration. \
-						Do not use this option with ResourceRange Specifications with NR_OF_WORKLOADS > 1.')
+						help='Choose Y or y to generate with one worker process per CPU, same as --workers with the number of CPUs.')
+
+	parser.add_argument('-w', '--workers', dest='workers', default=0, 
+						action='store', type=int, metavar="NR_OF_WORKERS",
+						required=False,
+						help='Specify number of worker processes to generate the runs of all utilization points and task counts in parallel. \
+						Each run gets its own stream spawned from the seed of the sweep, so the output does not depend on the number of workers.')
 
 	parser.add_argument('-P', '--period_assignment', dest='period_assignment', default='Default', 
 						action='store', type=str, metavar="PERIOD_ASSIGNMENT",
@@ -1127,7 +1168,8 @@ def parse_args():
 						action='store', type=str, metavar="UTILIZATION_METHOD",
 						required=False,
 						help='Specify Utilization Generation Method: UUF (UUnifast) or UUFD (UUnifastDiscard) (Warning: UUFD may take long time)\
-						or UUF_UUFD for generating workloads for both methods.')
+						or UUF_UUFD for generating workloads for both methods. RFS (RandFixSum) draws the utilizations of UUFD \
+						without discarding any of them.')
 
 	parser.add_argument('-cf', '--check_feasibility', dest='feasibility_check', default='NA', 
 						action='store', type=str, metavar="ANALYSIS",
@@ -1160,6 +1202,41 @@ def parse_args():
 						const=True, required=False,
 			            help='This option Generates non-nested-fork-join DAGs.')
 
+	parser.add_argument('-sh', '--shape', dest='shape', default='FJ', 
+						action='store', type=str, metavar="SHAPE",
+						required=False,
+						help='Specify the shape of the DAG tasks: "FJ" (fork-join DAGs, nested or with -nnfj non-nested), "LAYERED" \
+						(layer-by-layer random DAGs with Max_Depth layers) or "GNP" (G(n,p) DAGs over a topological order). \
+						The edges of LAYERED and GNP DAGs are drawn with the probability Prob_Add_Edge.')
+
+	parser.add_argument('-cg', '--constructive', dest='constructive', action='store_const', 
+						const=True, required=False,
+			            help='This option expands each DAG towards a number of nodes drawn between Min_Nodes and Max_Nodes and grows \
+			            or, with -rsc, repairs the DAGs which fall short of it instead of generating them again.')
+
+	parser.add_argument('-S', '--seed', dest='seed', default=None, 
+						action='store', type=int, metavar="SEED",
+						required=False,
+						help='Specify the seed of the sweep. Each run gets its own stream spawned from the seed along the coordinates \
+						of the run, which is recorded in the manifest <PathToStore>Manifest.jsonl. Without it a new seed is drawn for the sweep.')
+
+	parser.add_argument('-C', '--cell', dest='cell', default=None, 
+						action='store', metavar="W,M,U,T,R",
+						required=False,
+						help='Regenerate only the run with the given coordinates of the manifest (workload, utilization method, \
+						utilization point, number of tasks and run), along with the same settings and --seed of the sweep.')
+
+	parser.add_argument('-R', '--resume', dest='resume', action='store_const', 
+						const=True, required=False,
+			            help='This option resumes an interrupted sweep. The runs recorded in the manifest <PathToStore>Manifest.jsonl are \
+			            skipped and their feasibility is counted in, the sweep has to be resumed with the same settings and --seed.')
+
+	parser.add_argument('-po', '--profile-out', dest='profile_out', default=None, 
+						action='store', metavar="STATS_JSON",
+						required=False,
+						help='Write the wall time of each generation stage and the number of attempts discarded for each \
+						rejection reason per (utilization, number of tasks) to the given JSON file.')
+
 	parser.add_argument('Settings', metavar = 'TASKS_SETTINGS_FILE', help='Creating Tasks to these param')
 
 	return parser.parse_args()
@@ -1366,48 +1443,6 @@ def getAllPaths(Nodes, InputNode, outAllPaths, AllPaths):
 		# else:
 		#     print("Path is incomplete")
 
-# this function returns the critical paths. Note: There can be more than 1 critical paths in a task graph
-def getCriticalPaths_wrt_WCET(inAllPaths):
-	WCET = 0
-	CriticalPaths = []
-
-	WCET_SUM = 0
-	
-	for n in range(0, len(inAllPaths[0])):
-		WCET_SUM += inAllPaths[0][n].WCET
-	WCET = WCET_SUM
-	CriticalPaths.append(inAllPaths[0])    
-	WCET_SUM = 0
-
-	for n in range(1, len(inAllPaths)):
-		for m in range(0, len(inAllPaths[n])):
-			WCET_SUM += inAllPaths[n][m].WCET
-			# print("Node:%d = %d"%(inAllPaths[n][m].JID, WCET))
-		if (WCET < WCET_SUM):
-			WCET = WCET_SUM
-			CriticalPaths.clear()
-			CriticalPaths.append(inAllPaths[n])
-			WCET_SUM = 0
-		elif (WCET == WCET_SUM):
-			CriticalPaths.append(inAllPaths[n])            
-			WCET_SUM = 0
-		else:
-			WCET_SUM = 0
-		# print("-------WCET:%d---------"%WCET)
-
-	return CriticalPaths, WCET
-
-# This is a high level call to getting Critical paths of a task
-def getCriticalPathInfo(TaskNodes):
-	outAllPaths = []
-	AllPaths = []
-	CriticalPaths = []
-
-	getAllPaths(TaskNodes, TaskNodes[0], outAllPaths, AllPaths)
-	CriticalPaths, CriticalPaths_WCET = getCriticalPaths_wrt_WCET(outAllPaths)
-
-	return CriticalPaths, CriticalPaths_WCET
-
 # This returns all paths with respect to max number of jobs
 def getAllLongestJobPathsWithBranches(Nodes, TerminalNode, Length, inPutNodes):
 	LongestPathNodes = []
@@ -1543,201 +1578,185 @@ def getCriticalPaths_wrt_Jobs(AllLongestPaths):
 
 	return CriticalPaths, MAX_WCET_CRITICAL_PATH
 
-# This function updates the lengths of the paths recursively whenever there is a random edge between siblings
-def updateLengths(Nodes, NodeID, Successors, Length):
-	size_l = len(Successors)
-	if size_l > 1:
-		for n in range(0, size_l):
-			if (Successors[n] != -1) and (NodeID != Nodes[Successors[n]].JID):            
-				updateLengths(Nodes, Nodes[Successors[n]].JID, Nodes[Successors[n]].Succ, Length+1)
-				if (Length + 1) >= Nodes[Successors[n]].Length:
-					Nodes[Successors[n]].Length = Length + 1
-	elif (size_l == 1) and (NodeID != Nodes[Successors[0]].JID):
-		if Successors[0] != -1:
-			updateLengths(Nodes, Nodes[Successors[0]].JID, Nodes[Successors[0]].Succ, Length+1)
-			if (Length + 1) >= Nodes[Successors[0]].Length:
-				Nodes[Successors[0]].Length = Length + 1
-
-# this function creates simple fork-join DAGs (or) simple non-nested fork-join dag tasks
+# The lengths of the nodes (the number of edges on the longest path from the root to them) are set in one pass over
+# the nodes in topological order, once the DAG is expanded
+def updateLengths(Nodes):
+	InDegree = [len(Node.Pred) for Node in Nodes]
+	Ready = [n for n in range(0, len(Nodes)) if InDegree[n] == 0]
+
+	for Node in Nodes:
+		Node.Length = 0
+
+	while len(Ready) > 0:
+		Node = Nodes[Ready.pop()]
+		for s in Node.Succ:
+			if Nodes[s].Length <= Node.Length:
+				Nodes[s].Length = Node.Length + 1
+			InDegree[s] -= 1
+			if InDegree[s] == 0:
+				Ready.append(s)
+
+# This removes the edges from a node to the terminal node, once the node got a random edge to one of its siblings
+def removeTerminalEdges(Node, TermNode):
+	while TermNode.JID in Node.Succ:
+		Node.Succ.remove(TermNode.JID)
+		# The edge to the terminal node was added lately, so it is looked up from the end of the predecessors
+		for n in range(len(TermNode.Pred)-1, -1, -1):
+			if TermNode.Pred[n] == Node.JID:
+				del TermNode.Pred[n]
+				break
+
+# this function creates simple fork-join DAGs (or) simple non-nested fork-join dag tasks, one level after the other
 def expandSeriesParallelNNFJDAG(NodeCounter, Nodes, TaskNr, RootNode, TermNode, Depth, TaskNodesCreated = 2):
 	lvNodeCounter = NodeCounter
 	NodesCreated = TaskNodesCreated
 
-	if (RootNode.Length >= MAX_LENGTH) or ((len(Nodes)+1) >= MAX_NODES) or (Depth >= MAX_RECURSION_DEPTH):
-		TermNode.Pred.append(RootNode.JID)
-		RootNode.Succ.append(TermNode.JID)
-		return NodeCounter
-
-	siblings = getSiblingsCount(NodesCreated)
+	while True:
+		if (RootNode.Length >= MAX_LENGTH) or ((len(Nodes)+1) >= EXPANSION_MAX_NODES) or (Depth >= MAX_RECURSION_DEPTH):
+			TermNode.Pred.append(RootNode.JID)
+			RootNode.Succ.append(TermNode.JID)
+			return lvNodeCounter
 
-	if siblings == 0:
-		TermNode.Pred.append(RootNode.JID)
-		RootNode.Succ.append(TermNode.JID)
+		siblings = getSiblingsCount(NodesCreated)
 
-	NodesCreated += siblings
-	
-	sibling_indices = []
-	JoiningNodes = []
-	
-	# New Joining Node Here
-	lvJoiningNode = newNode(TaskNr, -1, -1)
-
-	if WANT_HETEROGENEOUS == True:
-		lvJoiningNode.ResourceType = 1
+		if siblings == 0:
+			TermNode.Pred.append(RootNode.JID)
+			RootNode.Succ.append(TermNode.JID)
 
-	lvSelfSuspendingFound = False
+		NodesCreated += siblings
+		
+		sibling_indices = []
+		
+		# New Joining Node Here
+		lvJoiningNode = newNode(TaskNr, -1, -1)
 
-	AssignedResources = []
+		if WANT_HETEROGENEOUS == True:
+			lvJoiningNode.ResourceType = 1
 
-	for n in range(0, siblings):
-		sNode = newNode(TaskNr, lvNodeCounter, RootNode.JID)
-		sNode.Length = RootNode.Length + 1
-		RootNode.Succ.append(sNode.JID)
-		sibling_indices.append(sNode.JID)
-		Nodes.append(sNode)
-		lvNodeCounter += 1
+		lvSelfSuspendingFound = False
 
-		if WANT_HETEROGENEOUS == True:
-			if sNode.ResourceType in AssignedResources:
-				sNode.ResourceType = 1
-			elif sNode.ResourceType != 1:
-				AssignedResources.append(sNode.ResourceType)
+		AssignedResources = []
 
-		if SELF_SUSPENDING == True: # Check if one sibling is already self suspending
-			if (sNode.ResourceType == SS_RSC) and (lvSelfSuspendingFound == False): #if not Found first SS
-				lvSelfSuspendingFound = True
-			elif (sNode.ResourceType == SS_RSC) and (lvSelfSuspendingFound == True): #if Yes, ReAssign Resource
-				if RSC_ASSIGNMENT_BY_PROBABILITY == False:
-					sNode.ResourceType = getRandomResourceAssignment(SelfSuspending = False)
-				else:
-					sNode.ResourceType = getResourceAssignmentbyProbability(SelfSuspending = False)
+		for n in range(0, siblings):
+			sNode = newNode(TaskNr, lvNodeCounter, RootNode.JID)
+			sNode.Length = RootNode.Length + 1
+			RootNode.Succ.append(sNode.JID)
+			sibling_indices.append(sNode.JID)
+			Nodes.append(sNode)
+			lvNodeCounter += 1
 
-		Result = isTerminalNodeOrParallelSubGraph()
+			if WANT_HETEROGENEOUS == True:
+				if sNode.ResourceType in AssignedResources:
+					sNode.ResourceType = 1
+				elif sNode.ResourceType != 1:
+					AssignedResources.append(sNode.ResourceType)
+
+			if SELF_SUSPENDING == True: # Check if one sibling is already self suspending
+				if (sNode.ResourceType == SS_RSC) and (lvSelfSuspendingFound == False): #if not Found first SS
+					lvSelfSuspendingFound = True
+				elif (sNode.ResourceType == SS_RSC) and (lvSelfSuspendingFound == True): #if Yes, ReAssign Resource
+					if RSC_ASSIGNMENT_BY_PROBABILITY == False:
+						sNode.ResourceType = getRandomResourceAssignment(SelfSuspending = False)
+					else:
+						sNode.ResourceType = getResourceAssignmentbyProbability(SelfSuspending = False)
 
-		if (Result == IS_TERMINAL) and (sNode.ResourceType != SS_RSC) and (lvNodeCounter >= MIN_NODES):
-			TermNode.Pred.append(sNode.JID)
-			sNode.Succ.append(TermNode.JID)
-		else:
-			lvJoiningNode.Pred.append(sNode.JID)
-			sNode.Succ.append(lvJoiningNode.JID)
-						
-	if len(lvJoiningNode.Pred) >= 1:
-		Max_Length = 0
-		for n in range(0, len(lvJoiningNode.Pred)):
-			if Max_Length <= Nodes[lvJoiningNode.Pred[n]].Length:
-				Max_Length = Nodes[lvJoiningNode.Pred[n]].Length
+			Result = isTerminalNodeOrParallelSubGraph()
 
-		lvJoiningNode.JID = lvNodeCounter
-		lvNodeCounter += 1
-		lvJoiningNode.Length = Max_Length + 1
+			if (Result == IS_TERMINAL) and (sNode.ResourceType != SS_RSC) and (lvNodeCounter >= EXPANSION_MIN_NODES):
+				TermNode.Pred.append(sNode.JID)
+				sNode.Succ.append(TermNode.JID)
+			else:
+				lvJoiningNode.Pred.append(sNode.JID)
+				sNode.Succ.append(lvJoiningNode.JID)
+							
+		if len(lvJoiningNode.Pred) >= 1:
+			lvJoiningNode.JID = lvNodeCounter
+			lvNodeCounter += 1
 
-		# Update all the predecessors of lvJoiningNode with new lvJoiningNode ID
-		for n in range(0, len(lvJoiningNode.Pred)):
-			for m in range(0, len(Nodes[lvJoiningNode.Pred[n]].Succ)):
-				if Nodes[lvJoiningNode.Pred[n]].Succ[m] == -1:
-					Nodes[lvJoiningNode.Pred[n]].Succ[m] = lvJoiningNode.JID
+			# Update all the predecessors of lvJoiningNode with new lvJoiningNode ID
+			for n in range(0, len(lvJoiningNode.Pred)):
+				for m in range(0, len(Nodes[lvJoiningNode.Pred[n]].Succ)):
+					if Nodes[lvJoiningNode.Pred[n]].Succ[m] == -1:
+						Nodes[lvJoiningNode.Pred[n]].Succ[m] = lvJoiningNode.JID
 
-		Nodes.append(lvJoiningNode)
+			Nodes.append(lvJoiningNode)
 
-	# Adding Random Edges between siblings here
-	for n in range(0, len(sibling_indices)):
-		for m in range(n+1, len(sibling_indices)):
-			AddEdge = ShouldAddEdge()
-			if AddEdge == True:
-				if Nodes[sibling_indices[n]].ResourceType != SS_RSC: # No random edges between self suspending nodes
-					Nodes[sibling_indices[m]].Pred.append(Nodes[sibling_indices[n]].JID)
-					Nodes[sibling_indices[n]].Succ.append(Nodes[sibling_indices[m]].JID)
-					if Nodes[sibling_indices[m]].Length <= Nodes[sibling_indices[n]].Length:
-						Nodes[sibling_indices[m]].Length = Nodes[sibling_indices[n]].Length + 1
-						updateLengths(Nodes, Nodes[sibling_indices[m]].JID, Nodes[sibling_indices[m]].Succ, Nodes[sibling_indices[m]].Length)
+		# Adding Random Edges between siblings here, an edge only goes to a later sibling so the lengths are final in this order
+		for n in range(0, len(sibling_indices)):
+			for m in range(n+1, len(sibling_indices)):
+				AddEdge = ShouldAddEdge()
+				if AddEdge == True:
+					if Nodes[sibling_indices[n]].ResourceType != SS_RSC: # No random edges between self suspending nodes
+						Nodes[sibling_indices[m]].Pred.append(Nodes[sibling_indices[n]].JID)
+						Nodes[sibling_indices[n]].Succ.append(Nodes[sibling_indices[m]].JID)
+						if Nodes[sibling_indices[m]].Length <= Nodes[sibling_indices[n]].Length:
+							Nodes[sibling_indices[m]].Length = Nodes[sibling_indices[n]].Length + 1
 
-					while True: 
-						try:
-							TermNode.Pred.remove(Nodes[sibling_indices[n]].JID)
-							Nodes[sibling_indices[n]].Succ.remove(TermNode.JID)
-						except ValueError:
-							break
+						removeTerminalEdges(Nodes[sibling_indices[n]], TermNode)
 
-	if len(lvJoiningNode.Pred) >= 1:
-		lvNodeCounter = expandSeriesParallelNNFJDAG(lvNodeCounter, Nodes, TaskNr, lvJoiningNode, TermNode, Depth+1, NodesCreated)
+		if len(lvJoiningNode.Pred) == 0:
+			return lvNodeCounter
 
-	return lvNodeCounter
+		# The joining node is the root of the next level, its length decides whether the DAG gets any longer
+		lvJoiningNode.Length = max([Nodes[p].Length for p in lvJoiningNode.Pred]) + 1
 
-# this function creates nested fork-join dag tasks
-def expandSeriesParallelNestedFJDAG(NodeCounter, Nodes, TaskNr, RootNode, JoiningNode, TermNode, Depth, TaskNodesCreated = 2):
-	lvNodeCounter = NodeCounter
-	NodesCreated = TaskNodesCreated
+		RootNode = lvJoiningNode
+		Depth += 1
 
-	if (RootNode.Length >= MAX_LENGTH) or ((len(Nodes)+1) >= MAX_NODES):
+'''
+The nested fork-join expansion keeps the state of each node whose siblings are being forked in an ExpansionFrame on an
+explicit stack instead of the call stack, so the size and depth of the DAGs are not bounded by the recursion limit.
+The frames are expanded depth-first in the order of the recursive expansion, so the DAGs get the same random decisions.
+'''
+class ExpansionFrame:
+	__slots__ = ('RootNode', 'JoiningNode', 'Depth', 'NodesCreated', 'Siblings', 'SiblingIndices', 'lvJoiningNode', 'SelfSuspendingFound')
+
+	def __init__(self, RootNode, JoiningNode, Depth):
+		self.RootNode 				= RootNode
+		self.JoiningNode 			= JoiningNode
+		self.Depth 					= Depth
+		self.NodesCreated 			= 0
+		self.Siblings 				= 0
+		self.SiblingIndices 		= []
+		self.lvJoiningNode 			= None
+		self.SelfSuspendingFound 	= False
+
+# This returns the frame forking the siblings of RootNode, or None when RootNode is joined right away
+def openNestedFJFrame(Nodes, TaskNr, RootNode, JoiningNode, TermNode, Depth, NodesCreated):
+	if (RootNode.Length >= MAX_LENGTH) or ((len(Nodes)+1) >= EXPANSION_MAX_NODES):
 		TermNode.Pred.append(RootNode.JID)
 		RootNode.Succ.append(TermNode.JID)
-		return NodeCounter
+		return None
 	elif (Depth >= MAX_RECURSION_DEPTH):
 		JoiningNode.Pred.append(RootNode.JID)
 		RootNode.Succ.append(JoiningNode.JID)
 		if JoiningNode.Length <= RootNode.Length:
 			JoiningNode.Length = RootNode.Length + 1
-		return NodeCounter
+		return None
 
-	siblings = getSiblingsCount(NodesCreated)
+	Frame = ExpansionFrame(RootNode, JoiningNode, Depth)
+	Frame.Siblings = getSiblingsCount(NodesCreated)
 
-	if siblings == 0:
+	if Frame.Siblings == 0:
 		TermNode.Pred.append(RootNode.JID)
 		RootNode.Succ.append(TermNode.JID)
 
-	NodesCreated += siblings
-	
-	sibling_indices = []
-	JoiningNodes = []
-	
+	Frame.NodesCreated = NodesCreated + Frame.Siblings
+
 	# New Joining Node Here
-	lvJoiningNode = newNode(TaskNr, -1, -1)
+	Frame.lvJoiningNode = newNode(TaskNr, -1, -1)
 
 	if WANT_HETEROGENEOUS == True:
-		lvJoiningNode.ResourceType = 1
-
-	lvSelfSuspendingFound = False
-
-	for n in range(0, siblings):
-		sNode = newNode(TaskNr, lvNodeCounter, RootNode.JID)
-		sNode.Length = RootNode.Length + 1
-		RootNode.Succ.append(sNode.JID)
-		sibling_indices.append(sNode.JID)
-		Nodes.append(sNode)
-		lvNodeCounter += 1
-		
-		if SELF_SUSPENDING == True: # Check if one sibling is already self suspending
-			if (sNode.ResourceType == SS_RSC) and (lvSelfSuspendingFound == False): #if not Found first SS
-				lvSelfSuspendingFound = True
-			elif (sNode.ResourceType == SS_RSC) and (lvSelfSuspendingFound == True): #if Yes, ReAssign Resource
-				if RSC_ASSIGNMENT_BY_PROBABILITY == False:
-					sNode.ResourceType = getRandomResourceAssignment(SelfSuspending = False)
-				else:
-					sNode.ResourceType = getResourceAssignmentbyProbability(SelfSuspending = False)
+		Frame.lvJoiningNode.ResourceType = 1
 
-		Result = isTerminalNodeOrParallelSubGraph()
+	return Frame
 
-		if (Result == IS_TERMINAL) and (sNode.ResourceType != SS_RSC) and (lvNodeCounter >= MIN_NODES):
-			TermNode.Pred.append(sNode.JID)
-			sNode.Succ.append(TermNode.JID)
-		else:
-			if WANT_HETEROGENEOUS == True:
-				if sNode.ResourceType == 1:
-					lvNodeCounter = expandSeriesParallelNestedFJDAG(lvNodeCounter, Nodes, TaskNr, sNode, lvJoiningNode, TermNode, Depth+1, NodesCreated)
-				else:
-					lvJoiningNode.Pred.append(sNode.JID)
-					sNode.Succ.append(lvJoiningNode.JID)
-					if lvJoiningNode.Length <= sNode.Length:
-						lvJoiningNode.Length = sNode.Length + 1
-			else:
-				if sNode.ResourceType == SS_RSC:
-					lvJoiningNode.Pred.append(sNode.JID)
-					sNode.Succ.append(lvJoiningNode.JID)
-					if lvJoiningNode.Length <= sNode.Length:
-						lvJoiningNode.Length = sNode.Length + 1                    
-				else:
-					lvNodeCounter = expandSeriesParallelNestedFJDAG(lvNodeCounter, Nodes, TaskNr, sNode, lvJoiningNode, TermNode, Depth+1, NodesCreated)
-						
+# Once all the siblings of a frame are expanded, they are joined and get the random edges between them
+def closeNestedFJFrame(NodeCounter, Nodes, Frame, TermNode):
+	lvNodeCounter = NodeCounter
+	lvJoiningNode = Frame.lvJoiningNode
+	JoiningNode = Frame.JoiningNode
+	sibling_indices = Frame.SiblingIndices
 
 	if len(lvJoiningNode.Pred) >= 1:
 		Max_Length = 0
@@ -1770,34 +1789,93 @@ def expandSeriesParallelNestedFJDAG(NodeCounter, Nodes, TaskNr, RootNode, Joinin
 				if Nodes[sibling_indices[n]].ResourceType != SS_RSC: # No random edges between self suspending nodes
 					Nodes[sibling_indices[m]].Pred.append(Nodes[sibling_indices[n]].JID)
 					Nodes[sibling_indices[n]].Succ.append(Nodes[sibling_indices[m]].JID)
-					if Nodes[sibling_indices[m]].Length <= Nodes[sibling_indices[n]].Length:
-						Nodes[sibling_indices[m]].Length = Nodes[sibling_indices[n]].Length + 1
-						updateLengths(Nodes, Nodes[sibling_indices[m]].JID, Nodes[sibling_indices[m]].Succ, Nodes[sibling_indices[m]].Length)
 
-					while True: 
-						try:
-							TermNode.Pred.remove(Nodes[sibling_indices[n]].JID)
-							Nodes[sibling_indices[n]].Succ.remove(TermNode.JID)
-						except ValueError:
-							break
+					removeTerminalEdges(Nodes[sibling_indices[n]], TermNode)
+
+	return lvNodeCounter
+
+# this function creates nested fork-join dag tasks
+def expandSeriesParallelNestedFJDAG(NodeCounter, Nodes, TaskNr, RootNode, JoiningNode, TermNode, Depth, TaskNodesCreated = 2):
+	lvNodeCounter = NodeCounter
+	Stack = []
+
+	Frame = openNestedFJFrame(Nodes, TaskNr, RootNode, JoiningNode, TermNode, Depth, TaskNodesCreated)
+	if Frame != None:
+		Stack.append(Frame)
+
+	while len(Stack) > 0:
+		Frame = Stack[-1]
+
+		if len(Frame.SiblingIndices) == Frame.Siblings:
+			Stack.pop()
+			lvNodeCounter = closeNestedFJFrame(lvNodeCounter, Nodes, Frame, TermNode)
+			continue
+
+		sNode = newNode(TaskNr, lvNodeCounter, Frame.RootNode.JID)
+		sNode.Length = Frame.RootNode.Length + 1
+		Frame.RootNode.Succ.append(sNode.JID)
+		Frame.SiblingIndices.append(sNode.JID)
+		Nodes.append(sNode)
+		lvNodeCounter += 1
+		
+		if SELF_SUSPENDING == True: # Check if one sibling is already self suspending
+			if (sNode.ResourceType == SS_RSC) and (Frame.SelfSuspendingFound == False): #if not Found first SS
+				Frame.SelfSuspendingFound = True
+			elif (sNode.ResourceType == SS_RSC) and (Frame.SelfSuspendingFound == True): #if Yes, ReAssign Resource
+				if RSC_ASSIGNMENT_BY_PROBABILITY == False:
+					sNode.ResourceType = getRandomResourceAssignment(SelfSuspending = False)
+				else:
+					sNode.ResourceType = getResourceAssignmentbyProbability(SelfSuspending = False)
+
+		Result = isTerminalNodeOrParallelSubGraph()
+
+		if (Result == IS_TERMINAL) and (sNode.ResourceType != SS_RSC) and (lvNodeCounter >= EXPANSION_MIN_NODES):
+			TermNode.Pred.append(sNode.JID)
+			sNode.Succ.append(TermNode.JID)
+		elif ((WANT_HETEROGENEOUS == True) and (sNode.ResourceType == 1)) or ((WANT_HETEROGENEOUS == False) and (sNode.ResourceType != SS_RSC)):
+			# The sibling forks its own siblings before the next sibling of this frame is created
+			Child = openNestedFJFrame(Nodes, TaskNr, sNode, Frame.lvJoiningNode, TermNode, Frame.Depth+1, Frame.NodesCreated)
+			if Child != None:
+				Stack.append(Child)
+		else:
+			Frame.lvJoiningNode.Pred.append(sNode.JID)
+			sNode.Succ.append(Frame.lvJoiningNode.JID)
+			if Frame.lvJoiningNode.Length <= sNode.Length:
+				Frame.lvJoiningNode.Length = sNode.Length + 1
 
 	return lvNodeCounter
 
+def newRootNode(TaskNr):
+	RootNode = newNode(TaskNr, 0, -1)
+	RootNode.ResourceType = 1
+	RootNode.Length = 0
+	RootNode.Deadline = 0
+
+	if JITTER_TYPE == "WITH_PRECEDENCE":
+		RootNode.r_min = RELEASE_JITTER_R_Min
+		RootNode.r_max = RELEASE_JITTER_R_Max
+
+	return RootNode
+
 def Generate_DAG_Task(TaskNr, FileName):
+	global EXPANSION_MIN_NODES
+	global EXPANSION_MAX_NODES
+
+	if DAG_SHAPE != "FJ":
+		return Generate_Shaped_DAG_Task(TaskNr)
+
 	Nodes = []
 	while((len(Nodes) < MIN_NODES)):
 
-		NodeCounter = 0
-
-		RootNode = newNode(TaskNr, NodeCounter, -1)
-		RootNode.ResourceType = 1
-		RootNode.Length = 0
-		RootNode.Deadline = 0
+		if CONSTRUCTIVE_GENERATION == True:
+			EXPANSION_MIN_NODES = EXPANSION_MAX_NODES = getRandomInteger(MIN_NODES, MAX_NODES)
+		else:
+			EXPANSION_MIN_NODES = MIN_NODES
+			EXPANSION_MAX_NODES = MAX_NODES
 
-		if JITTER_TYPE == "WITH_PRECEDENCE":
-			RootNode.r_min = RELEASE_JITTER_R_Min
-			RootNode.r_max = RELEASE_JITTER_R_Max
+		NodeCounter = 0
 
+		RootNode = newRootNode(TaskNr)
 		Nodes.append(RootNode)
 		
 		NodeCounter += 1 
@@ -1822,103 +1900,198 @@ def Generate_DAG_Task(TaskNr, FileName):
 					if Nodes[TermNode.Pred[n]].Succ[m] == -1:
 						Nodes[TermNode.Pred[n]].Succ[m] = TermNode.JID
 
-			Max_Length = 0
-			for n in range(0, len(TermNode.Pred)):
-				if Max_Length <= Nodes[TermNode.Pred[n]].Length:
-					Max_Length = Nodes[TermNode.Pred[n]].Length
-
-			TermNode.Length = Max_Length + 1
 			Nodes.append(TermNode)
 
+			if CONSTRUCTIVE_GENERATION == True:
+				while len(Nodes) < EXPANSION_MIN_NODES:
+					addParallelNode(TaskNr, Nodes)
+				if WANT_ALL_RSC_TYPE_NODES == True:
+					RepairResourceTypes(TaskNr, Nodes)
+
+			updateLengths(Nodes)
+
 			RSC_Types_Used = getUsedRSCTypes(Nodes)
 
 		if (WANT_ALL_RSC_TYPE_NODES == True) and (len(RSC_Types_Used) < RESOURCE_TYPES):
+			PROFILE.Reject("RSC_COVERAGE")
 			Nodes.clear()
+		elif len(Nodes) < MIN_NODES:
+			PROFILE.Reject("MIN_NODES")
 		
+	return getDAGTask(TaskNr, Nodes)
+
+'''
+In the constructive mode ('-cg') the expansion of each DAG aims at a node count drawn from [Min_Nodes, Max_Nodes]: its
+branches are neither terminated before nor expanded beyond the drawn count, with the same probabilities, branches and depth.
+A DAG which still ends short of its count grows nodes parallel to its existing ones, and with '-rsc' the missing resource
+types are assigned to nodes whose type is used elsewhere in the DAG, so that the DAGs are not generated again.
+'''
+# The nodes with a single predecessor and successor can be assigned another resource or get a parallel node
+def getLeafNodes(Nodes):
+	return [Node for Node in Nodes[1:-1] if (len(Node.Pred) == 1) and (len(Node.Succ) == 1)]
+
+# This adds a node parallel to a random leaf node, the terminal node is moved behind it to stay the last node
+def addParallelNode(TaskNr, Nodes):
+	TermNode = Nodes.pop()
+	JID = TermNode.JID
+
+	TermNode.JID = JID + 1
+	for n in range(0, len(TermNode.Pred)):
+		Nodes[TermNode.Pred[n]].Succ = [TermNode.JID if m == JID else m for m in Nodes[TermNode.Pred[n]].Succ]
+
+	LeafNodes = getLeafNodes(Nodes+[TermNode])
+
+	if len(LeafNodes) > 0:
+		Sibling = LeafNodes[getRandomInteger(0, len(LeafNodes)-1)]
+		pNode = newNode(TaskNr, JID, Sibling.Pred[0])
+		pNode.Succ.append(Sibling.Succ[0])
+	else:
+		# Without leaf nodes the first edge of the root is split
+		Succ = Nodes[0].Succ[0] if len(Nodes[0].Succ) > 0 else TermNode.JID
+		pNode = newNode(TaskNr, JID, 0)
+		pNode.Succ.append(Succ)
+		if Succ in Nodes[0].Succ:
+			Nodes[0].Succ.remove(Succ)
+			(TermNode if Succ == TermNode.JID else Nodes[Succ]).Pred.remove(0)
+
+	Siblings = [m for m in Nodes[pNode.Pred[0]].Succ]
+	Nodes[pNode.Pred[0]].Succ.append(pNode.JID)
+	Nodes.append(pNode)
+	Nodes.append(TermNode)
+	Nodes[pNode.Succ[0]].Pred.append(pNode.JID)
+
+	# The resources of the siblings follow the rules of the expansion
+	if (SELF_SUSPENDING == True) and (pNode.ResourceType == SS_RSC) and (SS_RSC in [Nodes[m].ResourceType for m in Siblings]):
+		pNode.ResourceType = getRandomResourceAssignment(SelfSuspending = False)
+	if (WANT_HETEROGENEOUS == True) and (NON_NESTED_FORK_JOIN == True) and (pNode.ResourceType in [Nodes[m].ResourceType for m in Siblings]):
+		pNode.ResourceType = 1
+
+	return pNode
+
+# This assigns each missing resource type to a leaf node whose type is used by other nodes as well, or to a new parallel node
+def RepairResourceTypes(TaskNr, Nodes):
+	for RSC in range(1, RESOURCE_TYPES+1):
+		Types = [Node.ResourceType for Node in Nodes]
+		if RSC in Types:
+			continue
+
+		LeafNodes = [Node for Node in getLeafNodes(Nodes) if Types.count(Node.ResourceType) > 1]
+		if len(LeafNodes) > 0:
+			Node = LeafNodes[getRandomInteger(0, len(LeafNodes)-1)]
+		else:
+			Node = addParallelNode(TaskNr, Nodes)
+
+		Node.ResourceType = RSC
+
+'''
+With '-sh LAYERED' or '-sh GNP' the DAG tasks get the shape of layer-by-layer random DAGs (with Max_Depth layers) or
+of G(n,p) DAGs instead of a fork-join shape. Their inner nodes are created like the nodes of the expansion, the edges
+between them are drawn at once with the probability Prob_Add_Edge (see dag_shapes.py). As in the fork-join DAGs, the
+root node precedes the inner nodes without predecessors and the terminal node succeeds the ones without successors.
+'''
+def getShapedNodes(TaskNr):
+	Count = getRandomInteger(MIN_NODES, MAX_NODES)
+
+	RootNode = newRootNode(TaskNr)
+	if Count <= 1:
+		return [RootNode]
+
+	Inner = Count - 2
+	Nodes = [RootNode] + [newNode(TaskNr, JID, -1) for JID in range(1, Inner+1)]
+
+	if DAG_SHAPE == "LAYERED":
+		Adjacency = getLayeredAdjacency(RANDOM_SOURCE, Inner, MAX_RECURSION_DEPTH, PROB_ADD_EDGE)
+	else:
+		Adjacency = getGNPAdjacency(RANDOM_SOURCE, Inner, PROB_ADD_EDGE)
+
+	TermNode = newNode(TaskNr, -1, -1)
+	TermNode.JID = Inner + 1
+	TermNode.ResourceType = 1
+
+	# The JID of an inner node is its index in the adjacency matrix + 1
+	for Node, Pred, Succ in zip(Nodes[1:], getAdjacencyLists(Adjacency.T), getAdjacencyLists(Adjacency)):
+		if len(Pred) > 0:
+			Node.Pred = [p+1 for p in Pred]
+		else:
+			Node.Pred = [RootNode.JID]
+			RootNode.Succ.append(Node.JID)
+
+		if len(Succ) > 0:
+			Node.Succ = [s+1 for s in Succ]
+		else:
+			Node.Succ = [TermNode.JID]
+			TermNode.Pred.append(Node.JID)
+
+	if Inner == 0:
+		RootNode.Succ.append(TermNode.JID)
+		TermNode.Pred.append(RootNode.JID)
+
+	Nodes.append(TermNode)
+
 	return Nodes
 
-def Vertex_in_List(vertex, List):
-	for n in range(0, len(List)):
-		if vertex.JID == List[n].JID:
-			return True
-	return False
+def Generate_Shaped_DAG_Task(TaskNr):
+	while True:
+		Nodes = getShapedNodes(TaskNr)
 
-def UpdateParallelVertices_of_EachVertex(TaskInfo, AllPaths):
-	for vertex in range(0, len(TaskInfo)):
-		TaskInfo[vertex].Par_v.clear()
-		CommonPaths = []
-		UncommonPaths = []
+		if (CONSTRUCTIVE_GENERATION == True) and (WANT_ALL_RSC_TYPE_NODES == True) and (len(Nodes) > 1):
+			RepairResourceTypes(TaskNr, Nodes)
 
-		for path in range(0, len(AllPaths)):
-			if (Vertex_in_List(TaskInfo[vertex], AllPaths[path]) == False):
-				UncommonPaths.append(AllPaths[path])
-			else:
-				CommonPaths.append(AllPaths[path])
-
-		for uPath in range(0, len(UncommonPaths)):
-			for uVertex in range(0, len(UncommonPaths[uPath])):
-				if (UncommonPaths[uPath][uVertex].ResourceType == TaskInfo[vertex].ResourceType):
-					SkipVertex = False
-					for cPath in range(0, len(CommonPaths)):
-						for cVertex in range(0, len(CommonPaths[cPath])):
-							if ((UncommonPaths[uPath][uVertex].JID == CommonPaths[cPath][cVertex].JID) == True):
-								SkipVertex = True
-								break
-						if SkipVertex == True:
-							break
-					if SkipVertex == False:
-						if (Vertex_in_List(UncommonPaths[uPath][uVertex], TaskInfo[vertex].Par_v) == False):
-							TaskInfo[vertex].Par_v.append(UncommonPaths[uPath][uVertex])
-		
-		CommonPaths.clear()
-		UncommonPaths.clear()   
-		TaskInfo[vertex].Par_v.sort(key=lambda v:v.JID)
-
-def UpdateDescendants_of_EachVertex(TaskInfo, AllPaths):
-	for vertex in range(0, len(TaskInfo)):   
-		TaskInfo[vertex].Desc.clear()
-		CommonPaths = []
-		for path in range(0, len(AllPaths)):
-			if (Vertex_in_List(TaskInfo[vertex], AllPaths[path]) == True):
-				CommonPaths.append(AllPaths[path])
-						
-		for path in range(0, len(CommonPaths)):     
-			for uVertex in range(0, len(CommonPaths[path])):
-				if CommonPaths[path][uVertex].JID > TaskInfo[vertex].JID:
-					if (Vertex_in_List(CommonPaths[path][uVertex], TaskInfo[vertex].Desc) == False):
-						TaskInfo[vertex].Desc.append(CommonPaths[path][uVertex])
-		CommonPaths.clear()
-		TaskInfo[vertex].Desc.sort(key=lambda v:v.JID)
-
-def UpdateAncestors_of_EachVertex(TaskInfo, AllPaths):
-	for vertex in range(0, len(TaskInfo)):    
-		TaskInfo[vertex].Ancs.clear()
-		CommonPaths = []
-		for path in range(0, len(AllPaths)):
-			if (Vertex_in_List(TaskInfo[vertex], AllPaths[path]) == True):
-				CommonPaths.append(AllPaths[path])
-						
-		for path in range(0, len(CommonPaths)):     
-			for uVertex in range(0, len(CommonPaths[path])):
-				if CommonPaths[path][uVertex].JID < TaskInfo[vertex].JID:
-					if (Vertex_in_List(CommonPaths[path][uVertex], TaskInfo[vertex].Ancs) == False):
-						TaskInfo[vertex].Ancs.append(CommonPaths[path][uVertex])
-		CommonPaths.clear()
-		TaskInfo[vertex].Ancs.sort(key=lambda v:v.JID)
+		if (WANT_ALL_RSC_TYPE_NODES == True) and (len(getUsedRSCTypes(Nodes)) < RESOURCE_TYPES):
+			PROFILE.Reject("RSC_COVERAGE")
+			continue
+
+		updateLengths(Nodes)
+
+		return getDAGTask(TaskNr, Nodes)
+
+# The expanded nodes, which are appended in the order of their JIDs, are frozen into the columns and the CSR arrays of a DAGTask
+def getDAGTask(TaskNr, Nodes):
+	Task = DAGTask(TaskNr, 0, 0, 0)
+
+	for Node in Nodes:
+		Task.AddVertex(Node.JID+1, Node.r_min, Node.r_max, Node.BCET, Node.WCET, Node.ResourceType, [p+1 for p in Node.Pred])
+
+	Task.Freeze()
+	Task.Length = np.array([Node.Length for Node in Nodes], dtype=np.int32)
+
+	return Task
+
+# This returns the nodes of a task for the visuals
+def getTaskNodes(Task):
+	Nodes = []
+	Columns = zip(Task.r_min.tolist(), Task.r_max.tolist(), Task.BCET.tolist(), Task.WCET.tolist(), Task.ResourceType.tolist(), Task.Length.tolist())
+
+	for vertex, (r_min, r_max, BCET, WCET, RSC, Length) in enumerate(Columns):
+		Node = NodeInfo()
+		Node.TID = Task.TID
+		Node.JID = vertex
+		Node.r_min = r_min
+		Node.r_max = r_max
+		Node.BCET = BCET
+		Node.WCET = WCET
+		Node.ResourceType = RSC
+		Node.Length = Length
+		Node.Pred = Task.getPredecessors(vertex)
+		Node.Succ = Task.getSuccessors(vertex).copy()
+		Nodes.append(Node)
+
+	return Nodes
 
 '''
 This function generates the utilizations of DAG tasks w.r.t UUnifast Discard. Here the threshold of utilization is set with
 some tolerance specified in fixed settings at the top of this script.
 '''
+def getHardCondition(Tasks, Utilization):
+	if ((Utilization/Tasks)*100) > UTILIZATION_TOLERANCE_PERCENTAGE:
+		return math.ceil(Utilization/Tasks) + (math.ceil(Utilization/Tasks)*UTILIZATION_TOLERANCE)
+	else:
+		return math.ceil(Utilization/Tasks)
+
 def getUtilizationUUnifastDiscard(Tasks, Utilization):
 	UtilizationCondition = False
 	UtilizationPerTaskList = []
-	Hard_Condition = 0.0
-
-	if ((Utilization/Tasks)*100) > UTILIZATION_TOLERANCE_PERCENTAGE:
-		Hard_Condition = math.ceil(Utilization/Tasks) + (math.ceil(Utilization/Tasks)*UTILIZATION_TOLERANCE)
-	else:
-		Hard_Condition = math.ceil(Utilization/Tasks)
+	Hard_Condition = getHardCondition(Tasks, Utilization)
 
 	Tries = 0
 
@@ -1927,6 +2100,7 @@ def getUtilizationUUnifastDiscard(Tasks, Utilization):
 		Tries += 1
 
 		if Tries > DEFAULT_TASK_UUFD_TRIES:
+			PROFILE.Reject("UUFD_TRIES")
 			break
 
 		UtilizationPerTaskList = UUniFast(Tasks, Utilization)       
@@ -1937,6 +2111,7 @@ def getUtilizationUUnifastDiscard(Tasks, Utilization):
 				if DEBUG == 'e':
 					print("Failed for Generated Utilizations Due to Task:%d Utilization:%f > %f (UUFD)"\
 						%(n+1, UtilizationPerTaskList[n], Hard_Condition))
+				PROFILE.Reject("UUFD_DISCARD")
 				break
 			else:
 				UtilizationCondition = True
@@ -1946,19 +2121,37 @@ def getUtilizationUUnifastDiscard(Tasks, Utilization):
 def getUtilizationUUnifast(Tasks, Utilization):
 	return UUniFast(Tasks, Utilization)
 
+# RandFixSum draws the utilizations uniformly below the hard condition of UUFD, so no utilizations are discarded
+def getUtilizationRandFixSum(Tasks, Utilization, Sets):
+	return RandFixSum(RANDOM_SOURCE, Tasks, Utilization, Sets, 0.0, getHardCondition(Tasks, Utilization)).tolist()
+
+# This returns the utilizations of a task set, RandFixSum draws a batch of them into RFS_CANDIDATES for the next task sets
+def getUtilizationPerTask(Tasks, Utilization):
+	if UTILIZATION_METHOD == "UUFD":
+		return getUtilizationUUnifastDiscard(Tasks, Utilization)
+	elif UTILIZATION_METHOD == "RFS":
+		Candidates = RFS_CANDIDATES.setdefault((Tasks, Utilization), [])
+		if len(Candidates) == 0:
+			Candidates.extend(getUtilizationRandFixSum(Tasks, Utilization, DEFAULT_RFS_CANDIDATES))
+		return Candidates.pop()
+	else:
+		return getUtilizationUUnifast(Tasks, Utilization)
+
 # This is a high level call to create visuals of a task
-def CreateGraphFile(TaskNr, TaskInfo, outAllPaths, FileName):
+def CreateGraphFile(TaskNr, Task, FileName):
 	AllLongestPaths =[]
 	CriticalPaths =[]
 	CriticalPaths_WCET  =   0
 	
-	if len(TaskInfo) >= MIN_NODES:
+	if len(Task) >= MIN_NODES:
+
+		TaskInfo = getTaskNodes(Task)
 
 		if WANT_CRITICAL_PATH_JOBS and (MAX_NODES > 1):
 			AllLongestPaths = getLongestJobPaths(TaskInfo, TaskInfo[len(TaskInfo) - 1])
 			CriticalPaths, CriticalPaths_WCET = getCriticalPaths_wrt_Jobs(AllLongestPaths)
 		elif WANT_CRITICAL_PATH_WCET and (MAX_NODES > 1):                    
-			CriticalPaths, CriticalPaths_WCET = getCriticalPaths_wrt_WCET(outAllPaths)
+			CriticalPaths, CriticalPaths_WCET = getCriticalPathInfo(TaskInfo, WantPaths = True)
 
 		# print("Task%d --> NodeCount:%d Length:%d TerminalNodes:%d"%(n+1, len(TaskSetList[n]), TaskSetList[n][len(TaskSetList[n]) - 1].Length, len(TaskSetList[n][len(TaskSetList[n]) - 1].Pred)))
 		
@@ -1966,97 +2159,103 @@ def CreateGraphFile(TaskNr, TaskInfo, outAllPaths, FileName):
 
 	return CriticalPaths
 
+# This returns the edges of the critical paths as a set of (Pred, JobID) pairs
+def getCriticalPathEdges(CriticalPaths):
+	CriticalPathEdges = set()
+	for Path in CriticalPaths:
+		CriticalPathEdges.update(zip(Path[:-1], Path[1:]))
+	return CriticalPathEdges
+
 # This function checks if there exists an edge in a path.
-def EdgeExists_in_Paths(CriticalPaths, Pred, JobID):
-	for m in range(0, len(CriticalPaths)):
-		for n in range(0, len(CriticalPaths[m])):
-			if (CriticalPaths[m][n].JID == CriticalPaths[m][len(CriticalPaths[m])-1]):
-				break 
-			else:
-				if (CriticalPaths[m][n].JID == Pred) and (CriticalPaths[m][n+1].JID == JobID):
-					return True        
-	return False
+def EdgeExists_in_Paths(CriticalPathEdges, Pred, JobID):
+	return (Pred, JobID) in CriticalPathEdges
 
 '''
 This removes the conflicting edge found during the process of converting 
-a Task graph into a pure nested-fork-join with no random edges
+a Task graph into a pure nested-fork-join with no random edges.
+The ancestors of the vertices are updated by the index along with the edge.
 '''
-def RemoveConflictingEdge(VTX, Pred, TaskNodes):
-	try:
-		Pred.Succ.remove(VTX.JID)
-		VTX.Pred.remove(Pred.JID)
-	except ValueError:
-		pass
-	# Update Necessary Task Information
-	outAllPaths = []
-	AllPaths = []
-	getAllPaths(TaskNodes, TaskNodes[0], outAllPaths, AllPaths)
-	UpdateAncestors_of_EachVertex(TaskNodes, outAllPaths)
+def RemoveConflictingEdge(VTX, Pred, Index, RemovedEdges):
+	if Index.RemoveEdge(Pred, VTX) == True:
+		RemovedEdges.append((Pred, VTX))
 
 '''
 This converts a task with random edges into a task with no random edges.
+The ancestors of the vertices are only taken into account once the first edge is removed.
+The edges are removed from predecessor and successor lists of vertex positions, which an AncestorIndex keeps along
+with the ancestor masks, and the removed edges are taken out of the task at the end.
 '''
 def Convert_to_NFJ_DAG(cNodes, CriticalPaths):
+	Pred = [[ID - 1 for ID in IDs] for IDs in cNodes.getPredecessorLists()]
+	Succ = [list(Successors) for Successors in cNodes.getSuccessorLists()]
+	Index = AncestorIndex(Pred, Succ)
+	CriticalPathEdges = getCriticalPathEdges(CriticalPaths)
+	RemovedEdges = []
+	Ancs = [0] * len(cNodes)
+
 	for vertex in range(0, len(cNodes)):
 		
-		if len(cNodes[vertex].Pred) > 1: 
+		if len(Pred[vertex]) > 1: 
 		   
-			PredLen = len(cNodes[vertex].Pred)
+			PredLen = len(Pred[vertex])
 
 			for pred in reversed(range(PredLen)):
 
 				try:
-					lvPredVertex = cNodes[cNodes[vertex].Pred[pred]]
+					lvPredVertex = Pred[vertex][pred]
 				except IndexError:
 					continue
 
 				ConflictingEdge = False
 
-				for succ in range(0, len(lvPredVertex.Succ)):
-					if (lvPredVertex.Succ[succ] != cNodes[vertex].JID) \
-					and (Vertex_in_List(cNodes[lvPredVertex.Succ[succ]], cNodes[vertex].Ancs) == False):
+				for succ in Succ[lvPredVertex]:
+					if (succ != vertex) and (((Ancs[vertex] >> succ) & 1) == 0):
 						ConflictingEdge = True
 						break
 
 				if (ConflictingEdge == True):
 					if CONVERT_TO_NFJ_DAG == RESERVED:
-						if EdgeExists_in_Paths(CriticalPaths, lvPredVertex.JID, cNodes[vertex].JID) == False:
-							RemoveConflictingEdge(cNodes[vertex], cNodes[cNodes[vertex].Pred[pred]], cNodes)
+						if EdgeExists_in_Paths(CriticalPathEdges, lvPredVertex, vertex) == False:
+							RemoveConflictingEdge(vertex, lvPredVertex, Index, RemovedEdges)
 							PredLen = PredLen - 1
 					else:
-						RemoveConflictingEdge(cNodes[vertex], cNodes[cNodes[vertex].Pred[pred]], cNodes)
+						RemoveConflictingEdge(vertex, lvPredVertex, Index, RemovedEdges)
 						PredLen = PredLen - 1
 				
 				if ConflictingEdge == False:
-					lvPredLen = len(cNodes[vertex].Pred)
+					lvPredLen = len(Pred[vertex])
 					for p in reversed(range(lvPredLen)):
-						if cNodes[vertex].Pred[p] in lvPredVertex.Pred:
+						if Pred[vertex][p] in Pred[lvPredVertex]:
 							if CONVERT_TO_NFJ_DAG == RESERVED:
-								if EdgeExists_in_Paths(CriticalPaths, lvPredVertex.JID, cNodes[vertex].JID) == False:
-									RemoveConflictingEdge(cNodes[vertex], cNodes[cNodes[vertex].Pred[p]], cNodes)
+								if EdgeExists_in_Paths(CriticalPathEdges, lvPredVertex, vertex) == False:
+									RemoveConflictingEdge(vertex, Pred[vertex][p], Index, RemovedEdges)
 									lvPredLen = lvPredLen - 1
 									PredLen = PredLen - 1
 									if(PredLen == 1):
 										break
 							else:
-								RemoveConflictingEdge(cNodes[vertex], cNodes[cNodes[vertex].Pred[p]], cNodes)
+								RemoveConflictingEdge(vertex, Pred[vertex][p], Index, RemovedEdges)
 								lvPredLen = lvPredLen - 1
 								PredLen = PredLen - 1
 								if(PredLen == 1):
 									break
 
+				# The masks of the index are kept up to date in place
+				if len(RemovedEdges) > 0:
+					Ancs = Index.Ancs
+
 				if PredLen > 1:
 					for n in reversed(range(PredLen)):
 						for vtx in reversed(range(PredLen)):
-							if (Vertex_in_List(cNodes[cNodes[vertex].Pred[n]], cNodes[cNodes[vertex].Pred[vtx]].Ancs) == True):
+							if ((Ancs[Pred[vertex][vtx]] >> Pred[vertex][n]) & 1) == 1:
 								if CONVERT_TO_NFJ_DAG == RESERVED:
-									if EdgeExists_in_Paths(CriticalPaths, lvPredVertex.JID, cNodes[vertex].JID) == False:
-										RemoveConflictingEdge(cNodes[vertex], cNodes[cNodes[vertex].Pred[n]], cNodes)
+									if EdgeExists_in_Paths(CriticalPathEdges, lvPredVertex, vertex) == False:
+										RemoveConflictingEdge(vertex, Pred[vertex][n], Index, RemovedEdges)
 										PredLen = PredLen - 1
 										if(PredLen == 1):
 											break
 								else:
-									RemoveConflictingEdge(cNodes[vertex], cNodes[cNodes[vertex].Pred[n]], cNodes)
+									RemoveConflictingEdge(vertex, Pred[vertex][n], Index, RemovedEdges)
 									PredLen = PredLen - 1
 									if(PredLen == 1):
 										break
@@ -2067,6 +2266,9 @@ def Convert_to_NFJ_DAG(cNodes, CriticalPaths):
 				if(PredLen == 1):
 					break
 
+	for lvPred, lvVertex in RemovedEdges:
+		cNodes.RemoveEdge(lvPred, lvVertex)
+
 def remove_task_jobset(JobSetFileName, PredFileName, FileName=""):
 	if FileName != "":
 		lvCMD = "rm -rf "+FileName
@@ -2127,8 +2329,7 @@ def test_feasibility(Type="Heterogeneous", Workload="", threads=1):
 
 def ConvertTaskSet_for_Feasibility_Analysis(FA_TaskSetList):
 	for Task in range(0, len(FA_TaskSetList)):
-		for Vertex in range(0, len(FA_TaskSetList[Task])):
-			FA_TaskSetList[Task][Vertex].BCET = FA_TaskSetList[Task][Vertex].WCET
+		FA_TaskSetList[Task].BCET = FA_TaskSetList[Task].WCET.copy()
 
 # This retreives the task set priorities
 def getTaskSetPriorities(Periods):
@@ -2151,13 +2352,14 @@ def getTaskSetPriorities(Periods):
 # If it is not desired, simple use the command line option '-n F'
 def getNFJCovertedNodes(TaskSetList, cNodeList=[]):
 	for n in range(0, len(TaskSetList)):
-		outAllPaths = []
-		AllPaths = []
-		CriticalPaths = []
-		getAllPaths(TaskSetList[n], TaskSetList[n][0], outAllPaths, AllPaths)
-		CriticalPaths, CriticalPaths_WCET = getCriticalPaths_wrt_WCET(outAllPaths)
-		cNodes = copy.deepcopy(TaskSetList[n])
-		Convert_to_NFJ_DAG(cNodes, CriticalPaths)
+		# The critical paths are only consulted when conflicting edges on them are reserved ('-n R')
+		with PROFILE.Stage("Critical path"):
+			CriticalPaths, CriticalPaths_WCET = TaskSetList[n].getCriticalPathInfo(WantPaths = (CONVERT_TO_NFJ_DAG == RESERVED))
+		cNodes = TaskSetList[n].Clone()
+		with PROFILE.Stage("NFJ conversion"):
+			Convert_to_NFJ_DAG(cNodes, CriticalPaths)
+		# The closure of the conversion is not kept along with the converted task
+		cNodes.ClearCaches()
 		cNodeList.append(cNodes)
 
 # This function creates a task set.
@@ -2170,10 +2372,8 @@ def createWorkload(Run, Tasks, FileName, Utilization, subPath, GraphFileName):
 	cNodeList = []
 	UtilizationPerTaskList = []
 	
-	if (UTILIZATION_METHOD == "UUFD"):
-		UtilizationPerTaskList = getUtilizationUUnifastDiscard(Tasks, Utilization) 
-	else:
-		UtilizationPerTaskList = getUtilizationUUnifast(Tasks, Utilization)
+	with PROFILE.Stage("Utilization generation"):
+		UtilizationPerTaskList = getUtilizationPerTask(Tasks, Utilization)
 
 	if len(UtilizationPerTaskList) < 1:
 		if DEBUG == 'd':                
@@ -2193,6 +2393,7 @@ def createWorkload(Run, Tasks, FileName, Utilization, subPath, GraphFileName):
 		if ExtTries > DEFAULT_TASK_GENERATION_TRIES:
 			if DEBUG == 'e':                
 				print ("Failed for Number of Taskset Generation Tries Exceeded... DEFAULT Value:%d"%DEFAULT_TASK_GENERATION_TRIES)
+			PROFILE.Reject("TASKSET_TRIES")
 			return ERROR 
 
 		for Task in range(1, Tasks+1):                    
@@ -2205,10 +2406,12 @@ def createWorkload(Run, Tasks, FileName, Utilization, subPath, GraphFileName):
 			while (len(TaskNodes) < MIN_NODES):
 				Tries += 1
 				lvPeriod = 0                        
-				TaskNodes =   Generate_DAG_Task(Task, FileName)
+				with PROFILE.Stage("DAG expansion"):
+					TaskNodes =   Generate_DAG_Task(Task, FileName)
 
 				if (EQUAL_DEADLINE_TASKS_GENERATION == False):
-					lvPeriod = AssignPeriod(Task, TaskNodes, UtilizationPerTaskList[Task-1], Periods)
+					with PROFILE.Stage("Period assignment"):
+						lvPeriod = AssignPeriod(Task, TaskNodes, UtilizationPerTaskList[Task-1], Periods)
 					if lvPeriod == 0 or lvPeriod > MAX_PERIOD:
 						if DEBUG == 'e':
 							print("Failed for lvPeriod:%d Renew Utilization"%lvPeriod)
@@ -2218,11 +2421,12 @@ def createWorkload(Run, Tasks, FileName, Utilization, subPath, GraphFileName):
 				if (lvPeriod!=0) and (EQUAL_DEADLINE_TASKS_GENERATION == False): # Check if there is a duplicate period
 					if PERIOD_ASSIGNMENT == "Default":
 						if (isPeriodDuplicate(Periods, lvPeriod) == True):
-							TaskNodes.clear()
+							PROFILE.Reject("DUPLICATE_PERIOD")
+							TaskNodes = []
 
 				if (EQUAL_DEADLINE_TASKS_GENERATION == False):
 					if lvPeriod == 0:
-						TaskNodes.clear()
+						TaskNodes = []
 						if DEBUG == 'e':
 							print("Failed for lvPeriod:%d Cleared TaskNodes"%lvPeriod)
 					elif (len(TaskNodes) >= MIN_NODES):
@@ -2237,6 +2441,9 @@ def createWorkload(Run, Tasks, FileName, Utilization, subPath, GraphFileName):
 
 			if (EQUAL_DEADLINE_TASKS_GENERATION == False):
 				if (TaskGenerated == False) and (SkipNecessaryConditionCheck == False) or (Renew_Utilization == True):
+					# The period which renews the utilizations is already counted by its reason
+					if Renew_Utilization == False:
+						PROFILE.Reject("TASK_EXPANSION_TRIES")
 					SkipNecessaryConditionCheck = True
 					TimedOutTask = Task
 					Periods.clear()
@@ -2244,19 +2451,18 @@ def createWorkload(Run, Tasks, FileName, Utilization, subPath, GraphFileName):
 			TaskSetList.append(TaskNodes)
 
 		if SkipNecessaryConditionCheck == False:
-			if (EQUAL_DEADLINE_TASKS_GENERATION == False) and (len(Periods) == Tasks):
-				NecessaryConditionPass, TotalJobsPerHyperPeriod = checkNecessaryCondition(TaskSetList, UtilizationPerTaskList, (Utilization/TOTAL_COMPUTING_NODES), Periods)
-			else:
-				NecessaryConditionPass, TotalJobsPerHyperPeriod = checkNecessaryCondition(TaskSetList, UtilizationPerTaskList, (Utilization/TOTAL_COMPUTING_NODES), Periods)
+			with PROFILE.Stage("Necessary condition"):
+				if (EQUAL_DEADLINE_TASKS_GENERATION == False) and (len(Periods) == Tasks):
+					NecessaryConditionPass, TotalJobsPerHyperPeriod = checkNecessaryCondition(TaskSetList, UtilizationPerTaskList, (Utilization/TOTAL_COMPUTING_NODES), Periods)
+				else:
+					NecessaryConditionPass, TotalJobsPerHyperPeriod = checkNecessaryCondition(TaskSetList, UtilizationPerTaskList, (Utilization/TOTAL_COMPUTING_NODES), Periods)
 		else:
 			if DEBUG == 'e':
 				print("Failed for Timeout in Exploring the Task:%d NODES Nr_of_Periods:%d"%(TimedOutTask, len(Periods)))
 
 		if NecessaryConditionPass == False:
-			if (UTILIZATION_METHOD == "UUFD"):
-				UtilizationPerTaskList = getUtilizationUUnifastDiscard(Tasks, Utilization) 
-			else:
-				UtilizationPerTaskList = getUtilizationUUnifast(Tasks, Utilization)
+			with PROFILE.Stage("Utilization generation"):
+				UtilizationPerTaskList = getUtilizationPerTask(Tasks, Utilization)
 			if len(UtilizationPerTaskList) < 1:
 				if DEBUG == 'e':                
 					print ("Number of Utilization Generation Tries Exceeded... DEFAULT Value:%d"%DEFAULT_TASK_UUFD_TRIES)
@@ -2275,12 +2481,17 @@ def createWorkload(Run, Tasks, FileName, Utilization, subPath, GraphFileName):
 			getNFJCovertedNodes(TaskSetList, cNodeList)
 			
 			if WANT_TASKSET_FILES:
-				if CONVERT_TO_NFJ_DAG != False:					
-					create_tasks_file(Tasks, cNodeList, FileName, Periods, Priorities)
+				if CONVERT_TO_NFJ_DAG != False:
+					lvTaskSetList = cNodeList
 				else:
-					create_tasks_file(Tasks, TaskSetList, FileName, Periods, Priorities)
+					lvTaskSetList = TaskSetList
+				# The task set file is only kept aside the job set with '-j z'
+				if (WANT_JOBSET == False) or (WANT_TASKJOB_SET == True):
+					with PROFILE.Stage("File writing"):
+						create_tasks_file(Tasks, lvTaskSetList, FileName, Periods, Priorities)
 				if WANT_JOBSET:
-					JobSetFileName, PredFileName = create_job_set(FileName)
+					with PROFILE.Stage("Job expansion"):
+						JobSetFileName, PredFileName = create_job_set(FileName, Tasks, lvTaskSetList, Periods, Priorities)
 			else:
 				if DEBUG == 'd':
 					Print_TaskSet(TaskSetList, UtilizationPerTaskList, Periods, False)
@@ -2300,24 +2511,28 @@ def createWorkload(Run, Tasks, FileName, Utilization, subPath, GraphFileName):
 							exit(1)
 				
 				if CONVERT_TO_NFJ_DAG != False: 
-					FA_TaskSetList = copy.deepcopy(cNodeList)
+					FA_TaskSetList = [Task.Clone() for Task in cNodeList]
 				else:
-					FA_TaskSetList = copy.deepcopy(TaskSetList)
+					FA_TaskSetList = [Task.Clone() for Task in TaskSetList]
 
 				ConvertTaskSet_for_Feasibility_Analysis(FA_TaskSetList)
 
 				lvFileName = FileName.split('.')
 				TestFileName = lvFileName[0]+"_FA.csv"
 				
-				create_tasks_file(Tasks, FA_TaskSetList, TestFileName, Periods, Priorities)
-				TestJobSet, TestPredFile = create_job_set(TestFileName)
+				with PROFILE.Stage("Job expansion"):
+					TestJobSet, TestPredFile = create_job_set(TestFileName, Tasks, FA_TaskSetList, Periods, Priorities)
 				
 				Workload = TestJobSet+" -p "+TestPredFile
 
-				if (test_feasibility(FEASIBILITY_ANALYSIS, Workload, FEASIBILITY_ANALYSIS_THREADS) == False):
+				with PROFILE.Stage("nptest"):
+					lvSchedulable = test_feasibility(FEASIBILITY_ANALYSIS, Workload, FEASIBILITY_ANALYSIS_THREADS)
+
+				if (lvSchedulable == False):
 					
 					if DEBUG == 'e':
 						print("Failed Necessary Test via schedulability_analysis...")
+					PROFILE.Reject("NOT_FEASIBLE")
 					
 					Feasibility_Result = False
 
@@ -2338,32 +2553,18 @@ def createWorkload(Run, Tasks, FileName, Utilization, subPath, GraphFileName):
 		for n in range(0, len(TaskSetList)):
 
 			if CONVERT_TO_NFJ_DAG == False:
-			
-				outAllPaths = []
-				AllPaths = []
-				CriticalPaths = []
 
-				getAllPaths(TaskSetList[n], TaskSetList[n][0], outAllPaths, AllPaths)
-
-				UpdateParallelVertices_of_EachVertex(TaskSetList[n], outAllPaths)
-				UpdateDescendants_of_EachVertex(TaskSetList[n], outAllPaths) 
-				UpdateAncestors_of_EachVertex(TaskSetList[n], outAllPaths)
+				CriticalPaths = []
 		
-				CriticalPaths = CreateGraphFile(n, TaskSetList[n], outAllPaths, GraphFileName)
+				with PROFILE.Stage("Visuals"):
+					CriticalPaths = CreateGraphFile(n, TaskSetList[n], GraphFileName)
 
 			else:
-					
-				new_outAllPaths = []
-				new_AllPaths = []
-				getAllPaths(cNodeList[n], cNodeList[n][0], new_outAllPaths, new_AllPaths)
-
-				UpdateParallelVertices_of_EachVertex(cNodeList[n], new_outAllPaths)
-				UpdateDescendants_of_EachVertex(cNodeList[n], new_outAllPaths) 
-				UpdateAncestors_of_EachVertex(cNodeList[n], new_outAllPaths)
 						   
 				lvFileName = GraphFileName.split('.')
 				ConvertedFileName = lvFileName[0]+"_NFJ_DAG.csv"
-				CreateGraphFile(n, cNodeList[n], new_outAllPaths, ConvertedFileName)
+				with PROFILE.Stage("Visuals"):
+					CreateGraphFile(n, cNodeList[n], ConvertedFileName)
 	
 	if FEASIBLE:
 
@@ -2384,19 +2585,19 @@ def createWorkload(Run, Tasks, FileName, Utilization, subPath, GraphFileName):
 
 	return FEASIBLE
 
-# This creates a set of task set and job set files
-def CreateWorkloadRuns(path, Utilization, FA="NA"):
+# This opens the feasibility analysis report of a utilization point
+def openFeasibilityReport(path, FA):
 	fp = 0
 
 	if FA != "NA":
-					
+
 		NF_subPath = path+"/FEASIBILITY_ANALYSIS_REPORT/"
 
 		try:
 			os.mkdir(NF_subPath)
 		except OSError:
-			if os.path.isdir(NF_subPath) != True:    
-				if DEBUG == 'e':                
+			if os.path.isdir(NF_subPath) != True:
+				if DEBUG == 'e':
 					print ("Creation of the directory %s failed" % NF_subPath)
 				exit(1)
 
@@ -2409,103 +2610,438 @@ def CreateWorkloadRuns(path, Utilization, FA="NA"):
 				print ("Opening of File %s failed" % Feasibility_Result_File)
 				exit(1)
 
-	subPath = ""
+	return fp
 
-	for Tasks in range(MIN_N, MAX_N+TASK_MULTIPLES, TASK_MULTIPLES):
-		if UTILIZATION_METHOD == "UUFD":
-			lvHardC = 0
-			lvUtilTolerancePercentage = ((Utilization*TOTAL_COMPUTING_NODES)/Tasks)*100
-			if lvUtilTolerancePercentage > UTILIZATION_TOLERANCE_PERCENTAGE:
-				lvHardC = math.ceil(Utilization*TOTAL_COMPUTING_NODES/Tasks)+(math.ceil(Utilization*TOTAL_COMPUTING_NODES/Tasks)*UTILIZATION_TOLERANCE)
-			else:
-				lvHardC = math.ceil(Utilization*TOTAL_COMPUTING_NODES/Tasks)
-			print("***Hard Condition*** Total Utilization:%f Tasks:%d Utilization Per Task Should be <= %f"\
-				%(Utilization*TOTAL_COMPUTING_NODES, Tasks, lvHardC))
-		else:
-			print("***Hard Condition*** Total Utilization:%f Tasks:%d"%(Utilization*TOTAL_COMPUTING_NODES, Tasks))
+# This prints the hard condition on the utilization of the given number of tasks
+def printHardCondition(Utilization, Tasks):
+	if (UTILIZATION_METHOD == "UUFD") or (UTILIZATION_METHOD == "RFS"):
+		lvHardC = getHardCondition(Tasks, Utilization*TOTAL_COMPUTING_NODES)
+		print("***Hard Condition*** Total Utilization:%f Tasks:%d Utilization Per Task Should be <= %f"\
+			%(Utilization*TOTAL_COMPUTING_NODES, Tasks, lvHardC))
+	else:
+		print("***Hard Condition*** Total Utilization:%f Tasks:%d"%(Utilization*TOTAL_COMPUTING_NODES, Tasks))
+
+# This creates the directories of the task sets with the given number of tasks
+def createTaskCountDirectories(path, Tasks):
+	subPath = path+"Tasks_"+str(Tasks)+"/"
+	try:
+		os.mkdir(subPath)
+	except OSError:
+		if os.path.isdir(subPath) != True:
+			if DEBUG == 'e':
+				print ("Creation of the directory %s failed" % subPath)
+			exit(1)
 
-		subPath = path+"Tasks_"+str(Tasks)+"/"
+	GraphPath = ""
+	if WANT_GRAPH == True:
+		GraphPath = path+"Tasks_"+str(Tasks)+"/Visuals/"
 		try:
-			os.mkdir(subPath)
+			os.mkdir(GraphPath)
 		except OSError:
-			if os.path.isdir(subPath) != True:    
-				if DEBUG == 'e':                
-					print ("Creation of the directory %s failed" % subPath)
+			if os.path.isdir(GraphPath) != True:
+				if DEBUG == 'e':
+					print ("Creation of the directory %s failed" % GraphPath)
 				exit(1)
 
-		GraphPath = ""
-		if WANT_GRAPH == True:
-			GraphPath = path+"Tasks_"+str(Tasks)+"/Visuals/"
-			try:
-				os.mkdir(GraphPath)
-			except OSError:
-				if os.path.isdir(GraphPath) != True:    
-					if DEBUG == 'e':                
-						print ("Creation of the directory %s failed" % GraphPath)
-					exit(1)
+	return subPath, GraphPath
+
+# This returns the task set and graph file names of a run
+def getRunFileNames(subPath, GraphPath, Tasks, Run):
+	FileName = ""
+	GraphFileName = ""
+
+	if WANT_HETEROGENEOUS == True:
+		FileName = subPath+"Hetero_Tasks_"+str(Tasks)+"_Run_"+str(Run)+".csv"
+		if WANT_GRAPH:
+			GraphFileName =  GraphPath+"Hetero_Tasks_"+str(Tasks)+"_Run_"+str(Run)+".csv"
+	else:
+		FileName = subPath+"Typed_Tasks_"+str(Tasks)+"_Run_"+str(Run)+".csv"
+		if WANT_GRAPH:
+			GraphFileName =  GraphPath+"Typed_Tasks_"+str(Tasks)+"_Run_"+str(Run)+".csv"
+
+	return FileName, GraphFileName
+
+# This reports the feasibility of the task sets generated for the given number of tasks and removes the unwanted files
+def reportFeasibility(fp, Utilization, Tasks, FEASIBLE, NOT_FEASIBLE, subPath, lvSTR=""):
+	if (FEASIBILITY_ANALYSIS != "NA") and ((FEASIBLE+NOT_FEASIBLE) != 0):
+		lvSTR = "\nTasks:"+str(Tasks)+" Utilization:"+str(Utilization*100)+"% = "+str(Utilization*TOTAL_COMPUTING_NODES)+\
+		" Required_TaskSets:"+str(NR_OF_RUNS)+" Generated:"+str(FEASIBLE+NOT_FEASIBLE)+" => FEASIBLE_TASKSETS:"+str(FEASIBLE)+\
+		" NOT_FEASIBLE_TASKSETS:"+str(NOT_FEASIBLE)+" Feasibility_Ratio:"+str(FEASIBLE/(FEASIBLE+NOT_FEASIBLE))+"\n"
+
+		print(lvSTR)
+
+	if fp != 0:
+		fp.write("RESOURCE_TYPES:%d\n"%RESOURCE_TYPES)
+		for cores in range(0, len(CORES_PER_RESOURCE)):
+			fp.write("CORES_PER_RESOURCE[%d]:%d\n"%(cores+1, CORES_PER_RESOURCE[cores]))
+		fp.write(lvSTR)
+		fp.flush()
+
+	if (WANT_TASKSET_FILES == False) and (WANT_JOBSET == False) and (WANT_GRAPH == False):
+		lvCMD = "rm -rf "+subPath
+		run_command(lvCMD)
+
+# The generation of a (utilization, number of tasks) pair stops at the first run which fails with this rule
+def isGenerationFailed(Result, Tries, FEASIBLE, NOT_FEASIBLE):
+	Feasibility_Ratio = 0
+	if ((FEASIBLE+NOT_FEASIBLE) != 0):
+		Feasibility_Ratio	=	(FEASIBLE/(FEASIBLE+NOT_FEASIBLE))*100
+
+	return (Result == ERROR) or (Tries > DEFAULT_FEASIBLE_TASK_GENERATION_TRIES)\
+	 or (((FEASIBLE+NOT_FEASIBLE) >= DEFAULT_FEASIBLE_TASK_GENERATION_TRIES) and (Feasibility_Ratio < DEFAULT_MIN_REQUIRED_FEASIBILITY))
+
+def getFailedGenerationString(Utilization, Tasks):
+	return "\nError: Failed to Generate Suitable Workload for "+str(Tasks)+" Tasks"+" Utilization:"+str(Utilization*100)+"% = "+str(Utilization*TOTAL_COMPUTING_NODES)
+
+# This creates a set of task set and job set files
+def CreateWorkloadRuns(path, Utilization, FA="NA", workload=0, method=0, UtilizationIndex=0, Manifest=0):
+	# The feasibility report of a sweep is kept when a single run is regenerated
+	fp = openFeasibilityReport(path, FA) if CELL == None else 0
+
+	for Tasks in range(MIN_N, MAX_N+TASK_MULTIPLES, TASK_MULTIPLES):
+		if isCellSelected(workload, method, UtilizationIndex, Tasks) == False:
+			continue
+
+		PROFILE.Open((workload, UTILIZATION_METHOD, Utilization, Tasks))
+
+		printHardCondition(Utilization, Tasks)
+
+		subPath, GraphPath = createTaskCountDirectories(path, Tasks)
 
 		FEASIBLE = 0
 		NOT_FEASIBLE = 0
-		FileName = ""
-		GraphFileName = ""
+		lvSTR = ""
 
-		Run = 0 
-		Feasibility_Ratio = 0
+		Run = 0
 		Tries = 0
+		SeededRun = -1
+		# The feasibility counters at the start of the current run
+		RunFeasible = 0
+		RunNotFeasible = 0
 		while Run < NR_OF_RUNS:
+			if isCellSelected(workload, method, UtilizationIndex, Tasks, Run) == False:
+				Run += 1
+				continue
+
+			Entry = getCompletedRun(workload, method, UtilizationIndex, Tasks, Run)
+			if Entry != None:
+				FEASIBLE += Entry["Feasible"]
+				NOT_FEASIBLE += Entry["NotFeasible"]
+				RunFeasible = FEASIBLE
+				RunNotFeasible = NOT_FEASIBLE
+				Run += 1
+				continue
+
+			# The attempts of a run continue its stream, as in a worker cell
+			if SeededRun != Run:
+				SeedCell(getCellSeed(workload, method, UtilizationIndex, Tasks, Run))
+				SeededRun = Run
+
 			Tries += 1
-			if WANT_HETEROGENEOUS == True:
-				FileName = subPath+"Hetero_Tasks_"+str(Tasks)+"_Run_"+str(Run)+".csv"
-				if WANT_GRAPH:
-					GraphFileName =  GraphPath+"Hetero_Tasks_"+str(Tasks)+"_Run_"+str(Run)+".csv"
-			else:
-				FileName = subPath+"Typed_Tasks_"+str(Tasks)+"_Run_"+str(Run)+".csv"
-				if WANT_GRAPH:
-					GraphFileName =  GraphPath+"Typed_Tasks_"+str(Tasks)+"_Run_"+str(Run)+".csv"
-			
-			Result = createWorkload(Run, Tasks, FileName, Utilization*TOTAL_COMPUTING_NODES, subPath, GraphFileName)
+			FileName, GraphFileName = getRunFileNames(subPath, GraphPath, Tasks, Run)
 
-			if ((FEASIBLE+NOT_FEASIBLE) != 0):
-				Feasibility_Ratio	=	(FEASIBLE/(FEASIBLE+NOT_FEASIBLE))*100
+			Result = createWorkload(Run, Tasks, FileName, Utilization*TOTAL_COMPUTING_NODES, subPath, GraphFileName)
 
-			if (Result == ERROR) or (Tries > DEFAULT_FEASIBLE_TASK_GENERATION_TRIES)\
-			 or (((FEASIBLE+NOT_FEASIBLE) >= DEFAULT_FEASIBLE_TASK_GENERATION_TRIES) and (Feasibility_Ratio < DEFAULT_MIN_REQUIRED_FEASIBILITY)):
-				lvSTR = "\nError: Failed to Generate Suitable Workload for "+str(Tasks)+" Tasks"+" Utilization:"+str(Utilization*100)+"% = "+str(Utilization*TOTAL_COMPUTING_NODES)				
-				print(lvSTR) 
+			if isGenerationFailed(Result, Tries, FEASIBLE, NOT_FEASIBLE) == True:
+				lvSTR = getFailedGenerationString(Utilization, Tasks)
+				print(lvSTR)
 				break
 			elif (Result == False):
 				NOT_FEASIBLE += 1
 			else:
 				FEASIBLE += 1
 
-			if (FEASIBILITY_ANALYSIS == "Heterogeneous_Create_Feasible") or (FEASIBILITY_ANALYSIS == "Homogeneous_Create_Feasible"):
-				if Result == True:
-					Run += 1
-					Tries = 0
-			else: 
+			if ((FEASIBILITY_ANALYSIS != "Heterogeneous_Create_Feasible") and (FEASIBILITY_ANALYSIS != "Homogeneous_Create_Feasible"))\
+			 or (Result == True):
+				writeManifestEntry(Manifest, workload, method, UtilizationIndex, Tasks, Run, FileName, FEASIBLE-RunFeasible, NOT_FEASIBLE-RunNotFeasible)
+				RunFeasible = FEASIBLE
+				RunNotFeasible = NOT_FEASIBLE
 				Run += 1
 				Tries = 0
 
-		if (FEASIBILITY_ANALYSIS != "NA") and ((FEASIBLE+NOT_FEASIBLE) != 0):
-			lvSTR = "\nTasks:"+str(Tasks)+" Utilization:"+str(Utilization*100)+"% = "+str(Utilization*TOTAL_COMPUTING_NODES)+\
-			" Required_TaskSets:"+str(NR_OF_RUNS)+" Generated:"+str(FEASIBLE+NOT_FEASIBLE)+" => FEASIBLE_TASKSETS:"+str(FEASIBLE)+\
-			" NOT_FEASIBLE_TASKSETS:"+str(NOT_FEASIBLE)+" Feasibility_Ratio:"+str(FEASIBLE/(FEASIBLE+NOT_FEASIBLE))+"\n"
+		reportFeasibility(fp, Utilization, Tasks, FEASIBLE, NOT_FEASIBLE, subPath, lvSTR)
+
+	if fp != 0:
+		fp.close()
+
+'''
+With '--workers N' the runs of all (utilization, task count) pairs of a workload are the cells of a process pool.
+The stream of each cell is spawned from the seed of the sweep along its coordinates (SeedSequence spawn keys), in the
+sequential generation as well, so the generated files and the printed output do not depend on the number of workers or on
+the order in which the cells are scheduled, and a single run can be regenerated on its own or a sweep be split into shards.
+Without '--seed S' the sweep draws a new seed, so a repeated sweep generates new task sets.
+'''
+def getCellSeed(workload, method, Utilization, Tasks, Run):
+	return getSeedState(np.random.SeedSequence(SEED, spawn_key=(workload, method, Utilization, Tasks, Run)))
 
-			print(lvSTR)
+# The resources drawn for a workload come out of a stream of their own
+def getWorkloadSeed(workload):
+	return getSeedState(np.random.SeedSequence(SEED, spawn_key=(workload,)))
 
-		if fp != 0:
-			fp.write("RESOURCE_TYPES:%d\n"%RESOURCE_TYPES)
-			for cores in range(0, len(CORES_PER_RESOURCE)):
-				fp.write("CORES_PER_RESOURCE[%d]:%d\n"%(cores+1, CORES_PER_RESOURCE[cores]))
-			fp.write(lvSTR)
-			fp.flush()
+# A seed of 128 bits out of a spawned stream, a single word would let the streams of a large sweep collide
+def getSeedState(Sequence):
+	return int.from_bytes(Sequence.generate_state(SEED_STATE_WORDS, np.uint32).tobytes(), "little")
 
-		if (WANT_TASKSET_FILES == False) and (WANT_JOBSET == False) and (WANT_GRAPH == False):
-			lvCMD = "rm -rf "+subPath
-			run_command(lvCMD)
+def SeedCell(Seed):
+	global RANDOM_SOURCE
+	global UUNIFAST_POOL
+	global RFS_CANDIDATES
 
-	if fp != 0:
-		fp.close()
+	random.seed(Seed)
+	RANDOM_SOURCE = RandomSource(Seed)
+	UUNIFAST_POOL = UUniFastPool(RANDOM_SOURCE)
+	RFS_CANDIDATES = {}
+
+# This checks whether the given (leading) coordinates belong to the cell selected with '--cell', if any
+def isCellSelected(*Coordinates):
+	return (CELL == None) or (CELL[:len(Coordinates)] == Coordinates)
+
+'''
+The manifest records every completed run, one JSON object per line: its coordinates, its seed, the workload resources,
+its task set and job set files and the feasibility of its generated task sets. An entry is only written once all files
+of a run exist, so the runs of an interrupted sweep which are not in the manifest are generated again with '--resume'.
+'''
+def openManifest(FileName):
+	global COMPLETED_RUNS
+
+	fp = 0
+
+	if CELL != None:
+		return fp
+
+	if (RESUME == True) and (os.path.isfile(FileName) == True):
+		COMPLETED_RUNS = readManifest(FileName)
+		print("Resuming Generation... %d Runs Completed"%len(COMPLETED_RUNS))
+
+	try:
+		fp = open(FileName, "a" if RESUME == True else "w")
+	except IOError:
+		if DEBUG == 'e':
+			print ("Opening of File %s failed" % FileName)
+		exit(1)
+
+	# The new entries must not continue an incomplete last line
+	if fp.tell() > 0:
+		with open(FileName, "rb") as lvFile:
+			lvFile.seek(-1, os.SEEK_END)
+			if lvFile.read(1) != b"\n":
+				fp.write("\n")
+
+	return fp
+
+# This returns the seed of the sweep recorded in a manifest, if any
+def getManifestSeed(FileName):
+	if os.path.isfile(FileName) == True:
+		with open(FileName, "r") as fp:
+			for Line in fp:
+				try:
+					return json.loads(Line)["Seed"]
+				except ValueError:
+					continue
+	return None
+
+def readManifest(FileName):
+	Completed = {}
+
+	with open(FileName, "r") as fp:
+		for Line in fp:
+			# The last line is incomplete when the sweep was killed while writing it
+			try:
+				Entry = json.loads(Line)
+			except ValueError:
+				continue
+
+			if Entry["Seed"] != SEED:
+				print("The manifest %s was generated with another --seed.... Exitting Generation"%FileName)
+				exit(1)
+
+			Completed[(Entry["Workload"], Entry["Method"], Entry["Utilization"], Entry["Tasks"], Entry["Run"])] = Entry
+
+	return Completed
+
+# This returns the manifest entry of a completed run or None
+def getCompletedRun(workload, method, Utilization, Tasks, Run):
+	return COMPLETED_RUNS.get((workload, method, Utilization, Tasks, Run))
+
+# The resources of a resumed workload are the ones its completed runs were generated with
+def getCompletedResources(workload):
+	for Coordinates, Entry in COMPLETED_RUNS.items():
+		if Coordinates[0] == workload:
+			return Entry["Resources"]
+	return None
+
+def writeManifestEntry(Manifest, workload, method, Utilization, Tasks, Run, FileName, Feasible, NotFeasible):
+	if Manifest != 0:
+		TaskSetFile = None
+		JobSetFiles = []
+		if WANT_TASKSET_FILES == True:
+			if (WANT_JOBSET == False) or (WANT_TASKJOB_SET == True):
+				TaskSetFile = FileName
+			if WANT_JOBSET == True:
+				JobSetFiles = [JobSetFile for JobSetFile in getJobSetFileNames(FileName) if JobSetFile != None]
+
+		Entry = {"Seed": SEED, "Workload": workload, "Method": method, "Utilization": Utilization, "Tasks": Tasks, "Run": Run,\
+			"CellSeed": getCellSeed(workload, method, Utilization, Tasks, Run), "Resources": CORES_PER_RESOURCE, "File": TaskSetFile, "JobSet": JobSetFiles,\
+			"Feasible": Feasible, "NotFeasible": NotFeasible}
+		Manifest.write(json.dumps(Entry)+"\n")
+		Manifest.flush()
+
+# The worker processes take over the generation settings established by main()
+def getWorkerSettings():
+	return {Name: Value for Name, Value in globals().items() if Name.isupper()}
+
+def initWorker(Settings):
+	globals().update(Settings)
+
+# This generates a single run in a worker process and returns the result, the printed output and the maximum period of each
+# of its attempts, so that the main process can stop at the same attempt as the sequential generation
+def CreateWorkloadCell(Cell):
+	global MAX_PERIOD_GENERATED
+	global PROFILE
+
+	Seed, path, Utilization, Tasks, Run = Cell
+
+	SeedCell(Seed)
+	MAX_PERIOD_GENERATED = 0
+	# The record of the cell is merged into the profile of the main process
+	PROFILE = GenerationProfile()
+	PROFILE.Open(Cell[2:4])
+
+	Results = []
+	Outputs = []
+	MaxPeriods = []
+
+	subPath = path+"Tasks_"+str(Tasks)+"/"
+	GraphPath = path+"Tasks_"+str(Tasks)+"/Visuals/"
+	FileName, GraphFileName = getRunFileNames(subPath, GraphPath, Tasks, Run)
+
+	Tries = 0
+	while True:
+		Tries += 1
+		Output = io.StringIO()
+		with contextlib.redirect_stdout(Output):
+			Result = createWorkload(Run, Tasks, FileName, Utilization*TOTAL_COMPUTING_NODES, subPath, GraphFileName)
+
+		Results.append(Result)
+		Outputs.append(Output.getvalue())
+		MaxPeriods.append(MAX_PERIOD_GENERATED)
+
+		# The feasibility of the other runs of the pair is only known to the main process, which applies the rest of the rule
+		if (Result == ERROR) or (Tries > DEFAULT_FEASIBLE_TASK_GENERATION_TRIES):
+			break
+		elif (FEASIBILITY_ANALYSIS != "Heterogeneous_Create_Feasible") and (FEASIBILITY_ANALYSIS != "Homogeneous_Create_Feasible"):
+			break
+		elif Result == True:
+			break
+
+	return (Results, Outputs, MaxPeriods, PROFILE.Record)
+
+# This goes through the attempts of a cell as CreateWorkloadRuns() does and returns whether the run failed, the feasibility
+# counters of its pair after it and the maximum period generated up to its last counted attempt
+def replayWorkloadCell(Results, Outputs, MaxPeriods, FEASIBLE, NOT_FEASIBLE):
+	MaxPeriod = 0
+	for Attempt in range(0, len(Results)):
+		print(Outputs[Attempt], end="")
+		MaxPeriod = MaxPeriods[Attempt]
+
+		if isGenerationFailed(Results[Attempt], Attempt+1, FEASIBLE, NOT_FEASIBLE) == True:
+			return True, FEASIBLE, NOT_FEASIBLE, MaxPeriod
+		elif Results[Attempt] == False:
+			NOT_FEASIBLE += 1
+		else:
+			FEASIBLE += 1
+
+	return False, FEASIBLE, NOT_FEASIBLE, MaxPeriod
+
+# The files of a run which the sequential generation would not have generated are removed
+def removeRunFiles(subPath, Tasks, Run):
+	FileName, GraphFileName = getRunFileNames(subPath, subPath+"Visuals/", Tasks, Run)
+	lvFileName = FileName.split('.')[0]
+	RunFiles = glob.glob(glob.escape(lvFileName)+".*")+glob.glob(glob.escape(lvFileName)+"_*")
+	RunFiles += glob.glob(glob.escape(subPath+"NOT_FEASIBLE_WORKLOAD/"+os.path.basename(lvFileName))+"_*")
+	if GraphFileName != "":
+		RunFiles += glob.glob(glob.escape(GraphFileName.split('.')[0])+"_*")
+
+	for RunFile in RunFiles:
+		os.remove(RunFile)
+
+# This creates the task sets of all utilization points of a workload with a pool of WORKERS processes
+def CreateWorkloadRuns_in_Pool(workload, method, SubPaths, FA="NA", Manifest=0):
+	global MAX_PERIOD_GENERATED
+
+	Cells = []
+	for Utilization in range(0, len(UTILIZATION_VECTOR)):
+		for Tasks in range(MIN_N, MAX_N+TASK_MULTIPLES, TASK_MULTIPLES):
+			if isCellSelected(workload, method, Utilization, Tasks) == False:
+				continue
+			createTaskCountDirectories(SubPaths[Utilization], Tasks)
+			for Run in range(0, NR_OF_RUNS):
+				if (isCellSelected(workload, method, Utilization, Tasks, Run) == True) and (getCompletedRun(workload, method, Utilization, Tasks, Run) == None):
+					Cells.append((getCellSeed(workload, method, Utilization, Tasks, Run), SubPaths[Utilization], UTILIZATION_VECTOR[Utilization], Tasks, Run))
+
+	with multiprocessing.Pool(WORKERS, initializer=initWorker, initargs=(getWorkerSettings(),)) as Pool:
+		# The results arrive in the order of the cells, so the statistics are aggregated as in the sequential generation
+		Results = Pool.imap(CreateWorkloadCell, Cells)
+
+		for Utilization in range(0, len(UTILIZATION_VECTOR)):
+			if isCellSelected(workload, method, Utilization) == False:
+				continue
+
+			fp = openFeasibilityReport(SubPaths[Utilization], FA) if CELL == None else 0
+
+			for Tasks in range(MIN_N, MAX_N+TASK_MULTIPLES, TASK_MULTIPLES):
+				if isCellSelected(workload, method, Utilization, Tasks) == False:
+					continue
+
+				printHardCondition(UTILIZATION_VECTOR[Utilization], Tasks)
+
+				subPath = SubPaths[Utilization]+"Tasks_"+str(Tasks)+"/"
+
+				FEASIBLE = 0
+				NOT_FEASIBLE = 0
+				lvSTR = ""
+				Failed = False
+
+				for Run in range(0, NR_OF_RUNS):
+					if isCellSelected(workload, method, Utilization, Tasks, Run) == False:
+						continue
+
+					Entry = getCompletedRun(workload, method, Utilization, Tasks, Run)
+					if Entry != None:
+						if Failed == False:
+							FEASIBLE += Entry["Feasible"]
+							NOT_FEASIBLE += Entry["NotFeasible"]
+						continue
+
+					lvResults, lvOutputs, lvMaxPeriods, Record = next(Results)
+
+					# As in the sequential generation, the runs after a failed run of the pair are not generated
+					if Failed == True:
+						removeRunFiles(subPath, Tasks, Run)
+						continue
+
+					PROFILE.Merge((workload, UTILIZATION_METHOD, UTILIZATION_VECTOR[Utilization], Tasks), Record)
+					lvFeasible, lvNotFeasible = FEASIBLE, NOT_FEASIBLE
+					Failed, FEASIBLE, NOT_FEASIBLE, lvMaxPeriod = replayWorkloadCell(lvResults, lvOutputs, lvMaxPeriods, FEASIBLE, NOT_FEASIBLE)
+
+					if MAX_PERIOD_GENERATED < lvMaxPeriod:
+						MAX_PERIOD_GENERATED = lvMaxPeriod
+
+					if Failed == True:
+						lvSTR = getFailedGenerationString(UTILIZATION_VECTOR[Utilization], Tasks)
+						print(lvSTR)
+					else:
+						FileName, GraphFileName = getRunFileNames(subPath, "", Tasks, Run)
+						writeManifestEntry(Manifest, workload, method, Utilization, Tasks, Run, FileName, FEASIBLE-lvFeasible, NOT_FEASIBLE-lvNotFeasible)
+
+				reportFeasibility(fp, UTILIZATION_VECTOR[Utilization], Tasks, FEASIBLE, NOT_FEASIBLE, subPath, lvSTR)
+
+			if fp != 0:
+				fp.close()
+
+			if (WANT_TASKSET_FILES == False) and (FEASIBILITY_ANALYSIS == "NA") and (WANT_GRAPH == False):
+				lvCMD = "rm -rf "+SubPaths[Utilization]
+				run_command(lvCMD)
 
 # Main of the script
 def main():
@@ -2520,6 +3056,7 @@ def main():
 	global WANT_TASKSET_FILES
 	global UTILIZATION_METHOD
 	global WANT_TASKJOB_SET
+	global WANT_BINARY_JOBSET
 	global CONVERT_TO_NFJ_DAG
 	global FEASIBILITY_ANALYSIS
 	global SCHEDULABILITY_TEST_PATH
@@ -2530,7 +3067,7 @@ def main():
 	global MIN_PERIOD
 	global MAX_PERIOD
 	global PRIORITY_POLICY
-	global MULTI_THREADING
+	global WORKERS
 	global EQUAL_DEADLINE_TASKS_GENERATION
 	global EQUAL_PRIORITY_TASKS_GENERATION
 	global RESOURCE_TYPES
@@ -2539,6 +3076,11 @@ def main():
 	global WANT_ALL_RSC_TYPE_NODES
 	global WANT_MORE_SIBLINGS
 	global NON_NESTED_FORK_JOIN
+	global CONSTRUCTIVE_GENERATION
+	global DAG_SHAPE
+	global SEED
+	global CELL
+	global RESUME
 
 	opts = parse_args()
 	
@@ -2557,6 +3099,8 @@ def main():
 	elif(opts.job_set == 'Z' or opts.job_set == 'z'):
 		WANT_TASKJOB_SET = True
 		WANT_JOBSET = True
+	if(opts.job_set_binary == 'Y' or opts.job_set_binary == 'y'):
+		WANT_BINARY_JOBSET = True
 	if(opts.taskset_files == 'Y' or opts.taskset_files == 'y'):
 		WANT_TASKSET_FILES = True  
 	if(opts.nfj_dag=='F' or opts.nfj_dag=='f'):
@@ -2566,7 +3110,9 @@ def main():
 	if(opts.period_conditioning == 'Y' or opts.period_conditioning == 'y'):
 		PERIOD_CONDITIONING = True
 	if(opts.multi_threading == 'Y' or opts.multi_threading == 'y'):
-		MULTI_THREADING = True
+		WORKERS = os.cpu_count()
+	if opts.workers > 0:
+		WORKERS = opts.workers
 	if(opts.equal_deadline_tasks == 'N' or opts.equal_deadline_tasks == 'n'):
 		EQUAL_DEADLINE_TASKS_GENERATION = False
 	if(opts.equal_priority_tasks == 'Y' or opts.equal_priority_tasks == 'y'):
@@ -2581,6 +3127,27 @@ def main():
 	WANT_ALL_RSC_TYPE_NODES			= opts.rsc
 	WANT_MORE_SIBLINGS				= opts.sibl
 	NON_NESTED_FORK_JOIN			= opts.nnfj
+	CONSTRUCTIVE_GENERATION			= (opts.constructive == True)
+	DAG_SHAPE 						= opts.shape.upper()
+	SEED 							= opts.seed
+	RESUME 							= (opts.resume == True)
+
+	if DAG_SHAPE not in DAG_SHAPES:
+		print("Unknown DAG shape %s, choose one of %s.... Exitting Generation"%(opts.shape, ", ".join(DAG_SHAPES)))
+		exit(1)
+
+	if opts.cell != None:
+		if SEED == None:
+			print("A run can only be regenerated with the --seed of its sweep, see the manifest.... Exitting Generation")
+			exit(1)
+		CELL = tuple(int(Coordinate) for Coordinate in opts.cell.split(','))
+
+	# Without '--seed' the sweep draws its own seed, a resumed sweep continues with the one of its manifest
+	if (SEED == None) and (RESUME == True):
+		SEED = getManifestSeed(opts.parent_folder+"Manifest.jsonl")
+	if SEED == None:
+		SEED = int(np.random.SeedSequence().entropy)
+	print("SEED:%d"%SEED)
 
 	UTILIZATION_METHOD = opts.util_method
 
@@ -2593,6 +3160,7 @@ def main():
 		UTILIZATION_METHODS_USED.append(UTILIZATION_METHOD)
 
 	ExtractParameters(opts.Settings)
+	UpdateChoiceTables()
 
 	for Task in range(0, MAX_N):
 		PRIORITY_ARRAY.append(Task)
@@ -2636,8 +3204,15 @@ def main():
 		else:			
 			print("Creating Feasible Task Sets Only via %s"%FEASIBILITY_ANALYSIS)
 	
+	Manifest = openManifest(opts.parent_folder+"Manifest.jsonl")
+
 	for workload in range(0, NR_OF_WORKLOADS):
 
+		# The resources of a workload must not depend on the workloads generated before it
+		if isCellSelected(workload) == False:
+			continue
+		SeedCell(getWorkloadSeed(workload))
+
 		if RESOURCE_RANGE_MAX != 0:
 			TOTAL_COMPUTING_NODES = 0
 			CORES_PER_RESOURCE.clear()
@@ -2645,8 +3220,19 @@ def main():
 			for RSC in range(0, RESOURCE_TYPES):
 				CORES_PER_RESOURCE.append(int(getRandomInteger(CORES_RANGE_MIN, CORES_RANGE_MAX)))
 				TOTAL_COMPUTING_NODES += CORES_PER_RESOURCE[RSC]
+			UpdateChoiceTables()
+
+		Resources = getCompletedResources(workload)
+		if (RESOURCE_RANGE_MAX != 0) and (Resources != None):
+			CORES_PER_RESOURCE = list(Resources)
+			RESOURCE_TYPES = len(CORES_PER_RESOURCE)
+			TOTAL_COMPUTING_NODES = sum(CORES_PER_RESOURCE)
+			UpdateChoiceTables()
 
 		for method in range(0, len(UTILIZATION_METHODS_USED)):
+			if isCellSelected(workload, method) == False:
+				continue
+
 			UTILIZATION_METHOD = UTILIZATION_METHODS_USED[method]
 			path = opts.parent_folder+str(workload+1)+"_"+UTILIZATION_METHOD+"_Workload/"
 			
@@ -2665,13 +3251,17 @@ def main():
 
 			Result = True
 
-			Workloadthreads = []
+			SubPaths = []
 			for Utilization in range(0, len(UTILIZATION_VECTOR)):
 
 				if WANT_HETEROGENEOUS == True:
 					sub_path = path+"HeteroDAGTasks_Util_"+str(int(UTILIZATION_VECTOR[Utilization]*100))+"/"
 				else:
 					sub_path = path+"TypedDAGTasks_Util_"+str(int(UTILIZATION_VECTOR[Utilization]*100))+"/"
+
+				if isCellSelected(workload, method, Utilization) == False:
+					SubPaths.append(sub_path)
+					continue
 				# define the name of the directory to be created
 				try:
 					os.mkdir(sub_path)
@@ -2681,24 +3271,26 @@ def main():
 							print ("Creation of the directory %s failed" % sub_path)
 						exit(1)
 
-				if MULTI_THREADING:
-					try:
-						Workloadthreads.append(myThread(sub_path, UTILIZATION_VECTOR[Utilization], FEASIBILITY_ANALYSIS))
-						Workloadthreads[Utilization].start()
-					except:
-						if DEBUG == 'e':
-							print("Error: unable to start thread")
-				else:
-					CreateWorkloadRuns(sub_path, UTILIZATION_VECTOR[Utilization], FEASIBILITY_ANALYSIS)
+				if WORKERS > 0:
+					SubPaths.append(sub_path)
+					continue
+
+				CreateWorkloadRuns(sub_path, UTILIZATION_VECTOR[Utilization], FEASIBILITY_ANALYSIS, workload, method, Utilization, Manifest)
 
 				if (WANT_TASKSET_FILES == False) and (FEASIBILITY_ANALYSIS == "NA") and (WANT_GRAPH == False):
 					lvCMD = "rm -rf "+sub_path 
 					run_command(lvCMD)
 
-			if MULTI_THREADING:
-				for Utilization in range(0, len(UTILIZATION_VECTOR)):
-					Workloadthreads[Utilization].join()
-				print("Maximum Period Generated through all DAG Task Generations:%d"%MAX_PERIOD_GENERATED)
+			if WORKERS > 0:
+				CreateWorkloadRuns_in_Pool(workload, method, SubPaths, FEASIBILITY_ANALYSIS, Manifest)
+
+			print("Maximum Period Generated through all DAG Task Generations:%d"%MAX_PERIOD_GENERATED)
+
+	if Manifest != 0:
+		Manifest.close()
+
+	if opts.profile_out != None:
+		PROFILE.Write(opts.profile_out, ("Workload", "Method", "Utilization", "Tasks"))
 	
 if __name__ == '__main__': 
 	main()
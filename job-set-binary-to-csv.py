@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+
+import argparse
+
+from dag_tasks_to_jobs import job_set_binary_to_csv, STREAM_BUFFER_ROWS
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Convert a binary job set file back to the job set + edge list CSV files of nptest")
+
+    parser.add_argument('binary_file', metavar = 'JOBS-BIN-FILE',
+        help='the binary job set file')
+
+    parser.add_argument('jobs_file', metavar = 'JOBS-CSV-FILE',
+        help='where to store all jobs')
+
+    parser.add_argument('edges_file', metavar = 'EDGES-CSV-FILE',
+        help='where to store all edges')
+
+    parser.add_argument('-b', '--buffer-rows', dest='buffer_rows', default=STREAM_BUFFER_ROWS,
+                        action='store', type=int,
+                        help='number of rows written at once')
+
+    return parser.parse_args()
+
+def main():
+    opts = parse_args()
+
+    job_set_binary_to_csv(opts.binary_file, opts.jobs_file, opts.edges_file, opts.buffer_rows)
+
+if __name__ == '__main__':
+    main()